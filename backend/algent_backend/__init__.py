@@ -3,6 +3,20 @@ Algent backend package.
 
 Houses the core agent ecosystem (`agent_system`), pluggable labs (`labs`), API
 surface, commands, and config machinery.
+
+Subpackages are imported on first attribute access so `algent_backend.app` can
+start serving `/health` without paying for the agent stack or any lab.
 """
+from importlib import import_module
+
+_SUBPACKAGES = ("agent_system", "labs")
+
+
+def __getattr__(name: str):
+    if name in _SUBPACKAGES:
+        return import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-from . import agent_system, labs  # noqa: F401
+def __dir__():
+    return sorted(list(globals()) + list(_SUBPACKAGES))
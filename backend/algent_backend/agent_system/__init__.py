@@ -3,8 +3,27 @@ Agent system package.
 
 This umbrella houses the core infrastructure that powers every lab or work
 vector: agent loops, model providers, tool bridges, and orchestration helpers.
+Submodules load lazily on first attribute access.
 """
+from importlib import import_module
 
-from .foundation import agents, models, prompting  # noqa: F401
-from .integration import tool_registry  # noqa: F401
-from .orchestration import orchestrator  # noqa: F401
+_SUBMODULES = {
+    "agents": ".foundation.agents",
+    "models": ".foundation.models",
+    "prompting": ".foundation.prompting",
+    "tool_registry": ".integration.tool_registry",
+    "orchestrator": ".orchestration.orchestrator",
+}
+
+
+def __getattr__(name: str):
+    path = _SUBMODULES.get(name)
+    if path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = import_module(path, __name__)
+    globals()[name] = module
+    return module
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_SUBMODULES))
@@ -2,17 +2,27 @@
 Base agent loop orchestrator.
 
 This is intentionally minimal; specific strategies (ReAct, debate, trees) will
-be implemented under `loops/`.
+be implemented under `loops/`. Hooks may be plain functions or coroutine
+functions; `arun` awaits the latter and runs the former in a worker thread.
+`run` drives coroutine hooks with `asyncio.run`, so it must not be called from
+inside a running event loop when such hooks are present; use `arun` there.
+Both entry points stop between hooks once the current `CancelScope` is
+cancelled or past its deadline.
 """
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
-from typing import Callable, List, Optional
+import inspect
+from typing import Awaitable, Callable, List, Optional
 
+from algent_backend.telemetry import span
+
+from ..cancellation import current_scope
 from .state_manager import ConversationState
 
 
-LoopHook = Callable[[ConversationState], None]
+LoopHook = Callable[[ConversationState], None | Awaitable[None]]
 
 
 @dataclass
@@ -29,8 +39,58 @@ class AgentLoop:
     def run(self, state: Optional[ConversationState] = None) -> ConversationState:
         """Execute one loop iteration (placeholder)."""
         state = state or ConversationState()
-        state.log(f"Loop {self.name} start")
-        for hook in self.hooks:
-            hook(state)
-        state.log(f"Loop {self.name} end")
+        with span("agent_loop.run", loop=self.name):
+            state.log(f"Loop {self.name} start")
+            for hook in self.hooks:
+                _checkpoint()
+                with span("agent_loop.hook", loop=self.name, hook=_hook_name(hook)):
+                    result = hook(state)
+                    if inspect.isawaitable(result):
+                        _run_to_completion(result, self.name)
+            state.log(f"Loop {self.name} end")
+        return state
+
+    async def arun(self, state: Optional[ConversationState] = None) -> ConversationState:
+        """Async `run`: cancelling the awaiting task cancels in-flight provider calls."""
+        state = state or ConversationState()
+        with span("agent_loop.run", loop=self.name):
+            state.log(f"Loop {self.name} start")
+            for hook in self.hooks:
+                _checkpoint()
+                with span("agent_loop.hook", loop=self.name, hook=_hook_name(hook)):
+                    if inspect.iscoroutinefunction(hook):
+                        await hook(state)
+                    else:
+                        result = await asyncio.to_thread(hook, state)
+                        if inspect.isawaitable(result):
+                            await result
+            state.log(f"Loop {self.name} end")
         return state
+
+
+def _hook_name(hook: LoopHook) -> str:
+    return getattr(hook, "__qualname__", None) or type(hook).__name__
+
+
+def _checkpoint() -> None:
+    scope = current_scope()
+    if scope is not None:
+        scope.raise_if_cancelled()
+
+
+async def _awaited(awaitable: Awaitable[None]) -> None:
+    await awaitable
+
+
+def _run_to_completion(awaitable: Awaitable[None], loop_name: str) -> None:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(_awaited(awaitable))
+        return
+    if inspect.iscoroutine(awaitable):
+        awaitable.close()  # never awaited; avoid the "was never awaited" warning
+    raise RuntimeError(
+        f"Loop {loop_name}: a hook returned an awaitable while an event loop is running; "
+        "call `await loop.arun(state)` instead of `loop.run(state)`"
+    )
@@ -3,16 +3,31 @@ Prototype ReAct-style loop.
 
 The real implementation will coordinate planning, tool usage, and reflection.
 """
+from algent_backend.telemetry import span
+
 from ..agent_loop import AgentLoop
 from ..state_manager import ConversationState
 
 
+REACT_STEPS = ("observe", "think", "act")
+
+
 class ReactLoop(AgentLoop):
     """Concrete loop that simply annotates its steps for now."""
 
     def run(self, state: ConversationState | None = None) -> ConversationState:
         state = state or ConversationState()
-        state.log("ReAct loop step: observe")
-        state.log("ReAct loop step: think")
-        state.log("ReAct loop step: act")
-        return super().run(state)
+        with span("react_loop.run", loop=self.name):
+            self._steps(state)
+            return super().run(state)
+
+    async def arun(self, state: ConversationState | None = None) -> ConversationState:
+        state = state or ConversationState()
+        with span("react_loop.run", loop=self.name):
+            self._steps(state)
+            return await super().arun(state)
+
+    def _steps(self, state: ConversationState) -> None:
+        for step in REACT_STEPS:
+            with span("react_loop.step", loop=self.name, step=step):
+                state.log(f"ReAct loop step: {step}")
@@ -2,18 +2,144 @@
 Conversation and state helpers.
 
 The state manager coordinates memories, scratchpads, and summaries for loops.
+
+`ConversationState` keeps a rolling window of recent turns within a token
+budget. Token counts are approximate (about four characters per token) and
+maintained incrementally, so nothing rescans the history. When the window
+overflows, the oldest turns are folded into a running summary by a pluggable
+`Summarizer` and archived as zlib-compressed blocks. Rendering the next prompt
+context therefore costs O(window), however long the loop has been running.
+
+The default summary is clipped to a quarter of the budget, so folding always
+frees room for a batch of new turns and the rendered context stays within the
+budget (a single turn larger than the budget is still kept whole).
 """
-from dataclasses import dataclass, field
-from typing import List
+from __future__ import annotations
+
+from collections import deque
+from typing import Callable, Deque, Iterable, Iterator, List, Tuple
+import zlib
+
+
+DEFAULT_TOKEN_BUDGET = 8_000
+SUMMARY_BUDGET_FRACTION = 4  # default summary cap: token_budget // 4
+ARCHIVE_BLOCK_TURNS = 64
+
+Summarizer = Callable[[List[str], "str | None"], str]
+"""Fold `turns` (oldest first) into the previous summary (None at first) and return the new one."""
+
+_SEPARATOR = "\x1e"  # ASCII record separator between archived turns
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token); never below one."""
+    return max(1, (len(text) + 3) // 4)
+
+
+def truncating_summarizer(max_tokens: int) -> Summarizer:
+    """
+    Default summarizer: keeps the first line of each folded turn, newest last,
+    clipped to `max_tokens`. Swap in a model-backed summarizer for real runs;
+    it should likewise stay well under the state's token budget.
+    """
+    max_chars = max_tokens * 4
+
+    def summarize(turns: List[str], previous: str | None) -> str:
+        lines = [previous] if previous else []
+        lines.extend(turn.splitlines()[0] if turn else "" for turn in turns)
+        summary = "\n".join(lines)
+        return summary[-max_chars:] if len(summary) > max_chars else summary
+
+    return summarize
 
 
-@dataclass
 class ConversationState:
-    """In-memory log of loop turns."""
+    """
+    Token-budgeted log of loop turns.
+
+    `messages` is the live window (oldest first) as a read-only tuple; append
+    with `log()`, which keeps the token accounting right. `summary` covers
+    everything folded out of the window and `history()` replays every turn.
+    """
+
+    def __init__(
+        self,
+        messages: Iterable[str] = (),
+        token_budget: int = DEFAULT_TOKEN_BUDGET,
+        summarizer: Summarizer | None = None,
+    ) -> None:
+        if token_budget < 1:
+            raise ValueError("token_budget must be >= 1")
+        self.token_budget = token_budget
+        self.summarizer = summarizer or truncating_summarizer(max(1, token_budget // SUMMARY_BUDGET_FRACTION))
+        self.summary: str | None = None
+        self.summary_tokens = 0
+        self.window_tokens = 0
+        self.total_turns = 0
+        self._window: Deque[Tuple[str, int]] = deque()
+        self._archive: List[bytes] = []
+        self._archive_pending: List[str] = []
+        for message in messages:
+            self.log(message)
 
-    messages: List[str] = field(default_factory=list)
+    def __repr__(self) -> str:
+        return (
+            f"ConversationState(turns={self.total_turns}, window={len(self._window)}, "
+            f"tokens={self.token_count}/{self.token_budget})"
+        )
+
+    @property
+    def messages(self) -> Tuple[str, ...]:
+        return tuple(text for text, _ in self._window)
+
+    @property
+    def token_count(self) -> int:
+        """Approximate tokens of the rendered context (summary plus window)."""
+        return self.summary_tokens + self.window_tokens
 
     def log(self, message: str) -> None:
-        """Append a message to the state."""
-        self.messages.append(message)
+        """Append a message to the state, folding old turns if over budget."""
+        tokens = estimate_tokens(message)
+        self._window.append((message, tokens))
+        self.window_tokens += tokens
+        self.total_turns += 1
+        if self.token_count > self.token_budget:
+            self._fold()
+
+    def render(self, separator: str = "\n") -> str:
+        """Prompt context for the next call: summary (if any) then the window."""
+        parts = [f"Summary of earlier turns:\n{self.summary}"] if self.summary else []
+        parts.extend(text for text, _ in self._window)
+        return separator.join(parts)
+
+    def history(self) -> Iterator[str]:
+        """Every turn logged so far, oldest first (decompresses the archive)."""
+        for block in self._archive:
+            yield from zlib.decompress(block).decode("utf-8").split(_SEPARATOR)
+        yield from self._archive_pending
+        for text, _ in self._window:
+            yield text
+
+    def _fold(self) -> None:
+        # Evict down to 3/4 of the budget so the summarizer runs per batch of
+        # turns rather than on every log call.
+        target = self.token_budget * 3 // 4
+        folded: List[str] = []
+        while len(self._window) > 1 and self.summary_tokens + self.window_tokens > target:
+            text, tokens = self._window.popleft()
+            self.window_tokens -= tokens
+            folded.append(text)
+        if not folded:
+            return
+        self._archive_turns(folded)
+        self.summary = self.summarizer(folded, self.summary)
+        self.summary_tokens = estimate_tokens(self.summary) if self.summary else 0
 
+    def _archive_turns(self, turns: List[str]) -> None:
+        self._archive_pending.extend(turns)
+        while len(self._archive_pending) >= ARCHIVE_BLOCK_TURNS:
+            block, self._archive_pending = (
+                self._archive_pending[:ARCHIVE_BLOCK_TURNS],
+                self._archive_pending[ARCHIVE_BLOCK_TURNS:],
+            )
+            self._archive.append(zlib.compress(_SEPARATOR.join(block).encode("utf-8")))
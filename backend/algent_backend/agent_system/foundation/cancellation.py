@@ -0,0 +1,97 @@
+"""
+Cooperative cancellation and deadlines for agent loops.
+
+A `CancelScope` is made current (via a context variable) while a loop runs.
+Blocking provider calls (`AsyncTransport.run_sync`) and `AgentLoop.run` between
+hooks consult it, so cancelling the scope or passing its deadline aborts an
+in-flight model request instead of waiting for it. Context variables follow
+`asyncio.to_thread` and tasks, so async loops get the same behaviour.
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+import threading
+import time
+from typing import Callable, Iterator, List
+
+
+class LoopCancelled(Exception):
+    """The current cancel scope was cancelled."""
+
+
+class DeadlineExceeded(LoopCancelled):
+    """The current cancel scope's deadline passed."""
+
+
+class CancelScope:
+    """Cancellation flag plus optional deadline shared by one loop's work."""
+
+    def __init__(self, timeout: float | None = None) -> None:
+        self._event = threading.Event()
+        self._callbacks: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+        self.deadline: float | None = None
+        self.start(timeout)
+
+    def start(self, timeout: float | None) -> None:
+        """(Re)arm the deadline `timeout` seconds from now (None for no deadline)."""
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    @property
+    def expired(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def remaining(self) -> float | None:
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled:
+            raise LoopCancelled("cancelled")
+        if self.expired:
+            raise DeadlineExceeded("deadline exceeded")
+
+    @contextmanager
+    def on_cancel(self, callback: Callable[[], None]) -> Iterator[None]:
+        """Invoke `callback` if the scope is cancelled while the block runs."""
+        with self._lock:
+            fire = self._event.is_set()
+            if not fire:
+                self._callbacks.append(callback)
+        if fire:
+            callback()
+        try:
+            yield
+        finally:
+            with self._lock:
+                if callback in self._callbacks:
+                    self._callbacks.remove(callback)
+
+    @contextmanager
+    def activate(self) -> Iterator["CancelScope"]:
+        """Make this the current scope for the enclosed block."""
+        token = _CURRENT.set(self)
+        try:
+            yield self
+        finally:
+            _CURRENT.reset(token)
+
+
+_CURRENT: ContextVar[CancelScope | None] = ContextVar("algent_cancel_scope", default=None)
+
+
+def current_scope() -> CancelScope | None:
+    return _CURRENT.get()
@@ -2,4 +2,8 @@
 Model provider registry and abstractions.
 """
 
+from .batching import MicroBatcher  # noqa: F401
 from .model_registry import ModelRegistry  # noqa: F401
+from .routing import BackendStats, Router  # noqa: F401
+from .response_cache import ResponseCache, get_response_cache  # noqa: F401
+from .transport import AsyncTransport, RetryPolicy, TransportError, get_transport  # noqa: F401
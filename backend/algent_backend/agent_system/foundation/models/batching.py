@@ -0,0 +1,157 @@
+"""
+Micro-batching of concurrent requests to one provider.
+
+When many loops hit the same provider, `MicroBatcher` gathers requests that
+arrive within `window` seconds (up to `max_batch`) and submits them together:
+through the provider's `agenerate_batch(items)` if it defines one, otherwise as
+a fan-out capped at `max_concurrency` concurrent `agenerate` calls. Each caller
+gets its own response (or exception) back.
+
+An idle batcher dispatches immediately, so a lone request never waits for the
+window; batching only kicks in while earlier requests are still in flight.
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import threading
+from typing import Any, Dict, List, Sequence, Tuple
+import weakref
+
+from algent_backend.telemetry import REGISTRY
+
+from .providers.base_provider import BaseModelProvider, ModelResponse
+
+
+DEFAULT_WINDOW = 0.005
+DEFAULT_MAX_BATCH = 16
+DEFAULT_MAX_CONCURRENCY = 8
+
+_BATCH_SIZE = REGISTRY.histogram(
+    "algent_model_batch_size",
+    "Requests per dispatched micro-batch, by provider.",
+    ("provider",),
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128),
+)
+
+BatchItem = Tuple[str, Dict[str, Any]]  # (prompt, generation kwargs)
+
+
+@dataclass
+class _Pending:
+    prompt: str
+    kwargs: Dict[str, Any]
+    future: "asyncio.Future[ModelResponse]"
+
+
+@dataclass
+class _LoopBatches:
+    fanout: asyncio.Semaphore
+    pending: List[_Pending] = field(default_factory=list)
+    timer: asyncio.TimerHandle | None = None
+    inflight: int = 0
+    tasks: set = field(default_factory=set)  # strong refs so running batches aren't collected
+
+
+class MicroBatcher:
+    """Drop-in `generate`/`agenerate` front end that batches concurrent calls."""
+
+    def __init__(
+        self,
+        provider: BaseModelProvider,
+        window: float = DEFAULT_WINDOW,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        if max_batch < 1 or max_concurrency < 1:
+            raise ValueError("max_batch and max_concurrency must be >= 1")
+        self.provider = provider
+        self.window = window
+        self.max_batch = max_batch
+        self.max_concurrency = max_concurrency
+        self._states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopBatches]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return self.provider.name
+
+    def generate(self, prompt: str, **kwargs) -> ModelResponse:
+        """Blocking variant; batches with other callers on the transport's loop."""
+        return self.provider.transport.run_sync(self.agenerate(prompt, **kwargs))
+
+    async def agenerate(self, prompt: str, **kwargs) -> ModelResponse:
+        loop = asyncio.get_running_loop()
+        state = self._state(loop)
+        future: "asyncio.Future[ModelResponse]" = loop.create_future()
+        state.pending.append(_Pending(prompt, kwargs, future))
+        if state.inflight == 0 or len(state.pending) >= self.max_batch:
+            self._flush(state)
+        elif state.timer is None:
+            state.timer = loop.call_later(self.window, self._flush, state)
+        return await future
+
+    def _state(self, loop: asyncio.AbstractEventLoop) -> _LoopBatches:
+        with self._lock:
+            state = self._states.get(loop)
+            if state is None:
+                state = self._states[loop] = _LoopBatches(fanout=asyncio.Semaphore(self.max_concurrency))
+            return state
+
+    def _flush(self, state: _LoopBatches) -> None:
+        if state.timer is not None:
+            state.timer.cancel()
+            state.timer = None
+        while state.pending:
+            batch, state.pending = state.pending[: self.max_batch], state.pending[self.max_batch :]
+            state.inflight += 1
+            task = asyncio.get_running_loop().create_task(self._run(state, batch))
+            state.tasks.add(task)
+            task.add_done_callback(state.tasks.discard)
+
+    async def _run(self, state: _LoopBatches, batch: List[_Pending]) -> None:
+        _BATCH_SIZE.labels(self.name).observe(len(batch))
+        try:
+            batch_call = getattr(self.provider, "agenerate_batch", None)
+            if callable(batch_call) and len(batch) > 1:
+                await self._run_batch(batch_call, batch)
+            else:
+                await asyncio.gather(*(self._run_one(state, item) for item in batch))
+        finally:
+            state.inflight -= 1
+            if state.inflight == 0 and state.pending:
+                self._flush(state)
+
+    async def _run_batch(self, batch_call, batch: List[_Pending]) -> None:
+        items: Sequence[BatchItem] = [(item.prompt, item.kwargs) for item in batch]
+        try:
+            results = list(await batch_call(items))
+        except Exception as exc:
+            results = [exc] * len(batch)
+        if len(results) != len(batch):
+            # Results are matched to callers by position; a short or long reply
+            # cannot be attributed, so no caller is left waiting on a guess.
+            error = RuntimeError(
+                f"{self.name}: agenerate_batch returned {len(results)} results for {len(batch)} requests"
+            )
+            results = [error] * len(batch)
+        for item, result in zip(batch, results):
+            if item.future.done():
+                continue  # caller gave up
+            if isinstance(result, BaseException):
+                item.future.set_exception(result)
+            else:
+                item.future.set_result(result)
+
+    async def _run_one(self, state: _LoopBatches, item: _Pending) -> None:
+        async with state.fanout:
+            if item.future.done():
+                return
+            try:
+                result = await self.provider.agenerate(item.prompt, **item.kwargs)
+            except Exception as exc:
+                if not item.future.done():
+                    item.future.set_exception(exc)
+            else:
+                if not item.future.done():
+                    item.future.set_result(result)
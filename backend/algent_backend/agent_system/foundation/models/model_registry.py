@@ -2,42 +2,155 @@
 Registry for model providers.
 
 Allows swapping OpenAI/HuggingFace/custom providers without touching loops.
+Providers can be registered as classes or as `"package.module:ClassName"`
+import paths; path entries are imported the first time they are created, so
+the built-ins cost nothing until used. Providers created here share the
+registry's `ResponseCache` (the persistent process-wide one by default).
+
+`create` reuses one provider instance per name, kwargs and current API key, so
+config is resolved once yet a key stored later (e.g. through `/credentials`)
+takes effect on the next `create`. `batcher(name)` returns a shared
+`MicroBatcher` for the current provider instance, so loops that run
+concurrently against it have their requests batched together.
+
+`add_route(logical, backends)` plus `generate(logical, ...)`/`agenerate` send a
+logical model request to the fastest healthy backend, optionally hedged (see
+`routing.py`).
 """
 from __future__ import annotations
 
-from typing import Dict, Type
+from importlib import import_module
+import threading
+from typing import Any, Dict, Optional, Sequence, Tuple, Type
+
+from algent_backend.config import get_provider_api_key
+
+from .batching import MicroBatcher
+from .providers import BaseModelProvider, ModelResponse
+from .response_cache import ResponseCache, get_response_cache
+from .routing import Backend, Route, Router
 
-from .providers import (
-    AnthropicProvider,
-    BaseModelProvider,
-    GeminiProvider,
-    OpenAIProvider,
-    XAIProvider,
-)
+_PROVIDERS_PACKAGE = f"{__package__}.providers"
+
+BUILTIN_PROVIDERS: Dict[str, str] = {
+    "openai": f"{_PROVIDERS_PACKAGE}.openai_provider:OpenAIProvider",
+    "anthropic": f"{_PROVIDERS_PACKAGE}.anthropic_provider:AnthropicProvider",
+    "gemini": f"{_PROVIDERS_PACKAGE}.gemini_provider:GeminiProvider",
+    "xai": f"{_PROVIDERS_PACKAGE}.xai_provider:XAIProvider",
+}
+
+
+def _import_provider(path: str) -> Type[BaseModelProvider]:
+    module_path, _, attribute = path.partition(":")
+    if not attribute:
+        raise ValueError(f"Provider path '{path}' must look like 'package.module:ClassName'")
+    return getattr(import_module(module_path), attribute)
 
 
 class ModelRegistry:
     """Simple in-memory registry."""
 
-    def __init__(self, register_defaults: bool = True) -> None:
-        self._providers: Dict[str, Type[BaseModelProvider]] = {}
+    def __init__(self, register_defaults: bool = True, response_cache: ResponseCache | None = None) -> None:
+        self._providers: Dict[str, Type[BaseModelProvider] | str] = {}
+        self._response_cache = response_cache
+        self._batchers: Dict[str, MicroBatcher] = {}
+        # (name, kwargs, API key at creation) -> provider
+        self._instances: Dict[Tuple[str, Tuple[Tuple[str, Any], ...], Optional[str]], BaseModelProvider] = {}
+        self._lock = threading.Lock()
+        self.router = Router(self)
         if register_defaults:
             self._register_builtin_providers()
 
     def _register_builtin_providers(self) -> None:
-        self.register(OpenAIProvider.name, OpenAIProvider)
-        self.register(AnthropicProvider.name, AnthropicProvider)
-        self.register(GeminiProvider.name, GeminiProvider)
-        self.register(XAIProvider.name, XAIProvider)
+        for name, path in BUILTIN_PROVIDERS.items():
+            self.register(name, path)
 
-    def register(self, name: str, provider_cls: Type[BaseModelProvider]) -> None:
+    def register(self, name: str, provider_cls: Type[BaseModelProvider] | str) -> None:
         self._providers[name] = provider_cls
+        with self._lock:
+            for key in [key for key in self._instances if key[0] == name]:
+                del self._instances[key]
 
-    def create(self, name: str, **kwargs) -> BaseModelProvider:
+    def resolve(self, name: str) -> Type[BaseModelProvider]:
+        """Return the provider class for `name`, importing it on first use."""
         provider_cls = self._providers.get(name)
         if not provider_cls:
             raise ValueError(f"Provider '{name}' not registered")
-        return provider_cls(**kwargs)
+        if isinstance(provider_cls, str):
+            with self._lock:
+                provider_cls = self._providers[name]
+                if isinstance(provider_cls, str):
+                    provider_cls = self._providers[name] = _import_provider(provider_cls)
+        return provider_cls
+
+    @property
+    def response_cache(self) -> ResponseCache:
+        if self._response_cache is None:
+            self._response_cache = get_response_cache()
+        return self._response_cache
+
+    def create(self, name: str, **kwargs) -> BaseModelProvider:
+        """
+        Provider `name` built with `kwargs`; one shared instance per distinct
+        (hashable) kwargs and API key. Unhashable kwargs always get a fresh
+        instance.
+        """
+        kwargs.setdefault("cache", self.response_cache)
+        options = tuple(sorted(kwargs.items()))
+        try:
+            hash(options)
+        except TypeError:
+            return self.resolve(name)(**kwargs)
+        # The resolver caches keys, so this is cheap; a changed key builds a new
+        # instance instead of reusing one holding the old (or no) key.
+        key = (name, options, get_provider_api_key(name))
+        with self._lock:
+            provider = self._instances.get(key)
+        if provider is None:
+            created = self.resolve(name)(**kwargs)
+            with self._lock:
+                for stale in [other for other in self._instances if other[:2] == key[:2] and other != key]:
+                    del self._instances[stale]
+                provider = self._instances.setdefault(key, created)
+        return provider
+
+    def batcher(self, name: str, **options) -> MicroBatcher:
+        """
+        Shared micro-batching front end for provider `name`.
+
+        `options` (`window`, `max_batch`, `max_concurrency`) apply when the
+        batcher is first created.
+        """
+        provider = self.create(name)
+        with self._lock:
+            batcher = self._batchers.get(name)
+        if batcher is None or batcher.provider is not provider:
+            if batcher is not None:  # the provider was rebuilt (new key); keep its options
+                options = {
+                    "window": batcher.window,
+                    "max_batch": batcher.max_batch,
+                    "max_concurrency": batcher.max_concurrency,
+                    **options,
+                }
+            created = MicroBatcher(provider, **options)
+            with self._lock:
+                batcher = self._batchers.get(name)
+                if batcher is None or batcher.provider is not provider:
+                    batcher = self._batchers[name] = created
+        return batcher
+
+    def add_route(self, logical: str, backends: Sequence[str | Backend], hedge: bool = False) -> Route:
+        """
+        Route logical model `logical` to `backends` (`"provider"`,
+        `"provider:model"` or `(provider, model)`), fastest healthy first.
+        """
+        return self.router.add_route(logical, backends, hedge=hedge)
+
+    def generate(self, logical: str, prompt: str, **kwargs) -> ModelResponse:
+        return self.router.generate(logical, prompt, **kwargs)
+
+    async def agenerate(self, logical: str, prompt: str, **kwargs) -> ModelResponse:
+        return await self.router.agenerate(logical, prompt, **kwargs)
 
     def list_providers(self) -> list[str]:
         return sorted(self._providers.keys())
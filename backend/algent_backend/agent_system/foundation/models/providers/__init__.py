@@ -1,7 +1,30 @@
-"""Provider implementations (OpenAI, Anthropic, Gemini, xAI, etc.)."""
+"""
+Provider implementations (OpenAI, Anthropic, Gemini, xAI, etc.).
 
-from .base_provider import BaseModelProvider, ModelResponse  # noqa: F401
-from .openai_provider import OpenAIProvider  # noqa: F401
-from .anthropic_provider import AnthropicProvider  # noqa: F401
-from .gemini_provider import GeminiProvider  # noqa: F401
-from .xai_provider import XAIProvider  # noqa: F401
+Concrete providers are imported on first attribute access so that listing or
+registering providers never pulls in every implementation (and, once real SDKs
+are wired in, their dependencies).
+"""
+from importlib import import_module
+
+from .base_provider import BaseModelProvider, ModelResponse, ProviderRequest  # noqa: F401
+
+_PROVIDERS = {
+    "OpenAIProvider": ".openai_provider",
+    "AnthropicProvider": ".anthropic_provider",
+    "GeminiProvider": ".gemini_provider",
+    "XAIProvider": ".xai_provider",
+}
+
+
+def __getattr__(name: str):
+    module_path = _PROVIDERS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    provider_cls = getattr(import_module(module_path, __name__), name)
+    globals()[name] = provider_cls
+    return provider_cls
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_PROVIDERS))
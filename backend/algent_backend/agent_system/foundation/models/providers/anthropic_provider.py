@@ -1,12 +1,16 @@
 """
-Anthropic provider stub.
+Anthropic provider (Messages API over the shared transport).
 """
 from dataclasses import dataclass, field
 import os
+from typing import Any
 
-from .base_provider import BaseModelProvider, ModelResponse
+from .base_provider import BaseModelProvider, ProviderRequest, sampling_params
 from algent_backend.config import get_provider_api_key
 
+ANTHROPIC_VERSION = "2023-06-01"
+DEFAULT_MAX_TOKENS = 1024
+
 
 @dataclass
 class AnthropicConfig:
@@ -15,17 +19,48 @@ class AnthropicConfig:
     api_key: str | None = field(default_factory=lambda: get_provider_api_key("anthropic"))
     base_url: str = field(default_factory=lambda: os.getenv("ANTHROPIC_BASE_URL", "https://api.anthropic.com"))
     model: str = field(default_factory=lambda: os.getenv("ANTHROPIC_MODEL", "claude-3-5-sonnet"))
+    max_concurrency: int = field(default_factory=lambda: int(os.getenv("ANTHROPIC_MAX_CONCURRENCY", "16")))
+
+
+def _content(prompt: str, cache_prefix: int | None) -> Any:
+    """Message content, with the first `cache_prefix` characters marked for prompt caching."""
+    if not cache_prefix or cache_prefix <= 0:
+        return prompt
+    blocks = [{"type": "text", "text": prompt[:cache_prefix], "cache_control": {"type": "ephemeral"}}]
+    if prompt[cache_prefix:]:
+        blocks.append({"type": "text", "text": prompt[cache_prefix:]})
+    return blocks
 
 
 class AnthropicProvider(BaseModelProvider):
-    """Placeholder for Anthropic integration."""
+    """Anthropic Messages API over the pooled async transport."""
 
     name = "anthropic"
 
-    def __init__(self, config: AnthropicConfig | None = None, **_: object) -> None:
-        super().__init__()
+    def __init__(self, config: AnthropicConfig | None = None, **kwargs: object) -> None:
         self.config = config or AnthropicConfig()
+        super().__init__(**kwargs)
+
+    def build_request(self, prompt: str, **kwargs) -> ProviderRequest:
+        params = sampling_params(kwargs)
+        if "stop" in params:
+            stop = params.pop("stop")
+            params["stop_sequences"] = [stop] if isinstance(stop, str) else list(stop)
+        params.setdefault("max_tokens", DEFAULT_MAX_TOKENS)
+        return ProviderRequest(
+            url=f"{self.config.base_url.rstrip('/')}/v1/messages",
+            payload={
+                "model": kwargs.get("model") or self.config.model,
+                "messages": [{"role": "user", "content": _content(prompt, kwargs.get("cache_prefix"))}],
+                **params,
+            },
+            headers={"x-api-key": self.config.api_key, "anthropic-version": ANTHROPIC_VERSION},
+        )
+
+    def parse_response(self, payload: Any) -> str:
+        return "".join(block.get("text", "") for block in payload.get("content", []) if block.get("type") == "text")
 
-    def generate(self, prompt: str, **_: object) -> ModelResponse:
-        # TODO: integrate Anthropic SDK
-        return ModelResponse(text=f"[anthropic mock::{self.config.model}] {prompt}")
+    def parse_stream_event(self, event: Any) -> str | None:
+        if event.get("type") == "content_block_delta":
+            return event.get("delta", {}).get("text")
+        return None
@@ -1,10 +1,41 @@
 """
 Abstract provider definition.
+
+Concrete providers describe their HTTP API (`build_request`/`parse_response`);
+the shared `AsyncTransport` handles pooling, concurrency limits and retries.
+Providers without an API key return a deterministic mock response instead, so
+local development and tests never touch the network.
+
+`stream`/`astream` yield text chunks as the provider produces them (decoded
+from the vendor's Server-Sent Events stream) instead of one finished string.
+
+`cache_prefix=<n>` marks the first n characters of the prompt as a stable
+prefix (e.g. `PromptBuilder.render_parts(...).prefix_length`). Anthropic sends it
+as a cache-controlled block; OpenAI and xAI cache stable prefixes on their own
+and ignore it.
+
+With a `ResponseCache` attached, deterministic `generate`/`agenerate` calls are
+served from it (see `models/response_cache.py`); streams are never cached.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+import asyncio
+from contextlib import aclosing
+from dataclasses import dataclass, field
+import json
+import re
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator
+
+from algent_backend.telemetry import REGISTRY, span
+
+from ..transport import AsyncTransport, get_transport, sse_events
+
+if TYPE_CHECKING:
+    from ..response_cache import ResponseCache
+
+
+SAMPLING_PARAMS = ("temperature", "top_p", "max_tokens", "stop")
+"""Generation kwargs forwarded to the provider API (others are ignored)."""
 
 
 @dataclass
@@ -15,16 +46,180 @@ class ModelResponse:
     raw: Any | None = None
 
 
+@dataclass
+class ProviderRequest:
+    """HTTP request a provider wants sent for one generation."""
+
+    url: str
+    payload: Dict[str, Any]
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+def sampling_params(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: kwargs[key] for key in SAMPLING_PARAMS if kwargs.get(key) is not None}
+
+
+def _mock_tokens(text: str) -> Iterator[str]:
+    """Split mock text into word-sized chunks (whitespace kept) to mimic streaming."""
+    return iter(re.findall(r"\S+\s*|\s+", text))
+
+
+_EXHAUSTED = object()
+
+_CACHE_LOOKUPS = REGISTRY.counter(
+    "algent_provider_cache_total",
+    "Response cache lookups by provider and result (hit, miss, bypass).",
+    ("provider", "result"),
+)
+
+
 class BaseModelProvider:
-    """Base synchronous interface."""
+    """
+    Base interface. Subclasses set `config` (with `api_key`, `base_url`,
+    `model` and `max_concurrency`) and implement `build_request` and
+    `parse_response`.
+    """
 
     name = "base"
+    config: Any = None
 
-    def __init__(self, **_: object) -> None:
+    def __init__(
+        self,
+        transport: AsyncTransport | None = None,
+        cache: "ResponseCache | None" = None,
+        **_: object,
+    ) -> None:
         """Accept provider-specific kwargs without enforcing structure here."""
+        self.transport = transport or get_transport()
+        self.cache = cache
+        limit = getattr(self.config, "max_concurrency", None)
+        if limit:
+            self.transport.set_limit(self.name, limit)
+
+    @property
+    def offline(self) -> bool:
+        """True when no API key is configured; generation returns mock text."""
+        return not getattr(self.config, "api_key", None)
 
-    def generate(self, prompt: str, **kwargs) -> ModelResponse:  # pragma: no cover - interface
+    def mock_response(self, prompt: str) -> ModelResponse:
+        return ModelResponse(text=f"[{self.name} mock::{self.config.model}] {prompt}")
+
+    def build_request(self, prompt: str, **kwargs) -> ProviderRequest:  # pragma: no cover - interface
         raise NotImplementedError
 
-    async def agenerate(self, prompt: str, **kwargs) -> ModelResponse:  # pragma: no cover - interface
+    def parse_response(self, payload: Any) -> str:  # pragma: no cover - interface
         raise NotImplementedError
+
+    def build_stream_request(self, prompt: str, **kwargs) -> ProviderRequest:
+        """Streaming variant of `build_request`; most APIs only need `stream: true`."""
+        request = self.build_request(prompt, **kwargs)
+        request.payload["stream"] = True
+        return request
+
+    def parse_stream_event(self, event: Any) -> str | None:  # pragma: no cover - interface
+        """Text delta carried by one decoded stream event (None if it has none)."""
+        raise NotImplementedError
+
+    def generate(self, prompt: str, **kwargs) -> ModelResponse:
+        """Blocking generation; runs the request on the transport's loop."""
+        with span("provider.generate", provider=self.name, model=kwargs.get("model") or self.config.model) as current:
+            if self.offline:
+                current.set(source="mock")
+                return self.mock_response(prompt)
+            key = self._cache_key(prompt, kwargs)
+            if key is not None and (cached := self._cached(key)) is not None:
+                current.set(source="cache")
+                return cached
+            response = self.transport.run_sync(self._request(prompt, **kwargs))
+            if key is not None:
+                self.cache.put(key, response)
+            return response
+
+    async def agenerate(self, prompt: str, **kwargs) -> ModelResponse:
+        with span("provider.generate", provider=self.name, model=kwargs.get("model") or self.config.model) as current:
+            if self.offline:
+                current.set(source="mock")
+                return self.mock_response(prompt)
+            key = self._cache_key(prompt, kwargs)
+            if key is not None and (cached := await self._acached(key)) is not None:
+                current.set(source="cache")
+                return cached
+            response = await self._request(prompt, **kwargs)
+            if key is not None:
+                await asyncio.to_thread(self.cache.put, key, response)  # disk write off the loop
+            return response
+
+    def _cache_key(self, prompt: str, kwargs: Dict[str, Any]) -> str | None:
+        if self.cache is None:
+            return None
+        if not self.cache.cacheable(kwargs):
+            _CACHE_LOOKUPS.labels(self.name, "bypass").inc()
+            return None
+        model = kwargs.get("model") or self.config.model
+        return self.cache.key(self.name, model, prompt, sampling_params(kwargs))
+
+    def _cached(self, key: str) -> ModelResponse | None:
+        cached = self.cache.get(key)
+        _CACHE_LOOKUPS.labels(self.name, "miss" if cached is None else "hit").inc()
+        return cached
+
+    async def _acached(self, key: str) -> ModelResponse | None:
+        """`_cached` for the event loop: memory first, the SQLite read on a thread."""
+        cached = self.cache.peek(key)
+        if cached is None and self.cache.persistent:
+            cached = await asyncio.to_thread(self.cache.get, key)
+        _CACHE_LOOKUPS.labels(self.name, "miss" if cached is None else "hit").inc()
+        return cached
+
+    async def _request(self, prompt: str, **kwargs) -> ModelResponse:
+        request = self.build_request(prompt, **kwargs)
+        response = await self.transport.request(
+            "POST",
+            request.url,
+            json_body=request.payload,
+            headers=request.headers,
+            limit_key=self.name,
+        )
+        payload = response.raise_for_status().json()
+        return ModelResponse(text=self.parse_response(payload), raw=payload)
+
+    async def astream(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """Yield text chunks as they arrive."""
+        if self.offline:
+            for token in _mock_tokens(self.mock_response(prompt).text):
+                yield token
+            return
+        request = self.build_stream_request(prompt, **kwargs)
+        chunks = self.transport.stream(
+            "POST",
+            request.url,
+            json_body=request.payload,
+            headers={"Accept": "text/event-stream", **request.headers},
+            limit_key=self.name,
+        )
+        async with aclosing(chunks), aclosing(sse_events(chunks)) as events:
+            async for data in events:
+                if data == "[DONE]":
+                    continue  # drain the terminator so the connection can be reused
+                text = self.parse_stream_event(json.loads(data))
+                if text:
+                    yield text
+
+    def stream(self, prompt: str, **kwargs) -> Iterator[str]:
+        """Blocking `astream`; each chunk is pulled from the transport's loop."""
+        if self.offline:
+            yield from _mock_tokens(self.mock_response(prompt).text)
+            return
+        chunks = self.astream(prompt, **kwargs)
+
+        async def _next() -> Any:
+            try:
+                return await chunks.__anext__()
+            except StopAsyncIteration:
+                return _EXHAUSTED
+
+        try:
+            while (chunk := self.transport.run_sync(_next())) is not _EXHAUSTED:
+                yield chunk
+        finally:
+            self.transport.run_sync(chunks.aclose())
@@ -1,12 +1,21 @@
 """
-Google Gemini provider stub.
+Google Gemini provider (generateContent REST API over the shared transport).
 """
 from dataclasses import dataclass, field
 import os
+from typing import Any
 
-from .base_provider import BaseModelProvider, ModelResponse
+from .base_provider import BaseModelProvider, ProviderRequest, sampling_params
 from algent_backend.config import get_provider_api_key
 
+# Sampling kwarg -> generationConfig field.
+_GENERATION_FIELDS = {
+    "temperature": "temperature",
+    "top_p": "topP",
+    "max_tokens": "maxOutputTokens",
+    "stop": "stopSequences",
+}
+
 
 @dataclass
 class GeminiConfig:
@@ -15,17 +24,42 @@ class GeminiConfig:
     api_key: str | None = field(default_factory=lambda: get_provider_api_key("gemini") or os.getenv("GOOGLE_API_KEY"))
     base_url: str = field(default_factory=lambda: os.getenv("GEMINI_BASE_URL", "https://generativelanguage.googleapis.com"))
     model: str = field(default_factory=lambda: os.getenv("GEMINI_MODEL", "gemini-1.5-pro"))
+    max_concurrency: int = field(default_factory=lambda: int(os.getenv("GEMINI_MAX_CONCURRENCY", "16")))
 
 
 class GeminiProvider(BaseModelProvider):
-    """Placeholder for Gemini integration."""
+    """Gemini generateContent over the pooled async transport."""
 
     name = "gemini"
 
-    def __init__(self, config: GeminiConfig | None = None, **_: object) -> None:
-        super().__init__()
+    def __init__(self, config: GeminiConfig | None = None, **kwargs: object) -> None:
         self.config = config or GeminiConfig()
+        super().__init__(**kwargs)
+
+    def build_request(self, prompt: str, **kwargs) -> ProviderRequest:
+        generation = {}
+        for key, value in sampling_params(kwargs).items():
+            generation[_GENERATION_FIELDS[key]] = [value] if key == "stop" and isinstance(value, str) else value
+        payload: dict = {"contents": [{"role": "user", "parts": [{"text": prompt}]}]}
+        if generation:
+            payload["generationConfig"] = generation
+        model = kwargs.get("model") or self.config.model
+        return ProviderRequest(
+            url=f"{self.config.base_url.rstrip('/')}/v1beta/models/{model}:generateContent",
+            payload=payload,
+            headers={"x-goog-api-key": self.config.api_key},
+        )
+
+    def parse_response(self, payload: Any) -> str:
+        candidates = payload.get("candidates") or [{}]
+        parts = candidates[0].get("content", {}).get("parts", [])
+        return "".join(part.get("text", "") for part in parts)
+
+    def build_stream_request(self, prompt: str, **kwargs) -> ProviderRequest:
+        request = self.build_request(prompt, **kwargs)
+        request.url = request.url.replace(":generateContent", ":streamGenerateContent") + "?alt=sse"
+        return request
 
-    def generate(self, prompt: str, **_: object) -> ModelResponse:
-        # TODO: integrate Gemini SDK or REST client
-        return ModelResponse(text=f"[gemini mock::{self.config.model}] {prompt}")
+    def parse_stream_event(self, event: Any) -> str | None:
+        # Each streamed chunk is a partial GenerateContentResponse.
+        return self.parse_response(event)
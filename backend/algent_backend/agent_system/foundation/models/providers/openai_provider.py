@@ -1,12 +1,14 @@
 """
-OpenAI provider stub.
+OpenAI provider.
 
-This module intentionally avoids importing the SDK to keep dependencies optional.
+Talks to the Chat Completions REST API through the shared transport; this
+module intentionally avoids importing the SDK to keep dependencies optional.
 """
 from dataclasses import dataclass, field
 import os
+from typing import Any
 
-from .base_provider import BaseModelProvider, ModelResponse
+from .base_provider import BaseModelProvider, ProviderRequest, sampling_params
 from algent_backend.config import get_provider_api_key
 
 
@@ -17,17 +19,45 @@ class OpenAIConfig:
     api_key: str | None = field(default_factory=lambda: get_provider_api_key("openai"))
     base_url: str = field(default_factory=lambda: os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1"))
     model: str = field(default_factory=lambda: os.getenv("OPENAI_MODEL", "gpt-4o-mini"))
+    max_concurrency: int = field(default_factory=lambda: int(os.getenv("OPENAI_MAX_CONCURRENCY", "16")))
+
+
+def chat_completions_request(config: Any, prompt: str, **kwargs) -> ProviderRequest:
+    """OpenAI-compatible `/chat/completions` request (also used by xAI)."""
+    return ProviderRequest(
+        url=f"{config.base_url.rstrip('/')}/chat/completions",
+        payload={
+            "model": kwargs.get("model") or config.model,
+            "messages": [{"role": "user", "content": prompt}],
+            **sampling_params(kwargs),
+        },
+        headers={"Authorization": f"Bearer {config.api_key}"},
+    )
+
+
+def chat_completions_text(payload: Any) -> str:
+    return payload["choices"][0]["message"]["content"] or ""
+
+
+def chat_completions_delta(event: Any) -> str | None:
+    choices = event.get("choices") or [{}]
+    return choices[0].get("delta", {}).get("content")
 
 
 class OpenAIProvider(BaseModelProvider):
-    """Placeholder provider. Wire in actual OpenAI client later."""
+    """OpenAI Chat Completions over the pooled async transport."""
 
     name = "openai"
 
-    def __init__(self, config: OpenAIConfig | None = None, **_: object) -> None:
-        super().__init__()
+    def __init__(self, config: OpenAIConfig | None = None, **kwargs: object) -> None:
         self.config = config or OpenAIConfig()
+        super().__init__(**kwargs)
+
+    def build_request(self, prompt: str, **kwargs) -> ProviderRequest:
+        return chat_completions_request(self.config, prompt, **kwargs)
+
+    def parse_response(self, payload: Any) -> str:
+        return chat_completions_text(payload)
 
-    def generate(self, prompt: str, **_: object) -> ModelResponse:
-        # TODO: integrate actual OpenAI client
-        return ModelResponse(text=f"[openai mock::{self.config.model}] {prompt}")
+    def parse_stream_event(self, event: Any) -> str | None:
+        return chat_completions_delta(event)
@@ -1,10 +1,14 @@
 """
-xAI provider stub (e.g., Grok models).
+xAI provider (e.g., Grok models).
+
+The xAI API is OpenAI-compatible, so requests reuse the Chat Completions shape.
 """
 from dataclasses import dataclass, field
 import os
+from typing import Any
 
-from .base_provider import BaseModelProvider, ModelResponse
+from .base_provider import BaseModelProvider, ProviderRequest
+from .openai_provider import chat_completions_delta, chat_completions_request, chat_completions_text
 from algent_backend.config import get_provider_api_key
 
 
@@ -15,17 +19,23 @@ class XAIConfig:
     api_key: str | None = field(default_factory=lambda: get_provider_api_key("xai"))
     base_url: str = field(default_factory=lambda: os.getenv("XAI_BASE_URL", "https://api.x.ai/v1"))
     model: str = field(default_factory=lambda: os.getenv("XAI_MODEL", "grok-beta"))
+    max_concurrency: int = field(default_factory=lambda: int(os.getenv("XAI_MAX_CONCURRENCY", "16")))
 
 
 class XAIProvider(BaseModelProvider):
-    """Placeholder for xAI integration."""
+    """xAI Chat Completions over the pooled async transport."""
 
     name = "xai"
 
-    def __init__(self, config: XAIConfig | None = None, **_: object) -> None:
-        super().__init__()
+    def __init__(self, config: XAIConfig | None = None, **kwargs: object) -> None:
         self.config = config or XAIConfig()
+        super().__init__(**kwargs)
+
+    def build_request(self, prompt: str, **kwargs) -> ProviderRequest:
+        return chat_completions_request(self.config, prompt, **kwargs)
+
+    def parse_response(self, payload: Any) -> str:
+        return chat_completions_text(payload)
 
-    def generate(self, prompt: str, **_: object) -> ModelResponse:
-        # TODO: integrate xAI client
-        return ModelResponse(text=f"[xai mock::{self.config.model}] {prompt}")
+    def parse_stream_event(self, event: Any) -> str | None:
+        return chat_completions_delta(event)
@@ -0,0 +1,197 @@
+"""
+Prompt/response cache for model providers.
+
+Replayed agent runs often resend identical prompts; serving them from a cache
+saves the full provider round trip (and its cost). Entries are keyed by
+provider, model, rendered prompt and sampling parameters, held in an in-memory
+LRU and written through to a SQLite file so they survive restarts. Every entry
+expires after `ttl` seconds.
+
+Only deterministic requests are cached: providers bypass the cache unless the
+call sets `temperature=0`, and a per-call `use_cache=True/False` overrides that.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import json
+import os
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Tuple
+
+from .providers.base_provider import ModelResponse
+
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL = 7 * 24 * 3600.0
+DEFAULT_PATH = Path.home() / ".algent" / "response_cache.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL,
+    text TEXT NOT NULL,
+    raw TEXT
+)
+"""
+
+_Entry = Tuple[float, str, Any]  # (expires_at, text, raw)
+
+
+class ResponseCache:
+    """
+    LRU of `max_entries` responses over an optional SQLite store at `path`.
+
+    `path=None` keeps the cache in memory only.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float = DEFAULT_TTL,
+    ) -> None:
+        self.path = Path(path) if path is not None else None
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._memory: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._db: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def cacheable(kwargs: Dict[str, Any]) -> bool:
+        """Whether a call with these generation kwargs may use the cache."""
+        use_cache = kwargs.get("use_cache")
+        if use_cache is not None:
+            return bool(use_cache)
+        return kwargs.get("temperature") == 0
+
+    @staticmethod
+    def key(provider: str, model: str, prompt: str, params: Dict[str, Any]) -> str:
+        canonical = json.dumps(
+            {"provider": provider, "model": model, "prompt": prompt, "params": params},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=repr,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    @property
+    def persistent(self) -> bool:
+        return self.path is not None
+
+    def peek(self, key: str) -> ModelResponse | None:
+        """Memory-only lookup that never touches disk (safe on an event loop)."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None or entry[0] <= time.time():
+                return None  # expiry and the disk lookup are left to `get`
+            self._memory.move_to_end(key)
+        return ModelResponse(text=entry[1], raw=entry[2])
+
+    def get(self, key: str) -> ModelResponse | None:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None and self.path is not None:
+                row = self._store().execute(
+                    "SELECT expires_at, text, raw FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    entry = (row[0], row[1], json.loads(row[2]) if row[2] is not None else None)
+                    self._remember(key, entry)
+            if entry is None:
+                return None
+            if entry[0] <= now:
+                self._forget(key)
+                return None
+            self._memory.move_to_end(key)
+        return ModelResponse(text=entry[1], raw=entry[2])
+
+    def put(self, key: str, response: ModelResponse) -> None:
+        entry = (time.time() + self.ttl, response.text, response.raw)
+        with self._lock:
+            self._remember(key, entry)
+            if self.path is not None:
+                raw = json.dumps(response.raw, default=repr) if response.raw is not None else None
+                with self._store() as db:
+                    db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)", (key, entry[0], entry[1], raw))
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._forget(key)
+
+    def purge_expired(self) -> int:
+        """Drop expired entries from memory and disk; returns the disk rows removed."""
+        now = time.time()
+        with self._lock:
+            for key in [key for key, entry in self._memory.items() if entry[0] <= now]:
+                del self._memory[key]
+            if self.path is None:
+                return 0
+            with self._store() as db:
+                return db.execute("DELETE FROM responses WHERE expires_at <= ?", (now,)).rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self.path is not None:
+                with self._store() as db:
+                    db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, key: str, entry: _Entry) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _forget(self, key: str) -> None:
+        self._memory.pop(key, None)
+        if self.path is not None:
+            with self._store() as db:
+                db.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def _store(self) -> sqlite3.Connection:
+        # Opened on first use so constructing the default cache never touches disk.
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(_SCHEMA)
+        return self._db
+
+
+_DEFAULT: ResponseCache | None = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Process-wide cache used by `ModelRegistry`.
+
+    Configured by `ALGENT_RESPONSE_CACHE_PATH` (empty for memory only),
+    `ALGENT_RESPONSE_CACHE_ENTRIES` and `ALGENT_RESPONSE_CACHE_TTL`.
+    """
+    global _DEFAULT
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None:
+            path = os.getenv("ALGENT_RESPONSE_CACHE_PATH", str(DEFAULT_PATH))
+            _DEFAULT = ResponseCache(
+                path=path or None,
+                max_entries=int(os.getenv("ALGENT_RESPONSE_CACHE_ENTRIES", DEFAULT_MAX_ENTRIES)),
+                ttl=float(os.getenv("ALGENT_RESPONSE_CACHE_TTL", DEFAULT_TTL)),
+            )
+        return _DEFAULT
@@ -0,0 +1,280 @@
+"""
+Latency-aware routing of logical models across provider backends.
+
+A route maps a logical name (e.g. `"planner"`) to candidate backends, each a
+provider plus model. Every call's latency and outcome feed a rolling
+`BackendStats` window per backend. Routing prefers healthy backends (error rate
+at or below `max_error_rate`, or too few samples to judge) ordered by median
+latency; untried backends go first so each gets measured. If a backend fails,
+the next candidate is tried. A caller's own cancellation or deadline
+(`LoopCancelled`) is re-raised as is: it neither counts against the backend nor
+fails over.
+
+A demoted backend is not written off: once `probe_after` seconds pass without
+a call to it, the next request ranks it as healthy again (one probe per
+cool-down). A successful call to a demoted backend clears its window, so a
+short outage does not demote it indefinitely.
+
+With `hedge=True`, a call still running when the chosen backend's p95 latency
+elapses sends a duplicate request to the next candidate (or the same backend
+when it is the only one). The first response wins and the other is cancelled.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import TYPE_CHECKING, Deque, Dict, List, Sequence, Tuple
+
+from algent_backend.telemetry import REGISTRY
+
+from ..cancellation import LoopCancelled
+from .providers.base_provider import BaseModelProvider, ModelResponse
+
+if TYPE_CHECKING:
+    from .model_registry import ModelRegistry
+
+
+DEFAULT_WINDOW = 100
+DEFAULT_MIN_SAMPLES = 5
+DEFAULT_MAX_ERROR_RATE = 0.5
+DEFAULT_PROBE_AFTER = 30.0
+
+_LATENCY = REGISTRY.histogram(
+    "algent_provider_latency_seconds",
+    "Routed provider call latency by provider, model and outcome.",
+    ("provider", "model", "outcome"),
+)
+_HEDGES = REGISTRY.counter(
+    "algent_provider_hedges_total",
+    "Hedged duplicate requests by logical route and winner (primary, hedge).",
+    ("route", "winner"),
+)
+
+Backend = Tuple[str, str | None]  # (provider name, model; None = provider default)
+
+
+def parse_backend(spec: str | Backend) -> Backend:
+    """Accept `"provider"`, `"provider:model"` or a `(provider, model)` pair."""
+    if isinstance(spec, tuple):
+        return spec
+    provider, _, model = spec.partition(":")
+    return provider, model or None
+
+
+class BackendStats:
+    """Rolling latency/outcome window for one backend."""
+
+    def __init__(self, window: int = DEFAULT_WINDOW) -> None:
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._sorted: List[float] | None = None
+        self._lock = threading.Lock()
+        self.last_observed = 0.0  # time.monotonic() of the latest outcome
+
+    def observe(self, latency: float, ok: bool) -> None:
+        with self._lock:
+            self.last_observed = time.monotonic()
+            self._outcomes.append(ok)
+            if ok:
+                self._latencies.append(latency)
+                self._sorted = None
+
+    def reset(self) -> None:
+        """Forget every sample (a demoted backend that recovered starts fresh)."""
+        with self._lock:
+            self._latencies.clear()
+            self._outcomes.clear()
+            self._sorted = None
+
+    @property
+    def samples(self) -> int:
+        return len(self._outcomes)
+
+    @property
+    def error_rate(self) -> float:
+        with self._lock:
+            return self._outcomes.count(False) / len(self._outcomes) if self._outcomes else 0.0
+
+    def percentile(self, q: float) -> float | None:
+        """Latency at quantile `q` of successful calls (None before any succeed)."""
+        with self._lock:
+            if not self._latencies:
+                return None
+            if self._sorted is None:
+                self._sorted = sorted(self._latencies)
+            ordered = self._sorted
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def snapshot(self) -> dict:
+        return {
+            "samples": self.samples,
+            "error_rate": round(self.error_rate, 4),
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+        }
+
+
+@dataclass
+class Route:
+    """Candidate backends for one logical model."""
+
+    name: str
+    backends: List[Backend]
+    hedge: bool = False
+
+
+@dataclass
+class Router:
+    """Picks and calls backends for registered routes (owned by `ModelRegistry`)."""
+
+    registry: "ModelRegistry"
+    window: int = DEFAULT_WINDOW
+    min_samples: int = DEFAULT_MIN_SAMPLES
+    max_error_rate: float = DEFAULT_MAX_ERROR_RATE
+    probe_after: float = DEFAULT_PROBE_AFTER
+    routes: Dict[str, Route] = field(default_factory=dict)
+    _stats: Dict[Backend, BackendStats] = field(default_factory=dict, init=False, repr=False)
+    _probes: Dict[Backend, float] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def add_route(self, name: str, backends: Sequence[str | Backend], hedge: bool = False) -> Route:
+        if not backends:
+            raise ValueError("a route needs at least one backend")
+        route = self.routes[name] = Route(name, [parse_backend(backend) for backend in backends], hedge)
+        return route
+
+    def stats(self, backend: str | Backend) -> BackendStats:
+        backend = parse_backend(backend)
+        with self._lock:
+            return self._stats_for(backend)
+
+    def _stats_for(self, backend: Backend) -> BackendStats:
+        stats = self._stats.get(backend)
+        if stats is None:
+            stats = self._stats[backend] = BackendStats(self.window)
+        return stats
+
+    def healthy(self, backend: Backend) -> bool:
+        stats = self.stats(backend)
+        return stats.samples < self.min_samples or stats.error_rate <= self.max_error_rate
+
+    def _claim_probe(self, backend: Backend, now: float) -> bool:
+        """True (once per cool-down) when a demoted backend is due for a probe."""
+        with self._lock:
+            last = max(self._probes.get(backend, 0.0), self._stats_for(backend).last_observed)
+            if now - last < self.probe_after:
+                return False
+            self._probes[backend] = now
+            return True
+
+    def candidates(self, name: str) -> List[Backend]:
+        """Backends of route `name`, best first."""
+        route = self.routes.get(name)
+        if route is None:
+            raise ValueError(f"Route '{name}' not registered")
+        now = time.monotonic()
+
+        def rank(backend: Backend) -> Tuple[int, float, float]:
+            stats = self.stats(backend)
+            p50 = stats.percentile(0.5)
+            available = self.healthy(backend) or self._claim_probe(backend, now)
+            return (0 if available else 1, -1.0 if p50 is None else p50, stats.error_rate)
+
+        return sorted(route.backends, key=rank)
+
+    def generate(self, name: str, prompt: str, **kwargs) -> ModelResponse:
+        candidates = self.candidates(name)
+        if self.routes[name].hedge:
+            provider = self._provider(candidates[0])
+            return provider.transport.run_sync(self.agenerate(name, prompt, **kwargs))
+        error: Exception | None = None
+        for backend in candidates:
+            provider = self._provider(backend)
+            started = time.perf_counter()
+            try:
+                response = provider.generate(prompt, **self._kwargs(backend, kwargs))
+            except LoopCancelled:
+                raise
+            except Exception as exc:
+                self._observe(backend, time.perf_counter() - started, ok=False)
+                error = exc
+                continue
+            self._observe(backend, time.perf_counter() - started, ok=True)
+            return response
+        raise error
+
+    async def agenerate(self, name: str, prompt: str, **kwargs) -> ModelResponse:
+        candidates = self.candidates(name)
+        hedge = self.routes[name].hedge
+        error: Exception | None = None
+        for index, backend in enumerate(candidates):
+            try:
+                if hedge:
+                    fallback = candidates[index + 1] if index + 1 < len(candidates) else backend
+                    return await self._hedged(name, backend, fallback, prompt, kwargs)
+                return await self._call(backend, prompt, kwargs)
+            except LoopCancelled:
+                raise
+            except Exception as exc:
+                error = exc
+        raise error
+
+    async def _call(self, backend: Backend, prompt: str, kwargs: Dict) -> ModelResponse:
+        provider = self._provider(backend)
+        started = time.perf_counter()
+        try:
+            response = await provider.agenerate(prompt, **self._kwargs(backend, kwargs))
+        except LoopCancelled:
+            raise
+        except Exception:  # cancellation (a losing hedge) is not counted against the backend
+            self._observe(backend, time.perf_counter() - started, ok=False)
+            raise
+        self._observe(backend, time.perf_counter() - started, ok=True)
+        return response
+
+    async def _hedged(self, name: str, primary: Backend, fallback: Backend, prompt: str, kwargs: Dict) -> ModelResponse:
+        stats = self.stats(primary)
+        delay = stats.percentile(0.95) if stats.samples >= self.min_samples else None
+        first = asyncio.ensure_future(self._call(primary, prompt, kwargs))
+        if delay is None:
+            return await first
+        done, _ = await asyncio.wait({first}, timeout=delay)
+        if done:
+            return first.result()
+        second = asyncio.ensure_future(self._call(fallback, prompt, kwargs))
+        pending = {first: "primary", second: "hedge"}
+        error: BaseException | None = None
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    winner = pending.pop(task)
+                    if task.exception() is None:
+                        _HEDGES.labels(name, winner).inc()
+                        return task.result()
+                    error = task.exception()
+                    if isinstance(error, LoopCancelled):
+                        raise error
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _provider(self, backend: Backend) -> BaseModelProvider:
+        return self.registry.create(backend[0])
+
+    @staticmethod
+    def _kwargs(backend: Backend, kwargs: Dict) -> Dict:
+        return {**kwargs, "model": backend[1]} if backend[1] else kwargs
+
+    def _observe(self, backend: Backend, latency: float, ok: bool) -> None:
+        stats = self.stats(backend)
+        if ok and not self.healthy(backend):
+            stats.reset()  # a demoted backend answered again: reassess it from scratch
+        stats.observe(latency, ok)
+        provider = self._provider(backend)
+        model = backend[1] or provider.config.model
+        _LATENCY.labels(backend[0], model, "ok" if ok else "error").observe(latency)
@@ -0,0 +1,504 @@
+"""
+Shared async HTTP transport for model providers.
+
+Dependency-free HTTP/1.1 client built on asyncio streams:
+
+- one keep-alive connection pool per origin (scheme, host, port), so repeated
+  calls reuse TCP/TLS connections instead of handshaking every time;
+- a semaphore per provider capping concurrent in-flight requests;
+- jittered exponential backoff ("full jitter") on 429/5xx and connection
+  errors, honouring `Retry-After` when the server sends it. A connection
+  error or timeout after the request was written is only retried for
+  idempotent methods or requests carrying an `Idempotency-Key` header, so a
+  POST the server may already have processed (a billed completion) is never
+  replayed blindly;
+- `stream` yields response bytes as they arrive (see `sse_events` for
+  decoding Server-Sent Events), so token streams are never buffered whole.
+
+asyncio streams and semaphores belong to one event loop, so pools are kept per
+loop. Synchronous callers go through `run_sync`, which runs coroutines on a
+single background loop owned by the transport so they share its pools too.
+`run_sync` honours the caller's current `CancelScope`: cancelling it or passing
+its deadline cancels the in-flight request.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from concurrent.futures import CancelledError as FutureCancelledError, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+import json
+import random
+import ssl
+import threading
+from typing import Any, AsyncIterator, Coroutine, Deque, Dict, FrozenSet, List, Tuple, TypeVar
+from urllib.parse import urlsplit
+import weakref
+
+from algent_backend.telemetry import REGISTRY
+
+from ..cancellation import DeadlineExceeded, current_scope
+
+
+T = TypeVar("T")
+
+DEFAULT_POOL_SIZE = 32
+DEFAULT_PROVIDER_CONCURRENCY = 16
+DEFAULT_TIMEOUT = 60.0
+
+_RETRIES = REGISTRY.counter(
+    "algent_provider_retries_total",
+    "Provider HTTP attempts retried, by provider and reason (status code or error).",
+    ("provider", "reason"),
+)
+
+Origin = Tuple[str, str, int]
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class TransportError(Exception):
+    """Request failed: connection error after retries, or an error status."""
+
+    def __init__(self, message: str, status: int | None = None, body: bytes = b"") -> None:
+        super().__init__(message)
+        self.status = status
+        self.body = body
+
+
+@dataclass
+class HTTPResponse:
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+    def json(self) -> Any:
+        return json.loads(self.body) if self.body else None
+
+    def raise_for_status(self) -> "HTTPResponse":
+        if self.status >= 400:
+            raise TransportError(f"HTTP {self.status}: {self.body[:200]!r}", status=self.status, body=self.body)
+        return self
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with full jitter: sleep U(0, min(cap, base * 2**n))."""
+
+    max_attempts: int = 4
+    base_delay: float = 0.25
+    max_delay: float = 8.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+    def backoff(self, attempt: int, retry_after: str | None = None) -> float:
+        if retry_after:
+            try:
+                return min(self.max_delay, max(0.0, float(retry_after)))
+            except ValueError:
+                pass  # HTTP-date form; fall back to computed backoff
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+class _Connection:
+    __slots__ = ("reader", "writer")
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+
+    @property
+    def reusable(self) -> bool:
+        return not self.writer.is_closing() and not self.reader.at_eof()
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class _OriginPool:
+    """Idle keep-alive connections to one origin, capped at `size` open at once."""
+
+    def __init__(self, origin: Origin, size: int, ssl_context: ssl.SSLContext | None) -> None:
+        self.origin = origin
+        self._idle: Deque[_Connection] = deque()
+        self._slots = asyncio.Semaphore(size)
+        self._ssl = ssl_context
+
+    async def acquire(self) -> Tuple[_Connection, bool]:
+        """Return (connection, reused)."""
+        await self._slots.acquire()
+        try:
+            while self._idle:
+                conn = self._idle.pop()
+                if conn.reusable:
+                    return conn, True
+                conn.close()
+            return await self.connect(), False
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def connect(self) -> _Connection:
+        _, host, port = self.origin
+        reader, writer = await asyncio.open_connection(host, port, ssl=self._ssl)
+        return _Connection(reader, writer)
+
+    def release(self, conn: _Connection, keep_alive: bool) -> None:
+        if keep_alive and conn.reusable:
+            self._idle.append(conn)
+        else:
+            conn.close()
+        self._slots.release()
+
+    def close(self) -> None:
+        while self._idle:
+            self._idle.pop().close()
+
+
+@dataclass
+class _LoopState:
+    pools: Dict[Origin, _OriginPool] = field(default_factory=dict)
+    limits: Dict[str, asyncio.Semaphore] = field(default_factory=dict)
+
+
+async def _read_head(reader: asyncio.StreamReader) -> Tuple[int, Dict[str, str], bool]:
+    """Parse a status line and headers; returns (status, headers, keep_alive)."""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("connection closed before response")
+    version, status, *_ = status_line.decode("latin-1").split(" ", 2)
+    headers: Dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    framed = "content-length" in headers or "chunked" in headers.get("transfer-encoding", "").lower()
+    keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close" and framed
+    return int(status), headers, keep_alive
+
+
+async def _iter_body(
+    reader: asyncio.StreamReader, status: int, headers: Dict[str, str], method: str
+) -> AsyncIterator[bytes]:
+    """Yield the response body as it arrives (chunked, sized or read-to-EOF)."""
+    if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+        return
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        while True:
+            size = int((await reader.readline()).split(b";", 1)[0].strip(), 16)
+            if size == 0:
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass  # trailers
+                return
+            yield await reader.readexactly(size)
+            await reader.readexactly(2)
+    elif "content-length" in headers:
+        remaining = int(headers["content-length"])
+        while remaining:
+            chunk = await reader.read(min(remaining, 65536))
+            if not chunk:
+                raise asyncio.IncompleteReadError(b"", remaining)
+            remaining -= len(chunk)
+            yield chunk
+    else:
+        while chunk := await reader.read(65536):
+            yield chunk
+
+
+async def sse_events(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decode a Server-Sent Events byte stream into each event's `data` payload."""
+    buffer = b""
+    data: List[str] = []
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for raw in lines:
+            line = raw.rstrip(b"\r").decode("utf-8")
+            if not line:
+                if data:
+                    yield "\n".join(data)
+                    data = []
+            elif line.startswith("data:"):
+                data.append(line[5:].lstrip(" "))
+    if buffer.strip().startswith(b"data:"):
+        data.append(buffer.strip()[5:].decode("utf-8").lstrip(" "))
+    if data:
+        yield "\n".join(data)
+
+
+def _encode_request(
+    method: str, url: str, json_body: Any, headers: Dict[str, str] | None
+) -> Tuple[Origin, bytes]:
+    parts = urlsplit(url)
+    scheme = parts.scheme or "http"
+    origin = (scheme, parts.hostname or "", parts.port or (443 if scheme == "https" else 80))
+    target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+    body = json.dumps(json_body).encode("utf-8") if json_body is not None else b""
+    head = {"Host": parts.netloc, "Accept": "application/json", "Content-Length": str(len(body))}
+    if json_body is not None:
+        head["Content-Type"] = "application/json"
+    head.update(headers or {})
+    raw_head = f"{method} {target} HTTP/1.1\r\n" + "".join(f"{k}: {v}\r\n" for k, v in head.items()) + "\r\n"
+    return origin, raw_head.encode("latin-1") + body
+
+
+def _replayable(method: str, headers: Dict[str, str] | None) -> bool:
+    """Whether a request that may have reached the server can be sent again."""
+    return method.upper() in IDEMPOTENT_METHODS or any(key.lower() == "idempotency-key" for key in headers or {})
+
+
+class _Attempt:
+    """Per-attempt progress: `sent` flips once any request byte may have left."""
+
+    __slots__ = ("sent",)
+
+    def __init__(self) -> None:
+        self.sent = False
+
+
+async def _send(conn: _Connection, payload: bytes, attempt: _Attempt) -> Tuple[int, Dict[str, str], bool]:
+    attempt.sent = True
+    conn.writer.write(payload)
+    await conn.writer.drain()
+    return await _read_head(conn.reader)
+
+
+class AsyncTransport:
+    """
+    Pooled HTTP/1.1 client shared by every provider.
+
+    `pool_size` caps open connections per origin; `set_limit` caps in-flight
+    requests per provider (default `DEFAULT_PROVIDER_CONCURRENCY`).
+    """
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+        retry: RetryPolicy | None = None,
+        ssl_context: ssl.SSLContext | None = None,
+    ) -> None:
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.retry = retry or RetryPolicy()
+        self._ssl = ssl_context
+        self._limits: Dict[str, int] = {}
+        self._states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def set_limit(self, key: str, limit: int) -> None:
+        """Cap concurrent requests for `key` (a provider name); applies to new loops."""
+        if limit < 1:
+            raise ValueError("concurrency limit must be >= 1")
+        self._limits[key] = limit
+
+    def _state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._states.get(loop)
+            if state is None:
+                state = self._states[loop] = _LoopState()
+            return state
+
+    def _limiter(self, state: _LoopState, key: str) -> asyncio.Semaphore:
+        limiter = state.limits.get(key)
+        if limiter is None:
+            limiter = state.limits[key] = asyncio.Semaphore(self._limits.get(key, DEFAULT_PROVIDER_CONCURRENCY))
+        return limiter
+
+    def _pool(self, state: _LoopState, origin: Origin) -> _OriginPool:
+        pool = state.pools.get(origin)
+        if pool is None:
+            context = self._ssl_context() if origin[0] == "https" else None
+            pool = state.pools[origin] = _OriginPool(origin, self.pool_size, context)
+        return pool
+
+    def _ssl_context(self) -> ssl.SSLContext:
+        # Built lazily: loading the CA bundle is the slowest part of import.
+        with self._lock:
+            if self._ssl is None:
+                self._ssl = ssl.create_default_context()
+            return self._ssl
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json_body: Any = None,
+        headers: Dict[str, str] | None = None,
+        limit_key: str = "default",
+    ) -> HTTPResponse:
+        """
+        Send a request, retrying 429/5xx and connection errors with backoff.
+
+        Errors after the request was written are retried only when it is safe
+        to replay (see `IDEMPOTENT_METHODS`; or pass an `Idempotency-Key`
+        header). The final response is returned whatever its status; call
+        `raise_for_status()` to turn error statuses into `TransportError`.
+        """
+        origin, payload = _encode_request(method, url, json_body, headers)
+        state = self._state()
+        pool = self._pool(state, origin)
+        limiter = self._limiter(state, limit_key)
+        replayable = _replayable(method, headers)
+        attempt = 0
+        while True:
+            progress = _Attempt()
+            try:
+                async with limiter:
+                    response = await asyncio.wait_for(self._exchange(pool, payload, method, progress), self.timeout)
+            except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError) as exc:
+                if progress.sent and not replayable:
+                    raise TransportError(f"{method} {url} failed after the request was sent (not retried): {exc!r}") from exc
+                if attempt + 1 >= self.retry.max_attempts:
+                    raise TransportError(f"{method} {url} failed after {attempt + 1} attempts: {exc!r}") from exc
+                _RETRIES.labels(limit_key, type(exc).__name__).inc()
+                delay = self.retry.backoff(attempt)
+            else:
+                if response.status not in self.retry.retry_statuses or attempt + 1 >= self.retry.max_attempts:
+                    return response
+                _RETRIES.labels(limit_key, str(response.status)).inc()
+                delay = self.retry.backoff(attempt, response.headers.get("retry-after"))
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        json_body: Any = None,
+        headers: Dict[str, str] | None = None,
+        limit_key: str = "default",
+    ) -> AsyncIterator[bytes]:
+        """
+        Like `request`, but yield the response body as it arrives.
+
+        Retries happen only before the first byte is yielded. Error statuses
+        raise `TransportError`. The provider slot and the connection are held
+        until the body is exhausted or the iterator is closed.
+        """
+        origin, payload = _encode_request(method, url, json_body, headers)
+        state = self._state()
+        pool = self._pool(state, origin)
+        limiter = self._limiter(state, limit_key)
+        replayable = _replayable(method, headers)
+        attempt = 0
+        while True:
+            progress = _Attempt()
+            async with limiter:
+                try:
+                    conn, status, response_headers, keep_alive = await asyncio.wait_for(
+                        self._open(pool, payload, progress), self.timeout
+                    )
+                except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError) as exc:
+                    if progress.sent and not replayable:
+                        raise TransportError(
+                            f"{method} {url} failed after the request was sent (not retried): {exc!r}"
+                        ) from exc
+                    if attempt + 1 >= self.retry.max_attempts:
+                        raise TransportError(f"{method} {url} failed after {attempt + 1} attempts: {exc!r}") from exc
+                    _RETRIES.labels(limit_key, type(exc).__name__).inc()
+                    delay = self.retry.backoff(attempt)
+                else:
+                    try:
+                        body = _iter_body(conn.reader, status, response_headers, method)
+                        if status < 400:
+                            async for chunk in body:
+                                yield chunk
+                            return
+                        response = HTTPResponse(status, response_headers, b"".join([chunk async for chunk in body]))
+                        if status not in self.retry.retry_statuses or attempt + 1 >= self.retry.max_attempts:
+                            response.raise_for_status()
+                        _RETRIES.labels(limit_key, str(status)).inc()
+                        delay = self.retry.backoff(attempt, response_headers.get("retry-after"))
+                    except BaseException:
+                        keep_alive = False
+                        raise
+                    finally:
+                        pool.release(conn, keep_alive)
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _exchange(self, pool: _OriginPool, payload: bytes, method: str, attempt: _Attempt) -> HTTPResponse:
+        conn, status, headers, keep_alive = await self._open(pool, payload, attempt)
+        try:
+            body = b"".join([chunk async for chunk in _iter_body(conn.reader, status, headers, method)])
+        except BaseException:
+            keep_alive = False
+            raise
+        finally:
+            pool.release(conn, keep_alive)
+        return HTTPResponse(status=status, headers=headers, body=body)
+
+    async def _open(
+        self, pool: _OriginPool, payload: bytes, attempt: _Attempt
+    ) -> Tuple[_Connection, int, Dict[str, str], bool]:
+        """Send `payload` on a pooled connection and read the response head."""
+        conn, reused = await pool.acquire()
+        try:
+            try:
+                return (conn, *await _send(conn, payload, attempt))
+            except (ConnectionError, asyncio.IncompleteReadError):
+                if not reused:
+                    raise
+                # The server closed an idle pooled connection before reading the
+                # request; resend once on a fresh one.
+                conn.close()
+                conn = await pool.connect()
+                attempt.sent = False
+                return (conn, *await _send(conn, payload, attempt))
+        except BaseException:
+            pool.release(conn, False)
+            raise
+
+    def run_sync(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run `coro` on the transport's background loop and wait for it."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._background_loop())
+        scope = current_scope()
+        if scope is None:
+            return future.result()
+        with scope.on_cancel(future.cancel):
+            try:
+                return future.result(timeout=scope.remaining())
+            except FutureTimeoutError:
+                future.cancel()
+                raise DeadlineExceeded("deadline exceeded waiting for provider") from None
+            except FutureCancelledError:
+                scope.raise_if_cancelled()
+                raise
+
+    def _background_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="algent-transport", daemon=True).start()
+                self._loop = loop
+            return self._loop
+
+    async def aclose(self) -> None:
+        """Close idle connections held for the running loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._states.pop(loop, None)
+        for pool in (state.pools.values() if state else ()):
+            pool.close()
+
+    def close(self) -> None:
+        """Close the background loop's connections and stop it."""
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is not None:
+            asyncio.run_coroutine_threadsafe(self.aclose(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+
+
+_TRANSPORT = AsyncTransport()
+
+
+def get_transport() -> AsyncTransport:
+    """Process-wide transport shared by the built-in providers."""
+    return _TRANSPORT
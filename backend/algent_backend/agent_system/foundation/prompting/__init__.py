@@ -2,4 +2,4 @@
 Prompt utilities shared across loops and labs.
 """
 
-from .prompt_builder import PromptBuilder  # noqa: F401
+from .prompt_builder import PromptBuilder, RenderedPrompt  # noqa: F401
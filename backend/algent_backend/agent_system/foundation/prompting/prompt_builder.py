@@ -1,8 +1,23 @@
 """
 Composable prompt builder.
+
+Components are compiled once into literal and placeholder segments (and
+recompiled only when the component texts change). Everything before the first
+placeholder is the static prefix: it is rendered at compile time and reused on
+every call, so a step only formats its dynamic fields. `render_parts` exposes
+the prefix boundary so providers with prompt caching can mark it (see
+`cache_prefix` in `models/providers`); keep stable components (system text,
+tool descriptions) first to make the prefix as long as possible.
 """
+from __future__ import annotations
+
 from dataclasses import dataclass, field
-from typing import Dict, List
+import string
+from typing import Any, Dict, List, Tuple
+
+from algent_backend.telemetry import span
+
+_FORMATTER = string.Formatter()
 
 
 @dataclass
@@ -13,18 +28,91 @@ class PromptComponent:
     text: str
 
 
+@dataclass(frozen=True)
+class _Field:
+    name: str
+    conversion: str | None
+    spec: str
+
+
+_Segment = str | _Field
+_Compiled = Tuple[Tuple[str, ...], str, List[_Segment]]  # (source texts, static prefix, remaining segments)
+
+
+@dataclass(frozen=True)
+class RenderedPrompt:
+    """A rendered prompt split at the end of its static prefix."""
+
+    prefix: str
+    suffix: str
+
+    @property
+    def text(self) -> str:
+        return self.prefix + self.suffix
+
+    @property
+    def prefix_length(self) -> int:
+        return len(self.prefix)
+
+
+def _compile(texts: Tuple[str, ...]) -> _Compiled:
+    segments: List[_Segment] = []
+    literal: List[str] = []
+    for index, text in enumerate(texts):
+        if index:
+            literal.append("\n")
+        for chunk, name, spec, conversion in _FORMATTER.parse(text):
+            literal.append(chunk)
+            if name is None:
+                continue
+            if literal:
+                segments.append("".join(literal))
+                literal = []
+            segments.append(_Field(name, conversion, spec or ""))
+    if literal:
+        segments.append("".join(literal))
+    prefix = segments.pop(0) if segments and isinstance(segments[0], str) else ""
+    return texts, prefix, segments
+
+
 @dataclass
 class PromptBuilder:
     """Assemble prompts dynamically from registered components."""
 
     components: List[PromptComponent] = field(default_factory=list)
+    _compiled: _Compiled | None = field(default=None, init=False, repr=False, compare=False)
 
     def add(self, key: str, text: str) -> None:
         self.components.append(PromptComponent(key, text))
 
-    def render(self, context: Dict[str, str] | None = None) -> str:
+    @property
+    def static_prefix(self) -> str:
+        """Rendered text shared by every call (up to the first placeholder)."""
+        return self._compile()[1]
+
+    def render(self, context: Dict[str, Any] | None = None) -> str:
+        return self.render_parts(context).text
+
+    def render_parts(self, context: Dict[str, Any] | None = None) -> RenderedPrompt:
+        with span("prompt.render", components=len(self.components)):
+            return self._render(context)
+
+    def _render(self, context: Dict[str, Any] | None) -> RenderedPrompt:
+        _, prefix, segments = self._compile()
         context = context or {}
         rendered = []
-        for component in self.components:
-            rendered.append(component.text.format(**context))
-        return "\n".join(rendered)
+        for segment in segments:
+            if isinstance(segment, str):
+                rendered.append(segment)
+                continue
+            value, _ = _FORMATTER.get_field(segment.name, (), context)
+            value = _FORMATTER.convert_field(value, segment.conversion)
+            spec = _FORMATTER.vformat(segment.spec, (), context) if "{" in segment.spec else segment.spec
+            rendered.append(format(value, spec))
+        return RenderedPrompt(prefix, "".join(rendered))
+
+    def _compile(self) -> _Compiled:
+        texts = tuple(component.text for component in self.components)
+        if self._compiled is None or self._compiled[0] != texts:
+            self._compiled = _compile(texts)
+        return self._compiled
@@ -2,5 +2,5 @@
 Integration layer for tools and response parsing.
 """
 
-from .tool_registry import ToolRegistry  # noqa: F401
+from .tool_registry import ToolCall, ToolRegistry, ToolResult  # noqa: F401
 from .response_parser import ResponseParser  # noqa: F401
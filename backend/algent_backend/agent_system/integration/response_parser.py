@@ -1,8 +1,31 @@
 """
 Normalizes model outputs or tool responses.
+
+`ResponseParser.parse` handles a finished response. For streamed completions,
+`ResponseParser.incremental()` returns a parser that consumes text chunks and
+emits structured events as soon as each one is complete:
+
+- a `field` event when a line such as `Action: search` ends (field names are
+  configurable; ReAct-style names by default);
+- a `tool_call` event when a JSON object starting a line closes and carries a
+  `tool` key, e.g. `{"tool": "search", "arguments": {"q": "x"}}`; other JSON
+  objects are emitted as `object` events.
+
+Only the current line or JSON object is buffered, never the whole response.
+A line-leading `{` that turns out not to be JSON (a raw newline inside a
+string, a field line such as `Thought:` inside the braces, more than
+`max_object_chars` buffered, or the stream closing first) is replayed as
+plain text, so later fields are still recognised.
 """
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import Any, Dict
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Sequence
+
+
+DEFAULT_FIELDS = ("Thought", "Action", "Action Input", "Observation", "Final Answer")
+MAX_OBJECT_CHARS = 64 * 1024
 
 
 @dataclass
@@ -13,9 +36,160 @@ class ParsedResponse:
     metadata: Dict[str, Any]
 
 
+@dataclass
+class StreamEvent:
+    """One structured element recognised in a streamed response."""
+
+    kind: str  # "field", "tool_call" or "object"
+    name: str
+    value: Any
+
+
+def _decode_value(text: str) -> Any:
+    """Field values that are valid JSON (e.g. `Action Input: {...}`) are decoded."""
+    if text[:1] in "{[":
+        try:
+            return json.loads(text)
+        except ValueError:
+            pass
+    return text
+
+
+class IncrementalParser:
+    """
+    Push-based parser: `feed` chunks, collect events, then `close`.
+
+    `keep_content=True` also accumulates the raw text for `close()`; by default
+    only the metadata (fields and tool calls) is retained.
+    """
+
+    def __init__(
+        self,
+        fields: Sequence[str] = DEFAULT_FIELDS,
+        keep_content: bool = False,
+        max_object_chars: int = MAX_OBJECT_CHARS,
+    ) -> None:
+        # Longest names first so "Action Input" wins over "Action".
+        self._fields = sorted(fields, key=len, reverse=True)
+        self._keep_content = keep_content
+        self._max_object_chars = max_object_chars
+        self._content: List[str] = []
+        self._line: List[str] = []
+        self._object: List[str] = []
+        self._object_line = 0  # index in `_object` where its current line starts
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self.fields: Dict[str, Any] = {}
+        self.tool_calls: List[Dict[str, Any]] = []
+
+    def feed(self, chunk: str) -> List[StreamEvent]:
+        events: List[StreamEvent] = []
+        if self._keep_content:
+            self._content.append(chunk)
+        self._feed_text(chunk, events)
+        return events
+
+    def close(self) -> tuple[List[StreamEvent], ParsedResponse]:
+        """Flush a pending object and the trailing line; returns (final events, parsed response)."""
+        events: List[StreamEvent] = []
+        if self._depth:
+            self._abandon_object(events)
+        self._end_line(events)
+        metadata = {"fields": dict(self.fields), "tool_calls": list(self.tool_calls)}
+        return events, ParsedResponse(content="".join(self._content), metadata=metadata)
+
+    def _feed_text(self, text: str, events: List[StreamEvent]) -> None:
+        for char in text:
+            if self._depth:
+                self._feed_object(char, events)
+            elif char == "{" and not "".join(self._line).strip():
+                self._line.clear()
+                self._object.append(char)
+                self._object_line = 0
+                self._depth = 1
+            elif char == "\n":
+                self._end_line(events)
+            else:
+                self._line.append(char)
+
+    def _feed_object(self, char: str, events: List[StreamEvent]) -> None:
+        self._object.append(char)
+        if char == "\n":
+            # JSON strings cannot hold a raw newline, and a field line inside the
+            # braces means the `{` was prose; either way stop waiting for `}`.
+            line = "".join(self._object[self._object_line :]).strip()
+            self._object_line = len(self._object)
+            if self._in_string or self._field_of(line):
+                self._abandon_object(events)
+                return
+        if len(self._object) > self._max_object_chars:
+            self._abandon_object(events)
+        elif self._in_string:
+            if self._escaped:
+                self._escaped = False
+            elif char == "\\":
+                self._escaped = True
+            elif char == '"':
+                self._in_string = False
+        elif char == '"':
+            self._in_string = True
+        elif char == "{":
+            self._depth += 1
+        elif char == "}":
+            self._depth -= 1
+            if not self._depth:
+                text = "".join(self._object)
+                self._object.clear()
+                self._emit_object(text, events)
+
+    def _abandon_object(self, events: List[StreamEvent]) -> None:
+        text = "".join(self._object)
+        self._object.clear()
+        self._depth = 0
+        self._in_string = self._escaped = False
+        self._replay(text, events)
+
+    def _replay(self, text: str, events: List[StreamEvent]) -> None:
+        """Re-read a buffered `{...` as plain text; its own `{` no longer opens an object."""
+        self._line.append(text[0])
+        self._feed_text(text[1:], events)
+
+    def _emit_object(self, text: str, events: List[StreamEvent]) -> None:
+        try:
+            value = json.loads(text)
+        except ValueError:
+            self._replay(text, events)  # not JSON after all; treat as plain text
+            return
+        if isinstance(value, dict) and "tool" in value:
+            call = {"tool": value["tool"], "arguments": value.get("arguments", {})}
+            self.tool_calls.append(call)
+            events.append(StreamEvent(kind="tool_call", name=str(value["tool"]), value=call))
+        else:
+            events.append(StreamEvent(kind="object", name="", value=value))
+
+    def _field_of(self, line: str) -> str | None:
+        for name in self._fields:
+            if line.startswith(name + ":"):
+                return name
+        return None
+
+    def _end_line(self, events: List[StreamEvent]) -> None:
+        line = "".join(self._line).strip()
+        self._line.clear()
+        name = self._field_of(line)
+        if name is not None:
+            value = _decode_value(line[len(name) + 1 :].strip())
+            self.fields[name] = value
+            events.append(StreamEvent(kind="field", name=name, value=value))
+
+
 class ResponseParser:
     """Placeholder parser; extend with Pydantic or JSON schema validation later."""
 
+    def __init__(self, fields: Sequence[str] = DEFAULT_FIELDS) -> None:
+        self.fields = tuple(fields)
+
     def parse(self, raw: str | dict) -> ParsedResponse:
         if isinstance(raw, dict):
             content = raw.get("content", "")
@@ -24,3 +198,22 @@ class ResponseParser:
             content = raw
             metadata = {}
         return ParsedResponse(content=content, metadata=metadata)
+
+    def incremental(self, keep_content: bool = False) -> IncrementalParser:
+        return IncrementalParser(self.fields, keep_content=keep_content)
+
+    def parse_stream(self, chunks: Iterable[str]) -> Iterator[StreamEvent]:
+        """Yield events from a chunk iterator (e.g. `provider.stream(...)`)."""
+        parser = self.incremental()
+        for chunk in chunks:
+            yield from parser.feed(chunk)
+        yield from parser.close()[0]
+
+    async def aparse_stream(self, chunks: AsyncIterable[str]) -> AsyncIterator[StreamEvent]:
+        """Async `parse_stream` for `provider.astream(...)`."""
+        parser = self.incremental()
+        async for chunk in chunks:
+            for event in parser.feed(chunk):
+                yield event
+        for event in parser.close()[0]:
+            yield event
@@ -1,25 +1,298 @@
 """
 Tool registry for agent actions.
+
+Besides `get` (the raw callable), the registry executes tool calls itself:
+`execute(calls)` submits every call at once, to a shared thread pool or, for
+CPU-bound tools registered with `executor="process"`, a process pool, and
+collects one `ToolResult` per call in order. A tool's `timeout` bounds how long
+the step waits for it (a timed-out call keeps running in its worker; pools
+cannot interrupt it) and is further capped by the loop's `CancelScope`
+deadline. Results of tools registered with `pure=True` are memoized by
+arguments in a bounded LRU, and identical pure calls in one batch run once.
+
+Tools can be registered as callables or as `"package.module:function"` import
+paths, imported on first use; process tools must be module-level functions so
+workers can import them. Built-ins (`BUILTIN_TOOLS`) include Algo Lab's sorting
+experiment as a process-pool tool and News Hub's BM25 search.
 """
-from typing import Callable, Dict
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from importlib import import_module
+import json
+import multiprocessing
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple
+
+from algent_backend.telemetry import get_tracer, span
+
+from ..foundation.cancellation import current_scope
 
 
 Tool = Callable[..., dict]
 
+EXECUTORS = ("thread", "process")
+DEFAULT_MEMO_SIZE = 256
+
+BUILTIN_TOOLS: Dict[str, Tuple[str, Dict[str, Any]]] = {
+    "algo_lab.run_sorting": (
+        "algent_backend.labs.algo_lab.service:run_sorting_tool",
+        {"executor": "process", "timeout": 120.0},
+    ),
+    "news_hub.search": (
+        "algent_backend.labs.news_hub.index:search_tool",
+        {"executor": "thread", "timeout": 5.0},
+    ),
+}
+
+_MISS = object()
+
+
+@dataclass
+class ToolSpec:
+    """A registered tool and how to run it."""
+
+    name: str
+    tool: Tool | str
+    executor: str = "thread"
+    timeout: float | None = None
+    pure: bool = False
+
+
+@dataclass
+class ToolCall:
+    """One requested invocation (the parser's `{"tool", "arguments"}` shape)."""
+
+    name: str
+    arguments: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class ToolResult:
+    """Outcome of one call: `value` on success, otherwise `error`."""
+
+    call: ToolCall
+    value: Any = None
+    error: BaseException | None = None
+    elapsed: float = 0.0
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _import_tool(path: str) -> Tool:
+    module_path, _, attribute = path.partition(":")
+    if not attribute:
+        raise ValueError(f"Tool path '{path}' must look like 'package.module:function'")
+    return getattr(import_module(module_path), attribute)
+
+
+def _as_call(call: ToolCall | Mapping[str, Any]) -> ToolCall:
+    if isinstance(call, ToolCall):
+        return call
+    return ToolCall(name=call["tool"], arguments=dict(call.get("arguments") or {}))
+
+
+def _timed(name: str, tool: Tool, arguments: Dict[str, Any]) -> Tuple[Any, float]:
+    # Module level so process workers can unpickle it. Worker processes do not
+    # trace; the parent records their span from the measured duration.
+    started = time.perf_counter()
+    with span("tool.call", tool=name):
+        value = tool(**arguments)
+    return value, time.perf_counter() - started
+
+
+def _record_process_span(tracer, name: str, thread_id: int, future: Future) -> None:
+    # Runs on the pool's management thread; attribute the span to the caller.
+    if future.cancelled() or future.exception() is not None:
+        return
+    end = time.perf_counter_ns()
+    start = end - int(future.result()[1] * 1e9)
+    tracer.record("tool.call", start, end, thread_id=thread_id, tool=name, executor="process")
+
 
 class ToolRegistry:
     """Registers callable tools accessible to agents."""
 
-    def __init__(self) -> None:
-        self._tools: Dict[str, Tool] = {}
+    def __init__(
+        self,
+        register_defaults: bool = True,
+        max_threads: int | None = None,
+        max_processes: int | None = None,
+        memo_size: int = DEFAULT_MEMO_SIZE,
+    ) -> None:
+        self._tools: Dict[str, ToolSpec] = {}
+        self.max_threads = max_threads
+        self.max_processes = max_processes
+        self.memo_size = memo_size
+        self._memo: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._pools: Dict[str, Executor] = {}
+        self._lock = threading.Lock()
+        if register_defaults:
+            for name, (path, options) in BUILTIN_TOOLS.items():
+                self.register(name, path, **options)
 
-    def register(self, name: str, tool: Tool) -> None:
-        self._tools[name] = tool
+    def register(
+        self,
+        name: str,
+        tool: Tool | str,
+        *,
+        executor: str = "thread",
+        timeout: float | None = None,
+        pure: bool = False,
+    ) -> None:
+        if executor not in EXECUTORS:
+            raise ValueError(f"unknown executor '{executor}'; expected one of {EXECUTORS}")
+        self._tools[name] = ToolSpec(name, tool, executor, timeout, pure)
+        self._forget(name)
 
-    def get(self, name: str) -> Tool:
+    def spec(self, name: str) -> ToolSpec:
         if name not in self._tools:
             raise KeyError(f"tool '{name}' not registered")
         return self._tools[name]
 
+    def get(self, name: str) -> Tool:
+        spec = self.spec(name)
+        if isinstance(spec.tool, str):
+            spec.tool = _import_tool(spec.tool)
+        return spec.tool
+
     def list_tools(self) -> list[str]:
         return sorted(self._tools.keys())
+
+    def call(self, name: str, **arguments: Any) -> Any:
+        """Run one tool through the registry's pools; raises its error."""
+        result = self.execute([ToolCall(name, arguments)])[0]
+        if result.error is not None:
+            raise result.error
+        return result.value
+
+    def execute(self, calls: Iterable[ToolCall | Mapping[str, Any]]) -> List[ToolResult]:
+        """Run independent calls concurrently; results come back in call order."""
+        calls = [_as_call(call) for call in calls]
+        with span("tool.execute", calls=len(calls)):
+            return self._execute(calls)
+
+    def _execute(self, calls: List[ToolCall]) -> List[ToolResult]:
+        started = time.monotonic()
+        results: List[ToolResult | None] = [None] * len(calls)
+        pending: List[Tuple[int, ToolSpec, Tuple[str, str] | None, Future]] = []
+        inflight: Dict[Tuple[str, str], Future] = {}
+        for index, call in enumerate(calls):
+            try:
+                spec = self.spec(call.name)
+                key = self._memo_key(call) if spec.pure else None
+                value = self._memo_get(key) if key is not None else _MISS
+                if value is not _MISS:
+                    results[index] = ToolResult(call, value=value, cached=True)
+                    continue
+                future = inflight.get(key) if key is not None else None
+                if future is None:
+                    future = self._submit(spec, call)
+                    if key is not None:
+                        inflight[key] = future
+            except Exception as exc:  # unknown tool, bad import, pool shut down
+                results[index] = ToolResult(call, error=exc)
+                continue
+            pending.append((index, spec, key, future))
+
+        scope = current_scope()
+        for index, spec, key, future in pending:
+            call = calls[index]
+            try:
+                value, elapsed = future.result(self._wait_budget(spec, started, scope))
+            except FutureTimeout:
+                future.cancel()
+                if scope is not None:
+                    scope.raise_if_cancelled()
+                results[index] = ToolResult(
+                    call,
+                    error=TimeoutError(f"tool '{spec.name}' timed out after {spec.timeout}s"),
+                    elapsed=time.monotonic() - started,
+                )
+            except Exception as exc:
+                results[index] = ToolResult(call, error=exc, elapsed=time.monotonic() - started)
+            else:
+                if key is not None:
+                    self._memo_put(key, value)
+                results[index] = ToolResult(call, value=value, elapsed=elapsed)
+        return results
+
+    async def aexecute(self, calls: Iterable[ToolCall | Mapping[str, Any]]) -> List[ToolResult]:
+        """`execute` for async loops (waits in a worker thread, not on the event loop)."""
+        return await asyncio.to_thread(self.execute, list(calls))
+
+    def clear_memo(self) -> None:
+        with self._lock:
+            self._memo.clear()
+
+    def close(self) -> None:
+        """Shut down the worker pools (they are recreated on next use)."""
+        with self._lock:
+            pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, spec: ToolSpec, call: ToolCall) -> Future:
+        tool = self.get(spec.name)
+        pool = self._pool(spec.executor)
+        if spec.executor == "thread":
+            # Run under a copy of the caller's context so spans nest under this step.
+            return pool.submit(copy_context().run, _timed, spec.name, tool, call.arguments)
+        future = pool.submit(_timed, spec.name, tool, call.arguments)
+        tracer = get_tracer()
+        if tracer is not None:
+            context, caller = copy_context(), threading.get_ident()
+            future.add_done_callback(lambda done: context.run(_record_process_span, tracer, spec.name, caller, done))
+        return future
+
+    def _pool(self, kind: str) -> Executor:
+        with self._lock:
+            pool = self._pools.get(kind)
+            if pool is None:
+                if kind == "process":
+                    # Spawned workers: forking a process that runs transport/pool threads can deadlock.
+                    pool = ProcessPoolExecutor(self.max_processes, mp_context=multiprocessing.get_context("spawn"))
+                else:
+                    pool = ThreadPoolExecutor(self.max_threads, thread_name_prefix="algent-tool")
+                self._pools[kind] = pool
+            return pool
+
+    @staticmethod
+    def _wait_budget(spec: ToolSpec, started: float, scope) -> float | None:
+        budget = None if spec.timeout is None else max(0.0, started + spec.timeout - time.monotonic())
+        remaining = scope.remaining() if scope is not None else None
+        if remaining is not None and (budget is None or remaining < budget):
+            budget = remaining
+        return budget
+
+    @staticmethod
+    def _memo_key(call: ToolCall) -> Tuple[str, str]:
+        return call.name, json.dumps(call.arguments, sort_keys=True, separators=(",", ":"), default=repr)
+
+    def _memo_get(self, key: Tuple[str, str]) -> Any:
+        with self._lock:
+            value = self._memo.get(key, _MISS)
+            if value is not _MISS:
+                self._memo.move_to_end(key)
+            return value
+
+    def _memo_put(self, key: Tuple[str, str], value: Any) -> None:
+        with self._lock:
+            self._memo[key] = value
+            self._memo.move_to_end(key)
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+
+    def _forget(self, name: str) -> None:
+        with self._lock:
+            for key in [key for key in self._memo if key[0] == name]:
+                del self._memo[key]
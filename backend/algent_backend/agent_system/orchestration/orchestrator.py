@@ -1,19 +1,143 @@
 """
-Multi-agent orchestration placeholder.
+Multi-agent orchestration.
+
+`Orchestrator.run_all` fans loops out concurrently (worker threads by default,
+or asyncio tasks with `mode="async"`), at most `max_concurrency` at a time, and
+fans their `ConversationState`s back in, in loop order. Each loop gets its own
+`CancelScope`: `loop_timeout` bounds how long it may run and `cancel()` stops
+every loop, in both cases aborting in-flight provider calls. A loop that times
+out, is cancelled or raises keeps its partial state with a final log entry
+saying so; the other loops are unaffected.
 """
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from typing import List
+import threading
+from typing import Callable, List, Sequence
 
 from ..foundation.agents.agent_loop import AgentLoop
+from ..foundation.agents.state_manager import ConversationState
+from ..foundation.cancellation import CancelScope, DeadlineExceeded, LoopCancelled
+
+RUN_MODES = ("thread", "async")
+DEFAULT_MAX_CONCURRENCY = 8
 
 
 @dataclass
 class Orchestrator:
-    """Runs multiple loops (possibly in parallel later)."""
+    """Runs multiple loops concurrently and collects their states."""
 
     loops: List[AgentLoop] = field(default_factory=list)
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    loop_timeout: float | None = None
+    mode: str = "thread"
+    _cancel_hooks: List[Callable[[], None]] = field(default_factory=list, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def run_all(self, states: Sequence[ConversationState] | None = None) -> List[ConversationState]:
+        """Run every loop and return their states in loop order."""
+        if self.mode not in RUN_MODES:
+            raise ValueError(f"unknown run mode '{self.mode}'; expected one of {RUN_MODES}")
+        if self.mode == "async":
+            return asyncio.run(self.arun_all(states))
+        states = self._initial_states(states)
+        scopes = [self._new_scope() for _ in self.loops]
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="algent-loop")
+        try:
+            futures = [
+                executor.submit(self._run_loop, loop, state, scope)
+                for loop, state, scope in zip(self.loops, states, scopes)
+            ]
+            self._on_cancel(lambda: [future.cancel() for future in futures])
+            wait(futures)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._clear_cancel_hooks()
+        for loop, state, future in zip(self.loops, states, futures):
+            if future.cancelled():  # cancelled before a worker picked it up
+                state.log(f"Loop {loop.name} cancelled")
+        return states
+
+    async def arun_all(self, states: Sequence[ConversationState] | None = None) -> List[ConversationState]:
+        """Run every loop as an asyncio task and return their states in loop order."""
+        states = self._initial_states(states)
+        limiter = asyncio.Semaphore(self.max_concurrency)
+        loop = asyncio.get_running_loop()
+
+        async def run_one(agent_loop: AgentLoop, state: ConversationState, scope: CancelScope) -> None:
+            try:
+                await limiter.acquire()
+            except asyncio.CancelledError:  # cancelled while queued for a slot
+                state.log(f"Loop {agent_loop.name} cancelled")
+                return
+            try:
+                if scope.cancelled:
+                    state.log(f"Loop {agent_loop.name} cancelled")
+                    return
+                scope.start(self.loop_timeout)
+                with scope.activate():
+                    try:
+                        await asyncio.wait_for(agent_loop.arun(state), self.loop_timeout)
+                    except (asyncio.TimeoutError, DeadlineExceeded):
+                        scope.cancel()  # stop provider calls still running in worker threads
+                        state.log(f"Loop {agent_loop.name} timed out after {self.loop_timeout}s")
+                    except (asyncio.CancelledError, LoopCancelled):
+                        scope.cancel()
+                        state.log(f"Loop {agent_loop.name} cancelled")
+                    except Exception as exc:
+                        state.log(f"Loop {agent_loop.name} failed: {exc!r}")
+            finally:
+                limiter.release()
+
+        tasks = []
+        for agent_loop, state in zip(self.loops, states):
+            scope = self._new_scope()
+            task = asyncio.create_task(run_one(agent_loop, state, scope))
+            self._on_cancel(lambda task=task: loop.call_soon_threadsafe(task.cancel))
+            tasks.append(task)
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            self._clear_cancel_hooks()
+        return states
+
+    def cancel(self) -> None:
+        """Cancel a running `run_all`/`arun_all` (safe to call from any thread)."""
+        with self._lock:
+            hooks = list(self._cancel_hooks)
+        for hook in hooks:
+            hook()
+
+    def _run_loop(self, loop: AgentLoop, state: ConversationState, scope: CancelScope) -> None:
+        scope.start(self.loop_timeout)
+        with scope.activate():
+            try:
+                loop.run(state)
+            except DeadlineExceeded:
+                state.log(f"Loop {loop.name} timed out after {self.loop_timeout}s")
+            except LoopCancelled:
+                state.log(f"Loop {loop.name} cancelled")
+            except Exception as exc:
+                state.log(f"Loop {loop.name} failed: {exc!r}")
+
+    def _initial_states(self, states: Sequence[ConversationState] | None) -> List[ConversationState]:
+        if states is None:
+            return [ConversationState() for _ in self.loops]
+        if len(states) != len(self.loops):
+            raise ValueError("expected one state per loop")
+        return list(states)
+
+    def _new_scope(self) -> CancelScope:
+        scope = CancelScope()
+        self._on_cancel(scope.cancel)
+        return scope
+
+    def _on_cancel(self, hook: Callable[[], None]) -> None:
+        with self._lock:
+            self._cancel_hooks.append(hook)
 
-    def run_all(self) -> None:
-        """Run each registered loop sequentially."""
-        for loop in self.loops:
-            loop.run()
+    def _clear_cancel_hooks(self) -> None:
+        with self._lock:
+            self._cancel_hooks.clear()
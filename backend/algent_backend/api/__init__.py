@@ -4,5 +4,5 @@ API layer stubs.
 Swap this with a web framework router later. Keep handlers transport-agnostic
 where possible.
 """
-from .routes import health  # noqa: F401
+from .routes import dispatch_command, health  # noqa: F401
 
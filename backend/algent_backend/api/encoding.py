@@ -0,0 +1,188 @@
+"""
+Response encodings and content negotiation.
+
+Large experiment payloads are mostly numeric arrays, which JSON turns into long
+decimal text. Two independent knobs shrink them:
+
+- `Accept: application/x-algent-frame` selects a binary frame where numeric
+  arrays are stored as little-endian typed arrays (`i1`, `i2`, `i4`, `i8`,
+  `f8`, using the narrowest integer type that fits) that a browser can view
+  directly with `Int8Array`/`Int16Array`/`Int32Array`/... .
+- `Accept-Encoding: gzip|deflate` compresses whichever body was chosen.
+
+Frame layout (all integers little-endian)::
+
+    b"ALGF" | u8 version | 3 bytes padding | u32 header_len | header | arrays
+
+`header` is UTF-8 JSON: `{"payload": ..., "arrays": [{"dtype", "length",
+"offset"}, ...]}`, where each extracted array in `payload` is replaced by
+`{"$array": index}`. The header is space-padded so the array section starts on
+an 8-byte boundary right after it; array offsets are relative to that section
+and 8-byte aligned, so typed-array views need no copy.
+"""
+from __future__ import annotations
+
+from array import array
+import json
+import struct
+import sys
+from typing import Any, Dict, List, Tuple
+import zlib
+
+
+JSON_CONTENT_TYPE = "application/json"
+FRAME_CONTENT_TYPE = "application/x-algent-frame"
+
+FRAME_MAGIC = b"ALGF"
+FRAME_VERSION = 1
+_FRAME_PREFIX = struct.Struct("<4sB3xI")
+
+# Arrays shorter than this stay inline; the descriptor would cost more than it saves.
+MIN_ARRAY_LENGTH = 16
+# Bodies smaller than this are not worth compressing.
+MIN_COMPRESS_BYTES = 1024
+
+_TYPECODES = {"i1": "b", "i2": "h", "i4": "i", "i8": "q", "f8": "d"}
+_INT_RANGES = (
+    ("i1", -(2**7), 2**7 - 1),
+    ("i2", -(2**15), 2**15 - 1),
+    ("i4", -(2**31), 2**31 - 1),
+    ("i8", -(2**63), 2**63 - 1),
+)
+
+
+def _parse_header_values(header: str | None) -> Dict[str, float]:
+    """Parse `a, b;q=0.5` style headers into {value: quality}."""
+    values: Dict[str, float] = {}
+    for item in (header or "").split(","):
+        parts = [part.strip() for part in item.split(";")]
+        if not parts[0]:
+            continue
+        quality = 1.0
+        for param in parts[1:]:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        values[parts[0].lower()] = quality
+    return values
+
+
+def negotiate(accept: str | None, accept_encoding: str | None) -> Tuple[str, str | None]:
+    """Pick (content_type, content_encoding) for a response."""
+    accepted = _parse_header_values(accept)
+    content_type = FRAME_CONTENT_TYPE if accepted.get(FRAME_CONTENT_TYPE, 0) > 0 else JSON_CONTENT_TYPE
+    encodings = _parse_header_values(accept_encoding)
+    content_encoding = None
+    for candidate in ("gzip", "deflate"):
+        if encodings.get(candidate, 0) > 0:
+            content_encoding = candidate
+            break
+    return content_type, content_encoding
+
+
+def _dtype_for(values: List[Any]) -> str | None:
+    if len(values) < MIN_ARRAY_LENGTH:
+        return None
+    if all(type(value) is int for value in values):
+        low, high = min(values), max(values)
+        for dtype, minimum, maximum in _INT_RANGES:
+            if minimum <= low and high <= maximum:
+                return dtype
+        return None
+    if all(type(value) in (int, float) for value in values):
+        return "f8"
+    return None
+
+
+def _extract(value: Any, arrays: List[Tuple[str, List[Any]]]) -> Any:
+    if isinstance(value, dict):
+        return {key: _extract(item, arrays) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        dtype = _dtype_for(value) if isinstance(value, list) else None
+        if dtype:
+            arrays.append((dtype, value))
+            return {"$array": len(arrays) - 1}
+        return [_extract(item, arrays) for item in value]
+    return value
+
+
+def _pad(size: int) -> int:
+    return (-size) % 8
+
+
+def encode_frame(payload: Any) -> bytes:
+    """Encode `payload` as a binary frame (see module docstring)."""
+    arrays: List[Tuple[str, List[Any]]] = []
+    stripped = _extract(payload, arrays)
+    blobs = []
+    for dtype, values in arrays:
+        blob = array(_TYPECODES[dtype], values)
+        if sys.byteorder != "little":  # pragma: no cover - big-endian hosts
+            blob.byteswap()
+        blobs.append((dtype, len(values), blob.tobytes()))
+
+    descriptors = []
+    cursor = 0
+    for dtype, length, data in blobs:
+        descriptors.append({"dtype": dtype, "length": length, "offset": cursor})
+        cursor += len(data) + _pad(len(data))
+    header = json.dumps({"payload": stripped, "arrays": descriptors}, separators=(",", ":")).encode("utf-8")
+    header += b" " * _pad(_FRAME_PREFIX.size + len(header))
+
+    parts = [_FRAME_PREFIX.pack(FRAME_MAGIC, FRAME_VERSION, len(header)), header]
+    for _, _, data in blobs:
+        parts.append(data)
+        parts.append(b"\0" * _pad(len(data)))
+    return b"".join(parts)
+
+
+def _inject(value: Any, arrays: List[List[Any]]) -> Any:
+    if isinstance(value, dict):
+        if set(value) == {"$array"}:
+            return arrays[value["$array"]]
+        return {key: _inject(item, arrays) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_inject(item, arrays) for item in value]
+    return value
+
+
+def decode_frame(data: bytes) -> Any:
+    """Inverse of `encode_frame` (used by Python clients and tests)."""
+    magic, version, header_len = _FRAME_PREFIX.unpack_from(data)
+    if magic != FRAME_MAGIC or version != FRAME_VERSION:
+        raise ValueError("not an algent frame")
+    data_start = _FRAME_PREFIX.size + header_len
+    header = json.loads(data[_FRAME_PREFIX.size : data_start])
+    arrays = []
+    for descriptor in header["arrays"]:
+        blob = array(_TYPECODES[descriptor["dtype"]])
+        start = data_start + descriptor["offset"]
+        blob.frombytes(data[start : start + descriptor["length"] * blob.itemsize])
+        if sys.byteorder != "little":  # pragma: no cover - big-endian hosts
+            blob.byteswap()
+        arrays.append(blob.tolist())
+    return _inject(header["payload"], arrays)
+
+
+def compress(body: bytes, content_encoding: str | None) -> Tuple[bytes, str | None]:
+    """Compress `body` if worthwhile; returns the body and the encoding applied."""
+    if content_encoding is None or len(body) < MIN_COMPRESS_BYTES:
+        return body, None
+    if content_encoding == "gzip":
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    elif content_encoding == "deflate":
+        compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS)
+    else:
+        return body, None
+    return compressor.compress(body) + compressor.flush(), content_encoding
+
+
+def encode_body(payload: Any, content_type: str, content_encoding: str | None) -> Tuple[bytes, str | None]:
+    """Serialize `payload` for the negotiated representation."""
+    if content_type == FRAME_CONTENT_TYPE:
+        body = encode_frame(payload)
+    else:
+        body = json.dumps(payload).encode("utf-8")
+    return compress(body, content_encoding)
@@ -0,0 +1,163 @@
+"""
+Conditional-GET cache for deterministic experiment results.
+
+Seeded experiments always produce the same output, so the API exposes them at
+`/experiments/results/<key>` where `key` is the config fingerprint. The first
+GET runs the experiment once; afterwards the serialized body is served from a
+bounded in-memory LRU, and clients revalidating with `If-None-Match` get a 304
+without any recomputation or serialization.
+
+Each representation (content type x content encoding x included fields)
+carries its own ETag derived from the result key (the config fingerprint) and
+the variant, not from the body: bodies include timing fields such as
+`latency_ms`, so a recomputation after eviction differs in bytes while being
+the same result. The ETags are therefore weak (`W/"..."`), and clients keep
+getting 304s across evictions. Because no body is needed to compute an ETag,
+`ResultCache.etag` lets a revalidation be answered before the cache is consulted
+at all, so an evicted entry is not recomputed just to send a 304.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import hashlib
+import json
+import threading
+from typing import Callable, Dict, Iterable, Tuple
+
+from . import encoding
+
+
+Representation = Tuple[str, str | None]  # (content type, content encoding)
+
+
+@dataclass
+class CachedBody:
+    """Serialized response ready to be written as-is."""
+
+    etag: str
+    body: bytes
+    content_type: str
+    content_encoding: str | None
+
+
+@dataclass
+class _Entry:
+    """Canonical payload for (key, include) plus its encoded representations."""
+
+    payload: dict
+    size: int
+    bodies: Dict[Representation, CachedBody] = field(default_factory=dict)
+
+
+def _opaque(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Evaluate an `If-None-Match` header against `etag` (weak comparison, RFC 9110)."""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or _opaque(etag) in {_opaque(candidate) for candidate in candidates}
+
+
+def result_etag(key: str, include: Iterable[str], content_type: str, content_encoding: str | None) -> str:
+    """
+    Weak ETag for one negotiated representation of result `key`; stable across
+    recomputation. `content_encoding` is the negotiated encoding, so the tag is
+    known before the body is encoded.
+    """
+    variant = json.dumps([key, sorted(set(include)), content_type, content_encoding], separators=(",", ":"))
+    return f'W/"{hashlib.sha256(variant.encode("utf-8")).hexdigest()[:32]}"'
+
+
+class ResultCache:
+    """
+    Registry of result keys plus an LRU of serialized bodies.
+
+    `max_entries` bounds the number of (key, include) payloads and `max_bytes`
+    bounds the bytes held across them (canonical JSON size plus every encoded
+    body).
+    """
+
+    def __init__(self, max_entries: int = 128, max_bytes: int = 64 * 1024 * 1024, max_configs: int = 4096) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_configs = max_configs
+        self._configs: "OrderedDict[str, object]" = OrderedDict()
+        self._entries: "OrderedDict[Tuple[str, Tuple[str, ...]], _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def register(self, key: str, config: object) -> None:
+        """Remember the config behind `key` so GETs can (re)compute it."""
+        with self._lock:
+            self._configs[key] = config
+            self._configs.move_to_end(key)
+            while len(self._configs) > self.max_configs:
+                self._configs.popitem(last=False)
+
+    def config(self, key: str) -> object | None:
+        with self._lock:
+            return self._configs.get(key)
+
+    def etag(self, key: str, include: Iterable[str], representation: Representation) -> str:
+        """ETag `get` would return for these arguments, without computing anything."""
+        return result_etag(key, include, *representation)
+
+    def get(
+        self,
+        key: str,
+        include: Iterable[str],
+        representation: Representation,
+        compute: Callable[[], dict],
+    ) -> CachedBody:
+        """Return the cached body for `representation`, computing on first use."""
+        slot = (key, tuple(sorted(set(include))))
+        with self._lock:
+            entry = self._entries.get(slot)
+            if entry is not None:
+                self._entries.move_to_end(slot)
+                cached = entry.bodies.get(representation)
+                if cached is not None:
+                    return cached
+        if entry is None:
+            # Computed outside the lock; concurrent first requests may both run
+            # the experiment, which is harmless for deterministic configs.
+            payload = compute()
+            canonical = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+            entry = _Entry(payload=payload, size=len(canonical))
+        content_type, content_encoding = representation
+        body, applied = encoding.encode_body(entry.payload, content_type, content_encoding)
+        cached = CachedBody(
+            etag=result_etag(key, slot[1], content_type, content_encoding),
+            body=body,
+            content_type=content_type,
+            content_encoding=applied,
+        )
+        with self._lock:
+            current = self._entries.get(slot)
+            if current is None:
+                current = self._entries[slot] = entry
+                self._bytes += entry.size
+            elif current is not entry:
+                # Another request replaced the entry meanwhile; keep its bodies.
+                return current.bodies.get(representation, cached)
+            if representation not in current.bodies:
+                current.bodies[representation] = cached
+                self._bytes += len(body)
+            self._entries.move_to_end(slot)
+            self._evict()
+            return current.bodies[representation]
+
+    def _evict(self) -> None:
+        # The most recently used entry always survives, even if it alone exceeds
+        # the byte budget, so the body being returned stays cached.
+        while len(self._entries) > 1 and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size + sum(len(cached.body) for cached in entry.bodies.values())
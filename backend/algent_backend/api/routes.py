@@ -1,14 +1,164 @@
 """
 Route handlers (placeholder).
 
-This module mirrors the `/health` endpoint exposed by the temporary stdlib
-server. When moving to a real framework, adapt these functions to framework
-handlers instead of re-writing logic.
+This module mirrors the endpoints exposed by the temporary stdlib server. When
+moving to a real framework, adapt these functions to framework handlers instead
+of re-writing logic.
 """
-from typing import Dict
+from typing import Any, Dict, Iterable, Tuple
+
+from algent_backend.commands import Command, CommandDispatcher
 
 
 def health() -> Dict[str, str]:
     """Return a simple health payload."""
     return {"status": "ok", "service": "algent-backend"}
 
+
+def _build_command(body: Any) -> Command:
+    if not isinstance(body, dict):
+        raise ValueError("command must be an object")
+    name = body.get("name")
+    if not isinstance(name, str) or not name:
+        raise ValueError("name is required")
+    payload = body.get("payload") or {}
+    if not isinstance(payload, dict):
+        raise ValueError("payload must be an object")
+    priority = body.get("priority")
+    return Command(
+        name=name,
+        payload=payload,
+        source=body.get("source"),
+        priority=int(priority) if priority is not None else None,
+    )
+
+
+def dispatch_command(dispatcher: CommandDispatcher, body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+    """
+    Build a `Command` from a JSON body and dispatch it.
+
+    Commands run on the dispatcher's priority bus, so UI commands overtake
+    queued agent batches. A body of `{"commands": [...]}` dispatches them all in
+    parallel and returns their results in order.
+
+    Returns an HTTP-style status code alongside the payload so transports can
+    map it without knowing about command semantics.
+    """
+    if "commands" in body:
+        if not isinstance(body["commands"], list):
+            return 400, {"status": "error", "message": "commands must be a list"}
+        try:
+            commands = [_build_command(item) for item in body["commands"]]
+        except (TypeError, ValueError) as exc:
+            return 400, {"status": "error", "message": str(exc)}
+        return 200, {"status": "ok", "results": dispatcher.dispatch_many(commands)}
+    try:
+        result = dispatcher.submit(_build_command(body)).result()
+    except (KeyError, TypeError, ValueError) as exc:
+        return 400, {"status": "error", "message": str(exc)}
+    if result.get("status") == "unhandled":
+        return 404, result
+    return 200, result
+
+
+def stream_experiment(body: Dict[str, Any]):
+    """Start a streamed Algo Lab sorting experiment (see `algo_lab.streaming`)."""
+    from algent_backend.labs.algo_lab.service import AlgoLabService
+
+    options = body.get("stream") or {}
+    return AlgoLabService().stream_sorting(
+        body,
+        max_pending=int(options.get("max_pending", 256)),
+        sample_every=int(options.get("sample_every", 64)),
+    )
+
+
+def submit_experiment(jobs, body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+    """Enqueue an Algo Lab sorting experiment on `jobs` (an `ExperimentJobQueue`)."""
+    from algent_backend.labs.algo_lab.jobs import QueueFull
+    from algent_backend.labs.algo_lab.service import AlgoLabService
+
+    try:
+        cfg = AlgoLabService().build_sorting_config(body)
+    except (KeyError, TypeError, ValueError) as exc:
+        return 400, {"status": "error", "message": str(exc)}
+    try:
+        job = jobs.submit(cfg)
+    except QueueFull as exc:
+        return 429, {"status": "error", "message": str(exc)}
+    return 202, {"status": "accepted", "job": job.snapshot()}
+
+
+def list_jobs(jobs) -> Tuple[int, Dict[str, Any]]:
+    from algent_backend.labs.algo_lab.jobs import summarize_jobs
+
+    snapshot = jobs.list_jobs()
+    return 200, {
+        "status": "ok",
+        "counts": summarize_jobs(snapshot),
+        "jobs": [job.snapshot() for job in snapshot],
+    }
+
+
+def job_status(jobs, job_id: str) -> Tuple[int, Dict[str, Any]]:
+    job = jobs.get(job_id)
+    if job is None:
+        return 404, {"status": "not_found", "job_id": job_id}
+    return 200, {"status": "ok", "job": job.snapshot()}
+
+
+def job_result(jobs, job_id: str, include: Iterable[str] = ()) -> Tuple[int, Dict[str, Any]]:
+    """
+    Result of a finished job; `include` selects heavy fields (see `DETAIL_FIELDS`).
+
+    Asking for fields the job's retention policy discarded (and cannot
+    recompute, i.e. an unseeded dataset) returns 409.
+    """
+    from algent_backend.labs.algo_lab.retention import PayloadDiscarded
+
+    job = jobs.get(job_id)
+    if job is None:
+        return 404, {"status": "not_found", "job_id": job_id}
+    if job.status != "succeeded":
+        return 409, {"status": job.status, "job": job.snapshot()}
+    try:
+        result = job.result.detail(include)
+    except PayloadDiscarded as exc:
+        return 409, {"status": "error", "message": str(exc), "job": job.snapshot()}
+    return 200, {"status": "ok", "job": job.snapshot(), "result": result}
+
+
+def cancel_job(jobs, job_id: str) -> Tuple[int, Dict[str, Any]]:
+    job = jobs.cancel(job_id)
+    if job is None:
+        return 404, {"status": "not_found", "job_id": job_id}
+    return 202, {"status": "ok", "job": job.snapshot()}
+
+
+def register_result(cache, body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+    """Register a seeded experiment config on `cache` (a `ResultCache`) and return its key."""
+    from algent_backend.labs.algo_lab.service import AlgoLabService
+
+    try:
+        cfg = AlgoLabService().build_sorting_config(body)
+    except (KeyError, TypeError, ValueError) as exc:
+        return 400, {"status": "error", "message": str(exc)}
+    if not cfg.deterministic:
+        return 400, {"status": "error", "message": "dataset.seed is required for cacheable results"}
+    key = cfg.fingerprint()
+    cache.register(key, cfg)
+    return 200, {"status": "ok", "key": key, "location": f"/experiments/results/{key}"}
+
+
+def experiment_result(cache, key: str, include: Iterable[str], representation: Tuple[str, str | None]):
+    """
+    Serialized result for a registered key.
+
+    Returns `(200, CachedBody)` on success, or `(code, payload)` for errors.
+    """
+    from algent_backend.labs.algo_lab.experiments import run_experiment
+
+    cfg = cache.config(key)
+    if cfg is None:
+        return 404, {"status": "not_found", "key": key}
+    return 200, cache.get(key, include, representation, lambda: run_experiment(cfg).detail(include))
@@ -3,25 +3,176 @@ Minimal HTTP entrypoint for Algent.
 
 This uses the standard library so it can run without extra dependencies. Swap
 for FastAPI/Flask/etc. once the API surface stabilizes.
+
+Connections are served over HTTP/1.1 with keep-alive by a bounded thread pool,
+so a slow command on one connection never blocks `/health` on another. Idle
+keep-alive connections wait in a selector rather than on a pool worker, so
+only in-flight requests count against the pool.
+Experiment progress can be streamed as chunked NDJSON or Server-Sent Events,
+long runs can be queued as background jobs under `/experiments`, and seeded
+results are served with ETags from `/experiments/results/<key>`.
 """
+from concurrent.futures import ThreadPoolExecutor
 from http.server import BaseHTTPRequestHandler, HTTPServer
 import json
-from typing import Tuple
+import logging
+import selectors
+import socket
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+from urllib.parse import parse_qs, urlsplit
 
+from algent_backend.api import encoding, routes
+from algent_backend.api.result_cache import ResultCache, etag_matches
+from algent_backend.commands import CommandDispatcher
 from algent_backend.config import (
+    Settings,
     load_settings,
     list_providers,
+    prefetch_credentials,
     set_provider_api_key,
 )
+from algent_backend.telemetry import PROMETHEUS_CONTENT_TYPE, REGISTRY
+
+
+logger = logging.getLogger("algent.http")
+
+_REQUEST_SECONDS = REGISTRY.histogram(
+    "algent_http_request_duration_seconds",
+    "HTTP request latency by method, route template and status code.",
+    ("method", "route", "status"),
+)
+_IN_FLIGHT = REGISTRY.gauge("algent_http_connections_active", "Connections currently held by pool workers.")
+_IDLE = REGISTRY.gauge("algent_http_connections_idle", "Keep-alive connections waiting for their next request.")
+_REJECTED = REGISTRY.counter("algent_http_connections_rejected_total", "Connections refused with 503 on overload.")
+
+# Path segments that hold identifiers; replaced by a placeholder in metric labels.
+_DYNAMIC_ROUTES = {("experiments", "jobs"), ("experiments", "results")}
+_STATIC_ROUTES = {
+    (),
+    ("health",),
+    ("metrics",),
+    ("commands",),
+    ("credentials",),
+    ("experiments",),
+    ("experiments", "stream"),
+}
+
+
+_OVERLOADED_BODY = json.dumps({"status": "error", "message": "server overloaded"}).encode("utf-8")
+_OVERLOADED_RESPONSE = (
+    b"HTTP/1.1 503 Service Unavailable\r\n"
+    b"Content-Type: application/json\r\n"
+    + f"Content-Length: {len(_OVERLOADED_BODY)}\r\n".encode("ascii")
+    + b"Connection: close\r\n\r\n"
+    + _OVERLOADED_BODY
+)
+
+
+def _cache_headers(etag: str) -> Tuple[Tuple[str, str], ...]:
+    # `no-cache` lets clients store the body but revalidate it every time.
+    return (("ETag", etag), ("Cache-Control", "private, no-cache"))
+
+
+class _ApiHandler(BaseHTTPRequestHandler):
+    """Routes JSON requests to the transport-agnostic handlers in `api.routes`."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without TCP_NODELAY the body waits
+    # on the client's delayed ACK (~40 ms per keep-alive request).
+    disable_nagle_algorithm = True
+    server: "PooledHTTPServer"
+    # Set when the connection went idle and was handed to the server's idle
+    # set; the socket then stays open after `handle` returns.
+    parked = False
+
+    def setup(self) -> None:
+        # Also bounds how long a half-sent request can hold a pool worker.
+        self.timeout = self.server.keepalive_timeout
+        super().setup()
+
+    def handle(self) -> None:
+        # Serve requests while the next one is already readable; once the
+        # connection goes idle, return the worker and wait in the idle set.
+        self.close_connection = False
+        while not self.close_connection:
+            if not self._input_pending():
+                self.parked = True
+                return
+            self.handle_one_request()
+
+    def resume(self) -> None:
+        """Continue a parked connection whose next request has arrived."""
+        self.parked = False
+        try:
+            self.handle()
+        finally:
+            self.finish()
+
+    def finish(self) -> None:
+        if not self.parked:
+            super().finish()
+
+    def _input_pending(self) -> bool:
+        """True if request bytes (or EOF) can be read without blocking."""
+        self.connection.setblocking(False)
+        try:
+            if self.rfile.peek(1):
+                return True
+            # An empty peek is either "nothing yet" or EOF; only the former parks.
+            self.connection.recv(1, socket.MSG_PEEK)
+            return True
+        except BlockingIOError:
+            return False
+        except OSError:
+            return True  # let handle_one_request surface the error
+        finally:
+            self.connection.settimeout(self.timeout)
+
+    def parse_request(self) -> bool:
+        # Called once the request line has arrived, so keep-alive idle time is
+        # not counted as request latency.
+        self._started = time.perf_counter()
+        self._status = 0
+        return super().parse_request()
 
+    def send_response(self, code: int, message: str | None = None) -> None:
+        self._status = code
+        super().send_response(code, message)
 
-class _HealthHandler(BaseHTTPRequestHandler):
-    """Responds to `/health` with a basic payload."""
+    def handle_one_request(self) -> None:
+        self._started = None
+        super().handle_one_request()
+        if self._started is not None and self.command:
+            _REQUEST_SECONDS.labels(self.command, self._route_label(), str(self._status)).observe(
+                time.perf_counter() - self._started
+            )
 
     def _send_json(self, code: int, payload: dict) -> None:
-        body = json.dumps(payload).encode("utf-8")
+        """Send `payload` as JSON, or as a binary frame / compressed when negotiated."""
+        content_type, content_encoding = self._representation()
+        body, content_encoding = encoding.encode_body(payload, content_type, content_encoding)
+        self._send_body(code, body, content_type, content_encoding)
+
+    def _representation(self) -> Tuple[str, str | None]:
+        return encoding.negotiate(self.headers.get("Accept"), self.headers.get("Accept-Encoding"))
+
+    def _send_body(
+        self,
+        code: int,
+        body: bytes,
+        content_type: str,
+        content_encoding: str | None,
+        headers: Tuple[Tuple[str, str], ...] = (),
+    ) -> None:
         self.send_response(code)
-        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Type", content_type)
+        if content_encoding:
+            self.send_header("Content-Encoding", content_encoding)
+        self.send_header("Vary", "Accept, Accept-Encoding")
+        for name, value in headers:
+            self.send_header(name, value)
         self.send_header("Content-Length", str(len(body)))
         self.end_headers()
         self.wfile.write(body)
@@ -35,25 +186,125 @@ class _HealthHandler(BaseHTTPRequestHandler):
         if not raw:
             return {}
         try:
-            return json.loads(raw.decode("utf-8"))
-        except json.JSONDecodeError:
+            payload = json.loads(raw.decode("utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError):
             return {}
+        return payload if isinstance(payload, dict) else {}
+
+    def _route(self) -> Tuple[str, ...]:
+        path = urlsplit(self.path).path
+        return tuple(segment for segment in path.split("/") if segment)
+
+    def _route_label(self) -> str:
+        route = self._route()
+        if len(route) > 2 and route[:2] in _DYNAMIC_ROUTES:
+            route = route[:2] + ("{id}",) + route[3:]
+        elif route not in _STATIC_ROUTES:
+            return "unmatched"  # keeps label cardinality bounded
+        return "/" + "/".join(route)
+
+    def _query_list(self, name: str) -> list[str]:
+        """Comma-separated and/or repeated query parameter values."""
+        values = parse_qs(urlsplit(self.path).query).get(name, [])
+        return [item for value in values for item in value.split(",") if item]
 
     def do_GET(self) -> None:  # noqa: N802 (keep handler signature)
-        if self.path.rstrip("/") == "/health":
-            self._send_json(200, {"status": "ok", "service": "algent-backend"})
-            return
-        self._send_json(404, {"status": "not_found", "path": self.path})
+        route = self._route()
+        if route == ("health",):
+            self._send_json(200, routes.health())
+        elif route == ("metrics",):
+            body, applied = encoding.compress(REGISTRY.render().encode("utf-8"), self._representation()[1])
+            self._send_body(200, body, PROMETHEUS_CONTENT_TYPE, applied)
+        elif route == ("experiments", "jobs"):
+            self._send_json(*routes.list_jobs(self.server.jobs))
+        elif len(route) == 3 and route[:2] == ("experiments", "jobs"):
+            self._send_json(*routes.job_status(self.server.jobs, route[2]))
+        elif len(route) == 4 and route[:2] == ("experiments", "jobs") and route[3] == "result":
+            self._send_json(*routes.job_result(self.server.jobs, route[2], self._query_list("include")))
+        elif len(route) == 3 and route[:2] == ("experiments", "results"):
+            self._handle_cached_result(route[2])
+        else:
+            self._send_json(404, {"status": "not_found", "path": self.path})
 
     def do_POST(self) -> None:  # noqa: N802
-        path = self.path.rstrip("/")
-        if path == "/credentials":
-            self._handle_credential_update()
+        # Always drain the body so the next request on a kept-alive connection
+        # starts at a clean boundary.
+        payload = self._read_json()
+        route = self._route()
+        if route == ("credentials",):
+            self._handle_credential_update(payload)
+        elif route == ("commands",):
+            self._handle_command(payload)
+        elif route == ("experiments",):
+            self._send_json(*routes.submit_experiment(self.server.jobs, payload))
+        elif route == ("experiments", "results"):
+            self._send_json(*routes.register_result(self.server.results, payload))
+        elif route == ("experiments", "stream"):
+            self._handle_experiment_stream(payload)
+        elif len(route) == 4 and route[:2] == ("experiments", "jobs") and route[3] == "cancel":
+            self._send_json(*routes.cancel_job(self.server.jobs, route[2]))
+        else:
+            self._send_json(404, {"status": "not_found", "path": self.path})
+
+    def _handle_command(self, payload: dict) -> None:
+        try:
+            code, result = routes.dispatch_command(self.server.dispatcher, payload)
+        except Exception as exc:
+            self._send_json(500, {"status": "error", "message": str(exc)})
             return
-        self._send_json(404, {"status": "not_found", "path": self.path})
+        self._send_json(code, result)
 
-    def _handle_credential_update(self) -> None:
-        payload = self._read_json()
+    def _handle_cached_result(self, key: str) -> None:
+        results, include, representation = self.server.results, self._query_list("include"), self._representation()
+        # ETags derive from the key and variant, so a revalidation is answered
+        # before the cache (which may recompute an evicted entry) is touched.
+        if results.config(key) is not None:
+            etag = results.etag(key, include, representation)
+            if etag_matches(self.headers.get("If-None-Match"), etag):
+                self.send_response(304)
+                self.send_header("Vary", "Accept, Accept-Encoding")
+                for name, value in _cache_headers(etag):
+                    self.send_header(name, value)
+                self.end_headers()
+                return
+        code, result = routes.experiment_result(results, key, include, representation)
+        if code != 200:
+            self._send_json(code, result)
+            return
+        self._send_body(200, result.body, result.content_type, result.content_encoding, _cache_headers(result.etag))
+
+    def _handle_experiment_stream(self, payload: dict) -> None:
+        try:
+            stream = routes.stream_experiment(payload)
+        except (KeyError, TypeError, ValueError) as exc:
+            self._send_json(400, {"status": "error", "message": str(exc)})
+            return
+        sse = "text/event-stream" in (self.headers.get("Accept") or "")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream" if sse else "application/x-ndjson")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for event in stream:
+                data = json.dumps(event)
+                if sse:
+                    frame = f"event: {event['event']}\ndata: {data}\n\n"
+                else:
+                    frame = data + "\n"
+                # The socket write blocks on a slow client, which backs up the
+                # stream's bounded queue and coarsens its sampling.
+                self._write_chunk(frame.encode("utf-8"))
+            self._write_chunk(b"")
+        except OSError:
+            self.close_connection = True
+        finally:
+            stream.cancel()
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+
+    def _handle_credential_update(self, payload: dict) -> None:
         provider = (payload.get("provider") or "").lower()
         api_key = payload.get("api_key")
         allowed = list_providers()
@@ -80,25 +331,249 @@ class _HealthHandler(BaseHTTPRequestHandler):
         )
 
     def log_message(self, fmt: str, *args) -> None:  # noqa: D401
-        """Suppress default noisy logging; replace with structured logging later."""
-        return
+        """Route access logs to the `algent.http` logger (debug level)."""
+        logger.debug("%s - " + fmt, self.address_string(), *args)
+
+
+class PooledHTTPServer(HTTPServer):
+    """
+    HTTPServer that hands each readable connection to a bounded thread pool.
+
+    At most `workers` requests are served at once and up to `backlog` more
+    wait for a worker; anything beyond that is answered with 503 immediately
+    instead of queueing without limit. Idle keep-alive connections hold no
+    worker or slot: they wait in `_IdleConnections` until their next request
+    arrives or `keepalive_timeout` passes.
+    """
+
+    request_queue_size = 128
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        dispatcher: CommandDispatcher,
+        settings: Settings,
+    ) -> None:
+        super().__init__(address, _ApiHandler)
+        self.dispatcher = dispatcher
+        self.keepalive_timeout = settings.keepalive_timeout
+        self._settings = settings
+        self._jobs = None
+        self._jobs_lock = threading.Lock()
+        self.results = ResultCache(
+            max_entries=settings.result_cache_entries,
+            max_bytes=settings.result_cache_bytes,
+        )
+        self._executor = ThreadPoolExecutor(max_workers=settings.http_workers, thread_name_prefix="algent-http")
+        self._slots = threading.BoundedSemaphore(settings.http_workers + settings.http_backlog)
+        self._idle = _IdleConnections(self._resume, self._close_parked, settings.keepalive_timeout)
+
+    @property
+    def jobs(self):
+        """Experiment job queue, built (and the lab imported) on first use."""
+        if self._jobs is None:
+            with self._jobs_lock:
+                if self._jobs is None:
+                    self._jobs = _build_job_queue(self._settings)
+        return self._jobs
+
+    def finish_request(self, request: socket.socket, client_address) -> _ApiHandler:
+        return self.RequestHandlerClass(request, client_address, self)
+
+    def process_request(self, request: socket.socket, client_address) -> None:
+        if not self._slots.acquire(blocking=False):
+            self._reject(request)
+            return
+        self._executor.submit(self._process, request, client_address)
+
+    def _process(self, request: socket.socket, client_address, handler: _ApiHandler | None = None) -> None:
+        _IN_FLIGHT.labels().inc()
+        parked = False
+        try:
+            if handler is None:
+                handler = self.finish_request(request, client_address)
+            else:
+                handler.resume()
+            parked = handler.parked
+        except ConnectionError:
+            pass  # clients routinely drop idle keep-alive connections
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            _IN_FLIGHT.labels().dec()
+            self._slots.release()
+            if parked:
+                self._idle.park(handler)
+            else:
+                self.shutdown_request(request)
+
+    def _resume(self, handler: _ApiHandler) -> None:
+        if not self._slots.acquire(blocking=False):
+            self._close_parked(handler, reject=True)
+            return
+        self._executor.submit(self._process, handler.connection, handler.client_address, handler)
+
+    def _close_parked(self, handler: _ApiHandler, reject: bool = False) -> None:
+        handler.parked = False
+        handler.finish()
+        if reject:
+            self._reject(handler.connection)
+        else:
+            self.shutdown_request(handler.connection)
+
+    def _reject(self, request: socket.socket) -> None:
+        _REJECTED.inc()
+        try:
+            request.sendall(_OVERLOADED_RESPONSE)
+        except OSError:
+            pass
+        self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._idle.close()
+        if self._jobs is not None:
+            self._jobs.shutdown()
+        self.dispatcher.close(wait=False)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class _IdleConnections:
+    """
+    Idle keep-alive connections, watched by one selector thread.
+
+    A parked connection is handed to `resume` once it becomes readable (the
+    next request or EOF) and to `close` after `timeout` seconds without one.
+    """
+
+    def __init__(
+        self,
+        resume: Callable[[_ApiHandler], None],
+        close: Callable[[_ApiHandler], None],
+        timeout: float,
+    ) -> None:
+        self._resume = resume
+        self._close = close
+        self._timeout = timeout
+        self._selector = selectors.DefaultSelector()
+        self._deadlines: Dict[_ApiHandler, float] = {}
+        self._pending: List[_ApiHandler] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        # Parking happens on pool workers; the selector is only touched by its
+        # own thread, which a byte on this socket pair wakes up.
+        self._wakeup, self._waker = socket.socketpair()
+        self._wakeup.setblocking(False)
+        self._selector.register(self._wakeup, selectors.EVENT_READ)
+        self._thread = threading.Thread(target=self._run, name="algent-http-idle", daemon=True)
+        self._thread.start()
+
+    def park(self, handler: _ApiHandler) -> None:
+        with self._lock:
+            if not self._closed:
+                self._pending.append(handler)
+                self._wake()
+                return
+        self._close(handler)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._wake()
+        self._thread.join()
+
+    def _wake(self) -> None:
+        try:
+            self._waker.send(b"\0")
+        except OSError:
+            pass  # the buffer is full, so a wake-up is already pending
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                closed = self._closed
+                pending, self._pending = self._pending, []
+            if closed:
+                break
+            now = time.monotonic()
+            for handler in pending:
+                self._selector.register(handler.connection, selectors.EVENT_READ, handler)
+                self._deadlines[handler] = now + self._timeout
+                _IDLE.labels().inc()
+            timeout = max(0.0, min(self._deadlines.values()) - now) if self._deadlines else None
+            for key, _ in self._selector.select(timeout):
+                if key.data is None:
+                    while True:
+                        try:
+                            if not self._wakeup.recv(4096):
+                                break
+                        except BlockingIOError:
+                            break
+                else:
+                    self._release(key.data)
+                    self._resume(key.data)
+            now = time.monotonic()
+            for handler in [handler for handler, deadline in self._deadlines.items() if deadline <= now]:
+                self._release(handler)
+                self._close(handler)
+        for handler in pending + list(self._deadlines):
+            if handler in self._deadlines:
+                self._release(handler)
+            self._close(handler)
+        self._selector.close()
+        self._wakeup.close()
+        self._waker.close()
+
+    def _release(self, handler: _ApiHandler) -> None:
+        self._selector.unregister(handler.connection)
+        del self._deadlines[handler]
+        _IDLE.labels().dec()
+
+
+def _build_job_queue(settings: Settings):
+    from algent_backend.labs.algo_lab.jobs import ExperimentJobQueue
+
+    return ExperimentJobQueue(
+        workers=settings.job_workers,
+        max_depth=settings.job_queue_depth,
+        history=settings.job_history,
+    )
+
+
+def build_dispatcher(settings: Settings | None = None) -> CommandDispatcher:
+    """Create a dispatcher with every lab's commands registered (labs load on first use)."""
+    from algent_backend.labs import register_commands
+
+    settings = settings or load_settings()
+    dispatcher = CommandDispatcher(workers=settings.command_workers)
+    register_commands(dispatcher)
+    return dispatcher
 
 
-def create_server(address: Tuple[str, int] | None = None) -> HTTPServer:
+def create_server(
+    address: Tuple[str, int] | None = None,
+    dispatcher: CommandDispatcher | None = None,
+) -> PooledHTTPServer:
     """
-    Build an HTTPServer instance using Settings defaults if no address provided.
+    Build a pooled HTTP server using Settings defaults if no address provided.
     """
+    settings = load_settings()
     if address is None:
-        settings = load_settings()
         address = (settings.host, settings.port)
-    return HTTPServer(address, _HealthHandler)
+    # Warm keyring lookups off the request path so provider creation never blocks on them.
+    prefetch_credentials()
+    return PooledHTTPServer(
+        address,
+        dispatcher=dispatcher if dispatcher is not None else build_dispatcher(settings),
+        settings=settings,
+    )
 
 
 def run(address: Tuple[str, int] | None = None) -> None:
-    """Start the simple health server."""
+    """Start the API server."""
     server = create_server(address)
     host, port = server.server_address
-    print(f"[algent] serving health endpoint at http://{host}:{port}/health")
+    print(f"[algent] serving API at http://{host}:{port} (health: /health)")
     server.serve_forever()
 
 
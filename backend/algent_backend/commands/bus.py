@@ -0,0 +1,98 @@
+"""
+Priority command bus.
+
+Runs commands on a fixed pool of worker threads, highest priority first (lower
+number wins, FIFO within a priority). Per-command-name concurrency caps park
+excess commands aside instead of blocking a worker, so a flood of capped agent
+commands never starves other work.
+"""
+from __future__ import annotations
+
+from collections import defaultdict, deque
+from concurrent.futures import Future
+import itertools
+import math
+import queue
+import threading
+from typing import Callable, Deque, Dict, List, Tuple
+
+from .models import Command
+
+
+_Item = Tuple[float, int, Command | None, Future | None]
+
+
+class CommandBus:
+    """Thread-pool executor with a priority queue and per-name concurrency caps."""
+
+    def __init__(
+        self,
+        execute: Callable[[Command], dict],
+        workers: int,
+        limit_for: Callable[[str], int | None],
+    ) -> None:
+        self._execute = execute
+        self._limit_for = limit_for
+        self._queue: "queue.PriorityQueue[_Item]" = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._active: Dict[str, int] = defaultdict(int)
+        self._parked: Dict[str, Deque[_Item]] = defaultdict(deque)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._threads: List[threading.Thread] = [
+            threading.Thread(target=self._work, name=f"algent-command-{index}", daemon=True)
+            for index in range(max(1, workers))
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, command: Command) -> "Future[dict]":
+        if self._closed:
+            raise RuntimeError("command bus is shut down")
+        future: "Future[dict]" = Future()
+        self._queue.put((command.effective_priority(), next(self._sequence), command, future))
+        return future
+
+    def pending(self) -> int:
+        """Commands queued or parked (not yet running)."""
+        with self._lock:
+            parked = sum(len(items) for items in self._parked.values())
+        return self._queue.qsize() + parked
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._closed = True
+        for _ in self._threads:
+            self._queue.put((math.inf, next(self._sequence), None, None))
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            _, _, command, future = item
+            if command is None or future is None:
+                return
+            if future.cancelled():
+                continue
+            limit = self._limit_for(command.name)
+            with self._lock:
+                if limit is not None and self._active[command.name] >= limit:
+                    self._parked[command.name].append(item)
+                    continue
+                self._active[command.name] += 1
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(self._execute(command))
+                    except BaseException as exc:
+                        future.set_exception(exc)
+            finally:
+                self._release(command.name)
+
+    def _release(self, name: str) -> None:
+        with self._lock:
+            self._active[name] -= 1
+            parked = self._parked.get(name)
+            if parked:
+                self._queue.put(parked.popleft())
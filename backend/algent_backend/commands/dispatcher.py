@@ -1,33 +1,246 @@
 """
-Minimal command dispatcher.
+Command dispatcher.
 
-This is intentionally simple; replace with a more robust bus/queue when needed.
+`dispatch` runs a handler synchronously in the caller's thread. For UI and
+agent traffic, `submit`/`adispatch`/`dispatch_many` route commands through a
+`CommandBus` instead: a priority queue drained by a worker pool, with optional
+per-command concurrency caps. Both paths share the middleware chain.
+
+Handlers registered with `coalesce=True` (or a predicate on the command) opt in
+to single-flight: identical in-flight commands (same name, canonical payload
+and priority) share one handler run, and later callers wait for its result.
+Coalescing is off by default because it is only safe for idempotent handlers.
 """
-from typing import Callable, Dict
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future
+import hashlib
+import json
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Union
 
+from algent_backend.telemetry import REGISTRY
+
+from .bus import CommandBus
 from .models import Command
 
 CommandHandler = Callable[[Command], dict]
+CoalescePolicy = Union[bool, Callable[[Command], bool]]
+CommandMiddleware = Callable[[Command, CommandHandler], dict]
+"""Wraps a handler call: receives the command and the next callable in the chain."""
+
+DEFAULT_WORKERS = 8
+
+_COMMAND_SECONDS = REGISTRY.histogram(
+    "algent_command_duration_seconds",
+    "Command handler latency by command name and outcome.",
+    ("command", "outcome"),
+)
+_UNHANDLED = REGISTRY.counter("algent_commands_unhandled_total", "Commands with no registered handler.")
+_COALESCED = REGISTRY.counter(
+    "algent_commands_coalesced_total",
+    "Commands served by waiting on an identical in-flight command.",
+    ("command",),
+)
+
+
+def timing_middleware(command: Command, call_next: CommandHandler) -> dict:
+    """Record handler latency in `algent_command_duration_seconds`."""
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        result = call_next(command)
+        outcome = "ok"
+        return result
+    finally:
+        _COMMAND_SECONDS.labels(command.name, outcome).observe(time.perf_counter() - start)
+
+
+def _chain(middleware: CommandMiddleware, call_next: CommandHandler) -> CommandHandler:
+    return lambda command: middleware(command, call_next)
+
+
+def command_key(command: Command) -> str:
+    """Canonical hash of a command's name, payload and effective priority."""
+    canonical = json.dumps(
+        {"name": command.name, "payload": command.payload, "priority": command.effective_priority()},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=repr,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _follow(leader: "Future[dict]") -> "Future[dict]":
+    """Future mirroring `leader` with its own copy of the result dict."""
+    follower: "Future[dict]" = Future()
+
+    def _copy(done: "Future[dict]") -> None:
+        if done.cancelled():
+            follower.cancel()
+        elif done.exception() is not None:
+            follower.set_exception(done.exception())
+        else:
+            follower.set_result(dict(done.result()))
+
+    follower.set_running_or_notify_cancel()
+    leader.add_done_callback(_copy)
+    return follower
 
 
 class CommandDispatcher:
     """Routes commands to handlers."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        middleware: Iterable[CommandMiddleware] | None = None,
+    ) -> None:
         self._handlers: Dict[str, CommandHandler] = {}
+        self._limits: Dict[str, int] = {}
+        self._coalesce: Dict[str, CoalescePolicy] = {}
+        self._inflight: Dict[str, "Future[dict]"] = {}
+        self._inflight_lock = threading.Lock()
+        self._middleware: List[CommandMiddleware] = list(middleware) if middleware is not None else [timing_middleware]
+        self._workers = workers
+        self._bus: CommandBus | None = None
+        self._bus_lock = threading.Lock()
 
-    def register(self, name: str, handler: CommandHandler) -> None:
-        """Register a handler for a command name."""
+    def register(
+        self,
+        name: str,
+        handler: CommandHandler,
+        max_concurrency: int | None = None,
+        coalesce: CoalescePolicy = False,
+    ) -> None:
+        """
+        Register a handler for a command name.
+
+        `max_concurrency` caps how many of these commands the bus runs at once.
+        `coalesce=True` marks the handler as idempotent, so identical concurrent
+        commands share one run; pass a predicate to decide per command (e.g.
+        only when the payload is deterministic).
+        """
         # TODO: add validation/versioning.
         self._handlers[name] = handler
+        if coalesce:
+            self._coalesce[name] = coalesce
+        else:
+            self._coalesce.pop(name, None)
+        if max_concurrency is not None:
+            self.set_concurrency_limit(name, max_concurrency)
+
+    def set_concurrency_limit(self, name: str, limit: int | None) -> None:
+        if limit is None:
+            self._limits.pop(name, None)
+        elif limit < 1:
+            raise ValueError("concurrency limit must be >= 1")
+        else:
+            self._limits[name] = limit
+
+    def use(self, middleware: CommandMiddleware) -> None:
+        """Append a middleware; the first registered is the outermost."""
+        self._middleware.append(middleware)
 
     def dispatch(self, command: Command) -> dict:
         """Dispatch a command to its handler or return a not-implemented payload."""
+        key = self._coalesce_key(command)
+        if key is None:
+            return self._invoke(command)
+        with self._inflight_lock:
+            leader = self._inflight.get(key)
+            if leader is None:
+                flight: "Future[dict]" = Future()
+                flight.set_running_or_notify_cancel()
+                self._inflight[key] = flight
+        if leader is not None:
+            _COALESCED.labels(command.name).inc()
+            return dict(leader.result())
+        try:
+            result = self._invoke(command)
+        except BaseException as exc:
+            self._land(key, flight)
+            flight.set_exception(exc)
+            raise
+        self._land(key, flight)
+        flight.set_result(result)
+        return result
+
+    def _invoke(self, command: Command) -> dict:
         handler = self._handlers.get(command.name)
         if not handler:
+            _UNHANDLED.inc()
             return {
                 "status": "unhandled",
                 "message": f"No handler registered for '{command.name}'",
             }
-        return handler(command)
+        call = handler
+        for middleware in reversed(self._middleware):
+            call = _chain(middleware, call)
+        return call(command)
+
+    def submit(self, command: Command) -> "Future[dict]":
+        """Queue `command` on the bus; the future resolves to the handler result."""
+        key = self._coalesce_key(command)
+        bus = self._ensure_bus()
+        if key is None:
+            return bus.submit(command)
+        with self._inflight_lock:
+            leader = self._inflight.get(key)
+            if leader is None:
+                future = self._inflight[key] = bus.submit(command)
+        if leader is not None:
+            _COALESCED.labels(command.name).inc()
+            return _follow(leader)
+        future.add_done_callback(lambda done: self._land(key, done))
+        return future
+
+    async def adispatch(self, command: Command) -> dict:
+        """Awaitable `submit` for asyncio callers."""
+        return await asyncio.wrap_future(self.submit(command))
+
+    def dispatch_many(self, commands: Iterable[Command], timeout: float | None = None) -> List[dict]:
+        """
+        Run independent commands in parallel and return results in input order.
+
+        A failing command yields an error payload rather than aborting the batch.
+        """
+        futures = [self.submit(command) for command in commands]
+        results: List[dict] = []
+        for future in futures:
+            try:
+                results.append(future.result(timeout=timeout))
+            except Exception as exc:
+                results.append({"status": "error", "message": str(exc)})
+        return results
+
+    def close(self, wait: bool = True) -> None:
+        """Stop bus workers once queued commands finish (optionally without waiting)."""
+        with self._bus_lock:
+            bus, self._bus = self._bus, None
+        if bus is not None:
+            bus.shutdown(wait=wait)
+
+    def _coalesce_key(self, command: Command) -> str | None:
+        policy = self._coalesce.get(command.name)
+        if not policy or command.name not in self._handlers:
+            return None
+        if policy is not True and not policy(command):
+            return None
+        return command_key(command)
+
+    def _land(self, key: str, flight: "Future[dict]") -> None:
+        """Forget a finished in-flight command so later ones run fresh."""
+        with self._inflight_lock:
+            if self._inflight.get(key) is flight:
+                del self._inflight[key]
 
+    def _ensure_bus(self) -> CommandBus:
+        if self._bus is None:
+            with self._bus_lock:
+                if self._bus is None:
+                    # The bus bypasses coalescing; `submit` already coalesced.
+                    self._bus = CommandBus(self._invoke, self._workers, self._limits.get)
+        return self._bus
@@ -8,6 +8,12 @@ from dataclasses import dataclass, field
 from typing import Any, Dict
 
 
+# Queue priority per source when a command does not set one; lower runs first so
+# interactive UI commands overtake agent batches.
+SOURCE_PRIORITIES = {"ui": 0, "script": 50, "agent": 100}
+DEFAULT_PRIORITY = 50
+
+
 @dataclass
 class Command:
     """Structured action request."""
@@ -15,4 +21,10 @@ class Command:
     name: str
     payload: Dict[str, Any] = field(default_factory=dict)
     source: str | None = None  # e.g., "ui", "agent", "script"
+    priority: int | None = None  # overrides the source-derived priority
+
+    def effective_priority(self) -> int:
+        if self.priority is not None:
+            return self.priority
+        return SOURCE_PRIORITIES.get(self.source or "", DEFAULT_PRIORITY)
 
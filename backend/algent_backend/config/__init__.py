@@ -4,7 +4,10 @@ Configuration package.
 
 from .settings import Settings, load_settings  # noqa: F401
 from .credentials import (  # noqa: F401
+    CredentialResolver,
+    get_credential_resolver,
     get_provider_api_key,
+    prefetch_credentials,
     set_provider_api_key,
     list_providers,
 )
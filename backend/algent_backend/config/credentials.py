@@ -1,10 +1,18 @@
 """
 Credential helpers (env vars first, with optional keyring fallback).
+
+Keyring lookups can be slow (on Linux each one is a D-Bus round trip to the
+Secret Service), so they go through a `CredentialResolver` that caches results,
+misses included, for a TTL. The server prefetches every provider in the
+background at startup, so creating providers in a hot loop never touches
+keyring.
 """
 from __future__ import annotations
 
 import os
-from typing import Optional
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, Tuple
 
 try:
     import keyring  # type: ignore
@@ -22,28 +30,127 @@ PROVIDER_KEY_MAP = {
 }
 
 
+DEFAULT_CREDENTIAL_TTL = 300.0
+
+_MISSING = object()
+
+
 def list_providers() -> list[str]:
     """Return supported provider identifiers."""
     return sorted(PROVIDER_KEY_MAP.keys())
 
 
+def _read_keyring(key_name: str) -> Optional[str]:
+    if not keyring or not key_name:
+        return None
+    try:
+        return keyring.get_password(SERVICE_NAME, key_name)
+    except Exception:
+        return None
+
+
+class CredentialResolver:
+    """
+    TTL cache in front of keyring lookups.
+
+    Environment variables are always read live (they are cheap and may be
+    changed by tests or shells); only keyring results are cached. A lookup in
+    progress for a provider is shared by concurrent callers rather than
+    repeated.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_CREDENTIAL_TTL) -> None:
+        self.ttl = ttl
+        self._cache: Dict[str, Tuple[Optional[str], float]] = {}
+        self._locks: Dict[str, threading.Lock] = {name: threading.Lock() for name in PROVIDER_KEY_MAP}
+        self._prefetch_thread: threading.Thread | None = None
+
+    def get(self, provider: str) -> Optional[str]:
+        env_var, key_name = PROVIDER_KEY_MAP.get(provider, ("", ""))  # type: ignore[arg-type]
+        if env_var and env_var in os.environ:
+            return os.environ[env_var]
+        if not key_name:
+            return None
+        cached = self._fresh(provider)
+        if cached is not _MISSING:
+            return cached
+        with self._locks[provider]:
+            cached = self._fresh(provider)
+            if cached is not _MISSING:
+                return cached
+            value = _read_keyring(key_name)
+            self._cache[provider] = (value, time.monotonic() + self.ttl)
+            return value
+
+    def store(self, provider: str, value: Optional[str]) -> None:
+        """Seed the cache (used after writing a new key)."""
+        self._cache[provider] = (value, time.monotonic() + self.ttl)
+
+    def update(self, provider: str, value: str, write: Callable[[str], None]) -> None:
+        """
+        Replace the key: `write(value)` to the backing store, then cache it.
+
+        Runs under the provider's lookup lock, so a concurrent cache miss in
+        `get` cannot put the old value back after the write.
+        """
+        with self._locks[provider]:
+            self.invalidate(provider)
+            write(value)
+            self.store(provider, value)
+
+    def invalidate(self, provider: str | None = None) -> None:
+        if provider is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(provider, None)
+
+    def prefetch(self, providers: Iterable[str] | None = None, background: bool = True) -> None:
+        """Resolve providers ahead of use, by default on a daemon thread."""
+        names = list(providers) if providers is not None else list(PROVIDER_KEY_MAP)
+
+        def _run() -> None:
+            for name in names:
+                self.get(name)
+
+        if not background:
+            _run()
+            return
+        if self._prefetch_thread is not None and self._prefetch_thread.is_alive():
+            return
+        self._prefetch_thread = threading.Thread(target=_run, name="algent-credentials", daemon=True)
+        self._prefetch_thread.start()
+
+    def _fresh(self, provider: str):
+        """Cached value (possibly None) if still valid, else `_MISSING`."""
+        entry = self._cache.get(provider)
+        if entry is None or entry[1] < time.monotonic():
+            return _MISSING
+        return entry[0]
+
+
+_RESOLVER = CredentialResolver(ttl=float(os.getenv("ALGENT_CREDENTIAL_TTL", str(DEFAULT_CREDENTIAL_TTL))))
+
+
+def get_credential_resolver() -> CredentialResolver:
+    """Return the process-wide resolver used by `get_provider_api_key`."""
+    return _RESOLVER
+
+
+def prefetch_credentials(background: bool = True) -> None:
+    """Warm the credential cache for every known provider."""
+    _RESOLVER.prefetch(background=background)
+
+
 def get_provider_api_key(provider: str) -> Optional[str]:
     """
     Return the API key for a provider.
 
     Order of precedence:
     1. Environment variable (e.g., OPENAI_API_KEY)
-    2. Keyring entry stored under (service='algent', username='<provider>_api_key')
+    2. Keyring entry stored under (service='algent', username='<provider>_api_key'),
+       cached by the process-wide `CredentialResolver`
     """
-    env_var, key_name = PROVIDER_KEY_MAP.get(provider, ("", ""))  # type: ignore[arg-type]
-    if env_var and env_var in os.environ:
-        return os.environ[env_var]
-    if keyring and key_name:
-        try:
-            return keyring.get_password(SERVICE_NAME, key_name)
-        except Exception:
-            return None
-    return None
+    return _RESOLVER.get(provider)
 
 
 def set_provider_api_key(provider: str, value: str) -> None:
@@ -53,4 +160,4 @@ def set_provider_api_key(provider: str, value: str) -> None:
     _, key_name = PROVIDER_KEY_MAP.get(provider, ("", ""))
     if not key_name:
         raise ValueError(f"Unknown provider '{provider}'")
-    keyring.set_password(SERVICE_NAME, key_name, value)
+    _RESOLVER.update(provider, value, lambda secret: keyring.set_password(SERVICE_NAME, key_name, secret))
@@ -11,6 +11,15 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 43145
+DEFAULT_HTTP_WORKERS = 16
+DEFAULT_HTTP_BACKLOG = 64
+DEFAULT_KEEPALIVE_TIMEOUT = 5.0
+DEFAULT_COMMAND_WORKERS = 8
+DEFAULT_JOB_WORKERS = 2
+DEFAULT_JOB_QUEUE_DEPTH = 64
+DEFAULT_JOB_HISTORY = 256
+DEFAULT_RESULT_CACHE_ENTRIES = 128
+DEFAULT_RESULT_CACHE_BYTES = 64 * 1024 * 1024
 
 
 @dataclass
@@ -20,6 +29,15 @@ class Settings:
     host: str = os.getenv("ALGENT_HOST", DEFAULT_HOST)
     port: int = int(os.getenv("ALGENT_PORT", str(DEFAULT_PORT)))
     environment: str = os.getenv("ALGENT_ENV", "dev")
+    http_workers: int = int(os.getenv("ALGENT_HTTP_WORKERS", str(DEFAULT_HTTP_WORKERS)))
+    http_backlog: int = int(os.getenv("ALGENT_HTTP_BACKLOG", str(DEFAULT_HTTP_BACKLOG)))
+    keepalive_timeout: float = float(os.getenv("ALGENT_KEEPALIVE_TIMEOUT", str(DEFAULT_KEEPALIVE_TIMEOUT)))
+    command_workers: int = int(os.getenv("ALGENT_COMMAND_WORKERS", str(DEFAULT_COMMAND_WORKERS)))
+    job_workers: int = int(os.getenv("ALGENT_JOB_WORKERS", str(DEFAULT_JOB_WORKERS)))
+    job_queue_depth: int = int(os.getenv("ALGENT_JOB_QUEUE_DEPTH", str(DEFAULT_JOB_QUEUE_DEPTH)))
+    job_history: int = int(os.getenv("ALGENT_JOB_HISTORY", str(DEFAULT_JOB_HISTORY)))
+    result_cache_entries: int = int(os.getenv("ALGENT_RESULT_CACHE_ENTRIES", str(DEFAULT_RESULT_CACHE_ENTRIES)))
+    result_cache_bytes: int = int(os.getenv("ALGENT_RESULT_CACHE_BYTES", str(DEFAULT_RESULT_CACHE_BYTES)))
 
 
 def load_settings() -> Settings:
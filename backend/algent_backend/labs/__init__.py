@@ -1,19 +1,10 @@
 """
 Labs package groups domain-specific modules (algo lab, news hub, etc.).
-"""
-from importlib import import_module
-from typing import Dict
-
-
-_REGISTRY: Dict[str, str] = {
-    "algo_lab": "algent_backend.labs.algo_lab",
-    "news_hub": "algent_backend.labs.news_hub",
-}
 
+Labs are described by `lab.json` manifests (in-tree or installed through the
+`algent.labs` entry point group) and listed without being imported; see
+`labs.registry`.
+"""
+from .registry import LabManifest, get_manifest, list_labs, load_lab, register_commands
 
-def load_lab(name: str):
-    """Dynamically import a lab by name."""
-    module_path = _REGISTRY.get(name)
-    if not module_path:
-        raise KeyError(f"lab '{name}' not registered")
-    return import_module(module_path)
+__all__ = ["LabManifest", "get_manifest", "list_labs", "load_lab", "register_commands"]
@@ -2,7 +2,25 @@
 Algorithm Behavior Lab.
 
 Wraps algorithms, metrics, experiments, and lab-specific commands/config.
+Submodules and `AlgoLabService` load lazily on first attribute access, so
+importing the lab (e.g. to register its commands) stays cheap.
 """
+from importlib import import_module
 
-from . import algorithms, datasets, experiments, metrics  # noqa: F401
-from .service import AlgoLabService  # noqa: F401
+_SUBMODULES = ("algorithms", "datasets", "experiments", "metrics")
+_ATTRIBUTES = {"AlgoLabService": ".service"}
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        value = import_module(f".{name}", __name__)
+    elif name in _ATTRIBUTES:
+        value = getattr(import_module(_ATTRIBUTES[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_SUBMODULES) + list(_ATTRIBUTES))
@@ -0,0 +1,103 @@
+"""
+Algorithm registry for Algo Lab.
+
+This module keeps the registry intentionally lightweight so that experiments can
+resolve algorithms without importing concrete implementations directly. Each
+algorithm operates on primitive Python collections, which keeps the dependency
+surface tiny and easy to reason about.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from importlib import import_module
+import threading
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Tuple
+
+if TYPE_CHECKING:
+    from .sorting import SortingOptions, SortingResult
+
+
+AlgorithmRunner = Callable[[Iterable[int], "SortingOptions"], "SortingResult"]
+
+
+@dataclass
+class AlgorithmDescriptor:
+    """Lightweight descriptor used for discovery."""
+
+    name: str
+    kind: str
+    description: str
+
+
+# kind -> (module, catalog function, runner function). Kind modules are only
+# imported when an algorithm of that kind is listed or run.
+_KINDS: Dict[str, Tuple[str, str, str]] = {
+    "sorting": (f"{__name__}.sorting", "sorting_algorithms", "run_sorting_algorithm"),
+}
+
+_REGISTRY: Dict[str, AlgorithmDescriptor] = {}
+_LOADED: Dict[str, Callable] = {}
+_LOCK = threading.Lock()
+
+# Re-exported from the sorting kind for backwards compatibility.
+_SORTING_EXPORTS = ("SortingOptions", "SortingResult", "run_sorting_algorithm", "sorting_algorithms")
+
+
+def __getattr__(name: str):
+    if name in _SORTING_EXPORTS:
+        return getattr(import_module(_KINDS["sorting"][0]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _load_kind(kind: str) -> Callable:
+    """Import a kind's module on first use and register its algorithms."""
+    runner = _LOADED.get(kind)
+    if runner is not None:
+        return runner
+    spec = _KINDS.get(kind)
+    if spec is None:
+        raise ValueError(f"Unsupported algorithm kind '{kind}'")
+    module_path, catalog_name, runner_name = spec
+    module = import_module(module_path)
+    with _LOCK:
+        for name, details in getattr(module, catalog_name)().items():
+            _REGISTRY[name] = AlgorithmDescriptor(name=name, kind=kind, description=details.description)
+        runner = _LOADED[kind] = getattr(module, runner_name)
+    return runner
+
+
+def list_kinds() -> List[str]:
+    """Known algorithm kinds (does not import any of them)."""
+    return sorted(_KINDS)
+
+
+def list_available(kind: str | None = None) -> List[AlgorithmDescriptor]:
+    """
+    Return available algorithms, optionally filtered by kind (e.g., "sorting").
+    """
+    for candidate in _KINDS if kind is None else [kind] if kind in _KINDS else []:
+        _load_kind(candidate)
+    if kind is None:
+        return list(_REGISTRY.values())
+    return [descriptor for descriptor in _REGISTRY.values() if descriptor.kind == kind]
+
+
+def run(
+    name: str,
+    data: Iterable[int],
+    options: "SortingOptions | None" = None,
+) -> "SortingResult":
+    """
+    Execute an algorithm by name.
+
+    Raises:
+        ValueError: if the algorithm is unknown.
+    """
+    descriptor = _REGISTRY.get(name)
+    if descriptor is None:
+        for kind in _KINDS:
+            _load_kind(kind)
+        descriptor = _REGISTRY.get(name)
+    if not descriptor:
+        raise ValueError(f"Unknown algorithm '{name}'. Known algorithms: {sorted(_REGISTRY)}")
+    return _load_kind(descriptor.kind)(name=name, values=data, options=options)
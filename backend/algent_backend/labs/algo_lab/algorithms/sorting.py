@@ -33,12 +33,20 @@ class SortingResult:
     trace: List[SortingTraceEvent] = field(default_factory=list)
 
 
+SortingObserver = Callable[[List[int] | None, SortingTraceEvent], None]
+"""
+Per-step callback used for live progress. Receives the working array (None when
+the algorithm does not sort in place) and the event describing the step.
+"""
+
+
 @dataclass
 class SortingOptions:
     """Execution flags controlling instrumentation."""
 
     collect_trace: bool = False
     trace_limit: int = 1_000
+    observer: SortingObserver | None = None
 
 
 class SortingAlgorithm(Protocol):
@@ -76,6 +84,7 @@ def _bubble_sort(values: List[int], options: SortingOptions) -> SortingResult:
     swaps = 0
     trace: List[SortingTraceEvent] = []
     trace_limit = options.trace_limit
+    observer = options.observer
 
     for i in range(n):
         for j in range(0, n - i - 1):
@@ -83,6 +92,8 @@ def _bubble_sort(values: List[int], options: SortingOptions) -> SortingResult:
             if arr[j] > arr[j + 1]:
                 swaps += 1
                 arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                if observer is not None:
+                    observer(arr, SortingTraceEvent(action="swap", indices=(j, j + 1), values=(arr[j], arr[j + 1])))
                 if options.collect_trace and len(trace) < trace_limit:
                     trace.append(
                         SortingTraceEvent(
@@ -110,6 +121,7 @@ def _insertion_sort(values: List[int], options: SortingOptions) -> SortingResult
     swaps = 0
     trace: List[SortingTraceEvent] = []
     limit = options.trace_limit
+    observer = options.observer
 
     for i in range(1, len(arr)):
         key = arr[i]
@@ -118,6 +130,8 @@ def _insertion_sort(values: List[int], options: SortingOptions) -> SortingResult
             comparisons += 1
             arr[j + 1] = arr[j]
             swaps += 1
+            if observer is not None:
+                observer(arr, SortingTraceEvent(action="shift", indices=(j, j + 1), values=(arr[j], key)))
             if options.collect_trace and len(trace) < limit:
                 trace.append(
                     SortingTraceEvent(
@@ -128,6 +142,8 @@ def _insertion_sort(values: List[int], options: SortingOptions) -> SortingResult
                 )
             j -= 1
         arr[j + 1] = key
+        if observer is not None:
+            observer(arr, SortingTraceEvent(action="insert", indices=(j + 1, i), values=(key, arr[j + 1])))
         if options.collect_trace and len(trace) < limit:
             trace.append(
                 SortingTraceEvent(
@@ -155,6 +171,7 @@ def _merge_sort(values: List[int], options: SortingOptions) -> SortingResult:
     swaps = 0
     trace: List[SortingTraceEvent] = []
     limit = options.trace_limit
+    observer = options.observer
 
     def merge_sort(data: List[int], depth: int = 0) -> List[int]:
         nonlocal comparisons, swaps, trace
@@ -176,6 +193,9 @@ def _merge_sort(values: List[int], options: SortingOptions) -> SortingResult:
             swaps += 1
         merged.extend(left[i:])
         merged.extend(right[j:])
+        if observer is not None:
+            # Merge sort works on copies, so there is no whole array to sample.
+            observer(None, SortingTraceEvent(action="merge", values=(merged[0], merged[-1])))
         if options.collect_trace and len(trace) < limit:
             trace.append(
                 SortingTraceEvent(
@@ -0,0 +1,49 @@
+"""
+Algo Lab command handlers.
+
+Exposes lab functionality over the shared command contract so the UI and agents
+can drive experiments through `CommandDispatcher` without importing lab code.
+Lab modules are imported inside the handlers, so registering the commands at
+server start-up does not load the lab.
+"""
+from __future__ import annotations
+
+from algent_backend.commands import Command, CommandDispatcher
+
+
+COMMAND_PREFIX = "algo_lab"
+
+
+def _list_algorithms(command: Command) -> dict:
+    from . import algorithms
+
+    kind = command.payload.get("kind")
+    return {
+        "status": "ok",
+        "algorithms": [descriptor.__dict__ for descriptor in algorithms.list_available(kind)],
+    }
+
+
+def _list_metrics(_: Command) -> dict:
+    from . import metrics
+
+    return {"status": "ok", "metrics": metrics.available_metrics()}
+
+
+def _run_sorting(command: Command) -> dict:
+    from .service import AlgoLabService
+
+    result = AlgoLabService().run_sorting(command.payload)
+    return {"status": "ok", "result": result.summary()}
+
+
+def _seeded(command: Command) -> bool:
+    """Only seeded runs are reproducible; unseeded trials must each run."""
+    return (command.payload.get("dataset") or {}).get("seed") is not None
+
+
+def register_commands(dispatcher: CommandDispatcher) -> None:
+    """Register every Algo Lab command on `dispatcher`."""
+    dispatcher.register(f"{COMMAND_PREFIX}.list_algorithms", _list_algorithms, coalesce=True)
+    dispatcher.register(f"{COMMAND_PREFIX}.list_metrics", _list_metrics, coalesce=True)
+    dispatcher.register(f"{COMMAND_PREFIX}.run_sorting", _run_sorting, coalesce=_seeded)
@@ -3,14 +3,31 @@ Experiment definitions and orchestration specific to Algo Lab.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from dataclasses import asdict, dataclass, field
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List
 import time
 
+from algent_backend.telemetry import REGISTRY, span
+
 from . import algorithms, metrics
-from .algorithms.sorting import SortingOptions, SortingResult
+from .algorithms.sorting import SortingObserver, SortingOptions, SortingResult, SortingTraceEvent
 from .datasets import SequenceBatch, SequenceSpec, generate_sequence
 from .metrics import MetricResult
+from .retention import RetainedPayload, retain, validate_policy
+
+
+DEFAULT_METRICS = ("latency_ms", "comparisons", "is_sorted")
+
+# Heavy fields that `ExperimentResult.detail` can add on request.
+DETAIL_FIELDS = ("values", "sorted_values", "trace")
+
+_EXPERIMENT_SECONDS = REGISTRY.histogram(
+    "algent_experiment_duration_seconds",
+    "End-to-end run_experiment latency (dataset, kernel, metrics) by algorithm.",
+    ("algorithm", "outcome"),
+)
 
 
 @dataclass
@@ -20,11 +37,28 @@ class SortingExperimentConfig:
     name: str
     algorithm: str
     dataset: SequenceSpec = field(default_factory=SequenceSpec)
-    metrics: List[str] = field(
-        default_factory=lambda: ["latency_ms", "comparisons", "is_sorted"]
-    )
+    metrics: List[str] = field(default_factory=lambda: list(DEFAULT_METRICS))
     collect_trace: bool = False
     options: Dict[str, Any] = field(default_factory=dict)
+    retention: str = "full"  # see `retention.RETENTION_POLICIES`
+    spill_dir: str | None = None
+
+    @property
+    def deterministic(self) -> bool:
+        """Seeded datasets reproduce the same values, and so the same outcome."""
+        return self.dataset.seed is not None
+
+    def fingerprint(self) -> str:
+        """
+        Stable hash of every field that affects the experiment output.
+
+        Retention settings only change where payloads live, so they are excluded.
+        """
+        fields = asdict(self)
+        fields.pop("retention")
+        fields.pop("spill_dir")
+        canonical = json.dumps(fields, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
 
 
 @dataclass
@@ -36,12 +70,28 @@ class ExperimentPlan:
 
 @dataclass
 class ExperimentResult:
+    """
+    Outcome of a single experiment.
+
+    `dataset` and `outcome` are resolved through the retained payload, so they
+    may be reloaded from disk or recomputed depending on the retention policy.
+    """
+
     experiment: SortingExperimentConfig
-    dataset: SequenceBatch
-    outcome: SortingResult
+    payload: RetainedPayload
     metrics: List[MetricResult]
     planned_at: float
     completed_at: float
+    dataset_summary: dict | None = None
+    outcome_summary: dict | None = None
+
+    @property
+    def dataset(self) -> SequenceBatch:
+        return self.payload.dataset()
+
+    @property
+    def outcome(self) -> SortingResult:
+        return self.payload.outcome()
 
     def summary(self) -> dict:
         return {
@@ -49,9 +99,46 @@ class ExperimentResult:
             "algorithm": self.experiment.algorithm,
             "metrics": [metric.__dict__ for metric in self.metrics],
             "duration_ms": round(self.completed_at - self.planned_at, 3),
-            "dataset": self.dataset.summary(),
+            "dataset": self.dataset_summary,
         }
 
+    def detail(self, include: Iterable[str] = ()) -> dict:
+        """
+        Summary plus any requested heavy fields from `DETAIL_FIELDS`.
+
+        The trace is laid out column-wise (one list per attribute) so numeric
+        columns can be shipped as typed arrays.
+        """
+        include = set(include)
+        payload = self.summary()
+        payload["outcome"] = self.outcome_summary
+        if "values" in include:
+            payload["values"] = self.dataset.values
+        if "sorted_values" in include:
+            payload["sorted_values"] = self.outcome.sorted_values
+        if "trace" in include:
+            payload["trace"] = trace_columns(self.outcome.trace)
+        return payload
+
+
+def trace_columns(trace: List[SortingTraceEvent]) -> dict:
+    """Column-oriented trace: action codes plus index/value columns (-1 when absent)."""
+    actions: List[str] = []
+    codes: Dict[str, int] = {}
+    columns: Dict[str, List[int]] = {"action": [], "i": [], "j": [], "a": [], "b": []}
+    for event in trace:
+        code = codes.setdefault(event.action, len(actions))
+        if code == len(actions):
+            actions.append(event.action)
+        i, j = event.indices if event.indices else (-1, -1)
+        a, b = event.values if event.values else (-1, -1)
+        columns["action"].append(code)
+        columns["i"].append(i)
+        columns["j"].append(j)
+        columns["a"].append(a)
+        columns["b"].append(b)
+    return {"actions": actions, **columns}
+
 
 def plan_experiment(cfg: SortingExperimentConfig) -> ExperimentPlan:
     descriptor = [alg for alg in algorithms.list_available("sorting") if alg.name == cfg.algorithm]
@@ -62,27 +149,70 @@ def plan_experiment(cfg: SortingExperimentConfig) -> ExperimentPlan:
     )
 
 
-def run_experiment(cfg: SortingExperimentConfig) -> ExperimentResult:
+def _execute(
+    cfg: SortingExperimentConfig,
+    observer: SortingObserver | None = None,
+) -> tuple[SequenceBatch, SortingResult]:
+    with span("experiment.dataset", size=cfg.dataset.size):
+        batch = generate_sequence(cfg.dataset)
+    with span("experiment.sort", algorithm=cfg.algorithm):
+        result = algorithms.run(
+            name=cfg.algorithm,
+            data=batch.values,
+            options=SortingOptions(
+                collect_trace=cfg.collect_trace,
+                trace_limit=cfg.options.get("trace_limit", 1000),
+                observer=observer,
+            ),
+        )
+    return batch, result
+
+
+def _outcome_summary(result: SortingResult) -> dict:
+    return {
+        "name": result.name,
+        "comparisons": result.comparisons,
+        "swaps": result.swaps,
+        "duration_ms": round(result.duration_ms, 3),
+        "trace_events": len(result.trace),
+    }
+
+
+def run_experiment(
+    cfg: SortingExperimentConfig,
+    observer: SortingObserver | None = None,
+) -> ExperimentResult:
+    """
+    Plan, execute, and measure a sorting experiment.
+
+    `observer` receives every kernel step (see `SortingObserver`) and is only
+    used for live progress; it is not retained for lazy recomputation.
+    """
+    validate_policy(cfg.retention)
     plan = plan_experiment(cfg)
     if not plan.algorithm_available:
         raise ValueError(f"Algorithm '{cfg.algorithm}' is not registered.")
     planned_at = time.perf_counter()
-    batch = generate_sequence(cfg.dataset)
-    result = algorithms.run(
-        name=cfg.algorithm,
-        data=batch.values,
-        options=SortingOptions(
-            collect_trace=cfg.collect_trace,
-            trace_limit=cfg.options.get("trace_limit", 1000),
-        ),
-    )
-    metric_payload = metrics.compute_metrics(result, batch, cfg.metrics)
+    try:
+        with span("experiment.run", experiment=cfg.name, algorithm=cfg.algorithm):
+            batch, result = _execute(cfg, observer)
+            with span("experiment.metrics", metrics=len(cfg.metrics)):
+                metric_payload = metrics.compute_metrics(result, batch, cfg.metrics)
+    except BaseException:
+        _EXPERIMENT_SECONDS.labels(cfg.algorithm, "error").observe(time.perf_counter() - planned_at)
+        raise
     completed_at = time.perf_counter()
+    _EXPERIMENT_SECONDS.labels(cfg.algorithm, "ok").observe(completed_at - planned_at)
+    keep_summaries = cfg.retention != "metrics_only"
+    dataset_summary = batch.summary() if keep_summaries else None
+    outcome_summary = _outcome_summary(result) if keep_summaries else None
+    recompute = (lambda: _execute(cfg)) if cfg.deterministic else None
     return ExperimentResult(
         experiment=cfg,
-        dataset=batch,
-        outcome=result,
+        payload=retain(cfg.retention, batch, result, recompute, cfg.spill_dir),
         metrics=metric_payload,
         planned_at=planned_at,
         completed_at=completed_at,
+        dataset_summary=dataset_summary,
+        outcome_summary=outcome_summary,
     )
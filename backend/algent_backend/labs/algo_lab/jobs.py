@@ -0,0 +1,166 @@
+"""
+Background job queue for Algo Lab experiments.
+
+Long sweeps should not tie up an HTTP connection. `ExperimentJobQueue` accepts
+experiment configs, runs them on a bounded worker pool, and keeps a small
+history of finished jobs so clients can poll status, fetch results, or cancel.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import Dict, List
+import uuid
+
+from .algorithms.sorting import SortingTraceEvent
+from .experiments import ExperimentResult, SortingExperimentConfig, run_experiment
+from .metrics import sortedness_ratio
+
+
+JOB_STATUSES = ("queued", "running", "succeeded", "failed", "cancelled")
+FINISHED_STATUSES = ("succeeded", "failed", "cancelled")
+
+# Sortedness is O(n), so progress only samples it every this many kernel steps.
+PROGRESS_SAMPLE_EVERY = 1024
+
+
+class QueueFull(Exception):
+    """Raised when the queue already holds `max_depth` unfinished jobs."""
+
+
+class JobCancelled(Exception):
+    """Raised inside the kernel to abort a cancelled job."""
+
+
+@dataclass
+class ExperimentJob:
+    """Status record for a queued experiment."""
+
+    id: str
+    config: SortingExperimentConfig
+    status: str = "queued"
+    steps: int = 0
+    sortedness: float | None = None
+    submitted_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    result: ExperimentResult | None = None
+    error: str | None = None
+    cancel_requested: threading.Event = field(default_factory=threading.Event, repr=False)
+    future: Future | None = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def observe(self, values: List[int] | None, _: SortingTraceEvent) -> None:
+        if self.cancel_requested.is_set():
+            raise JobCancelled()
+        self.steps += 1
+        if values is not None and self.steps % PROGRESS_SAMPLE_EVERY == 0:
+            self.sortedness = round(sortedness_ratio(values), 6)
+
+    def snapshot(self) -> dict:
+        return {
+            "id": self.id,
+            "experiment": self.config.name,
+            "algorithm": self.config.algorithm,
+            "status": self.status,
+            "progress": {"steps": self.steps, "sortedness": self.sortedness},
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+        }
+
+
+class ExperimentJobQueue:
+    """
+    Bounded queue of experiment jobs backed by a thread pool.
+
+    `workers` caps concurrency, `max_depth` caps unfinished (queued + running)
+    jobs, and `history` caps how many finished jobs are remembered.
+    """
+
+    def __init__(self, workers: int = 2, max_depth: int = 64, history: int = 256) -> None:
+        self.max_depth = max_depth
+        self.history = history
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="algent-job")
+        self._jobs: "OrderedDict[str, ExperimentJob]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, cfg: SortingExperimentConfig) -> ExperimentJob:
+        with self._lock:
+            pending = sum(1 for job in self._jobs.values() if not job.finished)
+            if pending >= self.max_depth:
+                raise QueueFull(f"queue already holds {pending} unfinished jobs")
+            job = ExperimentJob(id=uuid.uuid4().hex, config=cfg)
+            self._jobs[job.id] = job
+            self._evict_finished()
+        job.future = self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id: str) -> ExperimentJob | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self) -> List[ExperimentJob]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def cancel(self, job_id: str) -> ExperimentJob | None:
+        """Request cancellation; queued jobs never start, running jobs stop at their next step."""
+        job = self.get(job_id)
+        if job is None or job.finished:
+            return job
+        job.cancel_requested.set()
+        if job.future is not None and job.future.cancel():
+            self._finish(job, "cancelled")
+        return job
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the pool: queued jobs are cancelled, running jobs stop at their next step."""
+        for job in self.list_jobs():
+            job.cancel_requested.set()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        # Futures dropped by the executor never reach `_run`, so record them here.
+        for job in self.list_jobs():
+            if not job.finished and job.future is not None and job.future.cancelled():
+                self._finish(job, "cancelled")
+
+    def _run(self, job: ExperimentJob) -> None:
+        if job.cancel_requested.is_set():
+            self._finish(job, "cancelled")
+            return
+        job.status = "running"
+        job.started_at = time.time()
+        try:
+            job.result = run_experiment(job.config, observer=job.observe)
+        except JobCancelled:
+            self._finish(job, "cancelled")
+            return
+        except Exception as exc:
+            job.error = str(exc)
+            self._finish(job, "failed")
+            return
+        self._finish(job, "succeeded")
+
+    def _finish(self, job: ExperimentJob, status: str) -> None:
+        job.finished_at = time.time()
+        job.status = status
+
+    def _evict_finished(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(0, len(finished) - self.history)]:
+            del self._jobs[job_id]
+
+
+def summarize_jobs(jobs: List[ExperimentJob]) -> Dict[str, int]:
+    """Count jobs per status (used for queue introspection)."""
+    counts = {status: 0 for status in JOB_STATUSES}
+    for job in jobs:
+        counts[job.status] += 1
+    return counts
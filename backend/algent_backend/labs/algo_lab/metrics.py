@@ -42,6 +42,14 @@ def _sortedness(result: SortingResult, _: SequenceBatch) -> MetricResult:
     return MetricResult(name="is_sorted", value=is_sorted)
 
 
+def sortedness_ratio(values: List[int]) -> float:
+    """Fraction of adjacent pairs already in order (1.0 for sorted input)."""
+    if len(values) < 2:
+        return 1.0
+    ordered = sum(1 for i in range(len(values) - 1) if values[i] <= values[i + 1])
+    return ordered / (len(values) - 1)
+
+
 def _digit_entropy(_: SortingResult, batch: SequenceBatch) -> MetricResult:
     if not batch.digits:
         return MetricResult(name="digit_entropy", value=0.0)
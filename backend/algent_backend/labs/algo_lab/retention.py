@@ -0,0 +1,145 @@
+"""
+Retention policies for heavy experiment payloads.
+
+An experiment run produces three full copies of its input (the dataset values,
+the algorithm's copy of the input, and the sorted output) plus an optional
+trace. Sweeps over large inputs cannot afford to keep all of that alive, so
+results hold their heavy fields behind a `RetainedPayload` chosen by policy:
+
+- `full`: keep everything in memory (default, matches historical behavior).
+- `summary`: drop arrays, keep dataset/outcome summaries; reload by recomputing.
+- `metrics_only`: drop arrays and summaries; reload by recomputing.
+- `spill_to_disk`: pickle arrays to a spill file; reload from disk.
+
+Recomputation relies on dataset generation being deterministic, so it is only
+possible when the dataset spec carries a seed; otherwise accessing a dropped
+field raises `PayloadDiscarded`.
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import pickle
+import tempfile
+from typing import Callable, Tuple
+import uuid
+import weakref
+
+from .algorithms.sorting import SortingResult
+from .datasets import SequenceBatch
+
+
+RETENTION_POLICIES = ("full", "summary", "metrics_only", "spill_to_disk")
+
+DEFAULT_SPILL_DIR = Path(tempfile.gettempdir()) / "algent-spill"
+
+Payload = Tuple[SequenceBatch, SortingResult]
+PayloadLoader = Callable[[], Payload]
+
+
+class PayloadDiscarded(RuntimeError):
+    """A heavy field was dropped by the retention policy and cannot be rebuilt."""
+
+
+def validate_policy(policy: str) -> None:
+    if policy not in RETENTION_POLICIES:
+        raise ValueError(
+            f"Unknown retention policy '{policy}'. Expected one of {list(RETENTION_POLICIES)}"
+        )
+
+
+class RetainedPayload:
+    """
+    Holds (or knows how to reload) the heavy fields of an experiment result.
+
+    Reloaded objects are only weakly cached: repeated accesses while the caller
+    still holds them are free, but nothing is pinned in memory once callers let
+    go.
+    """
+
+    def __init__(
+        self,
+        policy: str,
+        *,
+        dataset: SequenceBatch | None = None,
+        outcome: SortingResult | None = None,
+        loader: PayloadLoader | None = None,
+    ) -> None:
+        self.policy = policy
+        self._dataset = dataset
+        self._outcome = outcome
+        self._loader = loader
+        self._dataset_ref: weakref.ReferenceType[SequenceBatch] | None = None
+        self._outcome_ref: weakref.ReferenceType[SortingResult] | None = None
+
+    @property
+    def resident(self) -> bool:
+        """True when the heavy fields are pinned in memory."""
+        return self._dataset is not None and self._outcome is not None
+
+    def dataset(self) -> SequenceBatch:
+        if self._dataset is not None:
+            return self._dataset
+        cached = self._dataset_ref() if self._dataset_ref is not None else None
+        return cached if cached is not None else self._reload()[0]
+
+    def outcome(self) -> SortingResult:
+        if self._outcome is not None:
+            return self._outcome
+        cached = self._outcome_ref() if self._outcome_ref is not None else None
+        return cached if cached is not None else self._reload()[1]
+
+    def _reload(self) -> Payload:
+        if self._loader is None:
+            raise PayloadDiscarded(
+                f"Payload discarded under retention policy '{self.policy}' and cannot be recomputed "
+                "(dataset has no seed)"
+            )
+        dataset, outcome = self._loader()
+        self._dataset_ref = weakref.ref(dataset)
+        self._outcome_ref = weakref.ref(outcome)
+        return dataset, outcome
+
+
+def _spill(batch: SequenceBatch, outcome: SortingResult, spill_dir: Path) -> Path:
+    spill_dir.mkdir(parents=True, exist_ok=True)
+    path = spill_dir / f"{uuid.uuid4().hex}.pkl"
+    with path.open("wb") as handle:
+        pickle.dump((batch, outcome), handle, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _read_spill(path: Path) -> Payload:
+    with path.open("rb") as handle:
+        return pickle.load(handle)
+
+
+def _remove_spill(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def retain(
+    policy: str,
+    batch: SequenceBatch,
+    outcome: SortingResult,
+    recompute: PayloadLoader | None,
+    spill_dir: str | Path | None = None,
+) -> RetainedPayload:
+    """
+    Apply `policy` to a freshly computed payload.
+
+    `recompute` regenerates the payload from scratch; pass None when the run is
+    not reproducible (unseeded), in which case discarded payloads stay gone.
+    """
+    validate_policy(policy)
+    if policy == "full":
+        return RetainedPayload(policy, dataset=batch, outcome=outcome)
+    if policy == "spill_to_disk":
+        path = _spill(batch, outcome, Path(spill_dir) if spill_dir else DEFAULT_SPILL_DIR)
+        payload = RetainedPayload(policy, loader=lambda: _read_spill(path))
+        weakref.finalize(payload, _remove_spill, str(path))
+        return payload
+    return RetainedPayload(policy, loader=recompute)
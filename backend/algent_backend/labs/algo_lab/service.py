@@ -7,31 +7,42 @@ from dataclasses import asdict
 from typing import Any, Dict
 
 from .experiments import (
+    DEFAULT_METRICS,
     ExperimentResult,
     SortingExperimentConfig,
     run_experiment,
 )
 from .datasets import SequenceSpec
+from .streaming import ExperimentStream
 
 
 class AlgoLabService:
     """Facade coordinating experiment planning/execution."""
 
-    def run_sorting(self, payload: Dict[str, Any]) -> ExperimentResult:
+    def build_sorting_config(self, payload: Dict[str, Any]) -> SortingExperimentConfig:
+        """Translate a command/HTTP payload into an experiment config."""
         dataset_cfg = payload.get("dataset") or {}
         if isinstance(dataset_cfg, SequenceSpec):
             dataset_spec = dataset_cfg
         else:
             dataset_spec = SequenceSpec(**dataset_cfg)
-        cfg = SortingExperimentConfig(
+        return SortingExperimentConfig(
             name=payload.get("name", "adhoc-sorting"),
             algorithm=payload["algorithm"],
             dataset=dataset_spec,
-            metrics=payload.get("metrics") or SortingExperimentConfig().metrics,
+            metrics=list(payload.get("metrics") or DEFAULT_METRICS),
             collect_trace=payload.get("collect_trace", False),
             options=payload.get("options", {}),
+            retention=payload.get("retention", "full"),
+            spill_dir=payload.get("spill_dir"),
         )
-        return run_experiment(cfg)
+
+    def run_sorting(self, payload: Dict[str, Any]) -> ExperimentResult:
+        return run_experiment(self.build_sorting_config(payload))
+
+    def stream_sorting(self, payload: Dict[str, Any], **stream_options: Any) -> ExperimentStream:
+        """Start a sorting experiment whose progress can be iterated live."""
+        return ExperimentStream(self.build_sorting_config(payload), **stream_options)
 
     def quickstart(self) -> dict:
         """Convenience helper for smoke tests."""
@@ -42,3 +53,8 @@ class AlgoLabService:
             )
         )
         return result.summary()
+
+
+def run_sorting_tool(**payload: Any) -> dict:
+    """Agent tool form of `AlgoLabService.run_sorting` (picklable for process pools)."""
+    return AlgoLabService().run_sorting(payload).summary()
@@ -0,0 +1,128 @@
+"""
+Live progress streams for Algo Lab experiments.
+
+`ExperimentStream` runs an experiment on a background thread and exposes its
+kernel steps as an iterator of JSON-ready events:
+
+- `progress`: a sampled step (trace event plus sortedness when the kernel sorts
+  in place).
+- `result`: the experiment summary once metrics are computed.
+- `error`: the experiment failed.
+
+Events flow through a bounded queue. When the consumer falls behind and the
+queue fills, the producer never blocks or buffers more: it drops the sample and
+doubles its sampling stride, then halves the stride again once the consumer
+catches up. Slow consumers therefore see coarser progress, not unbounded memory.
+"""
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Any, Dict, Iterator, List
+
+from .algorithms.sorting import SortingTraceEvent
+from .experiments import SortingExperimentConfig, run_experiment
+from .metrics import sortedness_ratio
+
+
+DEFAULT_MAX_PENDING = 256
+DEFAULT_SAMPLE_EVERY = 64
+MAX_SAMPLE_EVERY = 1 << 20
+
+StreamEvent = Dict[str, Any]
+
+
+class StreamCancelled(Exception):
+    """Raised inside the kernel to abort a stream whose consumer went away."""
+
+
+class ExperimentStream:
+    """Iterable of progress events for a single experiment run."""
+
+    def __init__(
+        self,
+        cfg: SortingExperimentConfig,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        sample_every: int = DEFAULT_SAMPLE_EVERY,
+    ) -> None:
+        self.cfg = cfg
+        self.base_stride = max(1, sample_every)
+        self.stride = self.base_stride
+        self.dropped = 0
+        self._steps = 0
+        self._queue: queue.Queue[StreamEvent] = queue.Queue(maxsize=max(1, max_pending))
+        self._low_water = max(1, max_pending // 4)
+        self._cancelled = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def cancel(self) -> None:
+        """Stop the kernel at its next step; safe to call from any thread."""
+        self._cancelled.set()
+
+    def __iter__(self) -> Iterator[StreamEvent]:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._produce, name="algent-stream", daemon=True)
+            self._thread.start()
+        try:
+            while True:
+                event = self._queue.get()
+                yield event
+                if event["event"] in ("result", "error"):
+                    return
+        finally:
+            # A consumer that stops early (break, error, dropped iterator) must
+            # not leave the producer polling a full queue.
+            self.cancel()
+
+    def _produce(self) -> None:
+        try:
+            result = run_experiment(self.cfg, observer=self._observe)
+        except StreamCancelled:
+            return
+        except Exception as exc:
+            self._deliver({"event": "error", "message": str(exc)})
+            return
+        self._deliver(
+            {
+                "event": "result",
+                "steps": self._steps,
+                "dropped": self.dropped,
+                "result": result.summary(),
+            }
+        )
+
+    def _observe(self, values: List[int] | None, event: SortingTraceEvent) -> None:
+        if self._cancelled.is_set():
+            raise StreamCancelled()
+        self._steps += 1
+        if self._steps % self.stride:
+            return
+        payload: StreamEvent = {
+            "event": "progress",
+            "step": self._steps,
+            "action": event.action,
+            "indices": event.indices,
+            "values": event.values,
+        }
+        if values is not None:
+            payload["sortedness"] = round(sortedness_ratio(values), 6)
+        self._offer(payload)
+
+    def _offer(self, payload: StreamEvent) -> None:
+        try:
+            self._queue.put_nowait(payload)
+        except queue.Full:
+            self.dropped += 1
+            self.stride = min(self.stride * 2, MAX_SAMPLE_EVERY)
+            return
+        if self.stride > self.base_stride and self._queue.qsize() <= self._low_water:
+            self.stride //= 2
+
+    def _deliver(self, payload: StreamEvent) -> None:
+        """Blocking put for terminal events; gives up if the stream is cancelled."""
+        while not self._cancelled.is_set():
+            try:
+                self._queue.put(payload, timeout=0.1)
+                return
+            except queue.Full:
+                continue
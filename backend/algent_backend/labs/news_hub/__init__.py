@@ -1,7 +1,36 @@
 """
-News Hub Lab placeholder.
+News Hub Lab.
 
-Future home for ingestion/compression agents targeting news streams.
+Ingestion/compression agents targeting news streams. `ingest` streams local
+RSS/Atom/JSONL dumps into normalized `Article`s with near-duplicates removed
+(MinHash/LSH), so each story reaches agents once; `NewsIndex` keeps them in a
+memory-mapped BM25 index for retrieval. Submodules load lazily on first
+attribute access.
 """
+from importlib import import_module
 
 LAB_NAME = "news_hub"
+
+_SUBMODULES = ("dedup", "feeds", "index", "ingest")
+_ATTRIBUTES = {
+    "Article": ".feeds",
+    "read_feed": ".feeds",
+    "NearDuplicateFilter": ".dedup",
+    "IngestPipeline": ".ingest",
+    "NewsIndex": ".index",
+}
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        value = import_module(f".{name}", __name__)
+    elif name in _ATTRIBUTES:
+        value = getattr(import_module(_ATTRIBUTES[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_SUBMODULES) + list(_ATTRIBUTES))
@@ -0,0 +1,161 @@
+"""
+Near-duplicate detection with MinHash signatures and LSH banding.
+
+Each text is reduced to word shingles and summarized by a one-permutation
+MinHash signature: every shingle is hashed once into one of `num_perm` bins,
+each bin keeps its minimum, and empty bins borrow from the next non-empty bin
+(rotation densification). That is O(shingles) per text instead of
+O(shingles x num_perm) for classic MinHash, with the same Jaccard estimate.
+The signature is split into `bands` bands; two texts whose signatures agree on
+a whole band land in the same bucket and become candidates, and a candidate
+counts as a duplicate when its estimated similarity reaches `threshold`.
+
+Memory is bounded: the filter remembers at most `capacity` recent texts and
+evicts the oldest (signature and bucket entries) first, so a long-running
+stream only deduplicates within that horizon.
+"""
+from __future__ import annotations
+
+from array import array
+from collections import OrderedDict
+import hashlib
+import random
+import re
+import struct
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from .feeds import Article
+
+DEFAULT_NUM_PERM = 64
+DEFAULT_BANDS = 16
+DEFAULT_THRESHOLD = 0.8
+DEFAULT_CAPACITY = 100_000
+DEFAULT_SHINGLE = 3
+
+_MAX_HASH = (1 << 32) - 1
+_EMPTY = 1 << 32  # above any 32-bit bin value
+_WORDS = re.compile(r"\w+")
+
+
+def shingles(text: str, size: int = DEFAULT_SHINGLE) -> set:
+    """Lower-cased word `size`-grams (the whole text when shorter)."""
+    words = _WORDS.findall(text.lower())
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i : i + size]) for i in range(len(words) - size + 1)}
+
+
+class MinHasher:
+    """Computes fixed-length one-permutation MinHash signatures (deterministic for a seed)."""
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, seed: int = 1, shingle: int = DEFAULT_SHINGLE) -> None:
+        self.num_perm = num_perm
+        self.shingle = shingle
+        self._key = seed.to_bytes(8, "little")
+        # Offset added per bin hop when densifying, so borrowed values stay distinct per distance.
+        self._hop = random.Random(seed).randrange(1, _MAX_HASH)
+
+    def signature(self, text: str) -> array:
+        bins = [_EMPTY] * self.num_perm
+        for gram in shingles(text, self.shingle):
+            value = int.from_bytes(hashlib.blake2b(gram.encode("utf-8"), digest_size=8, key=self._key).digest(), "little")
+            index, value = value % self.num_perm, (value >> 32) & _MAX_HASH
+            if value < bins[index]:
+                bins[index] = value
+        if _EMPTY in bins and any(value != _EMPTY for value in bins):
+            filled = list(bins)
+            for index, value in enumerate(bins):
+                distance = 1
+                while value == _EMPTY:
+                    value = bins[(index + distance) % self.num_perm]
+                    if value != _EMPTY:
+                        value = (value + distance * self._hop) & _MAX_HASH
+                    else:
+                        distance += 1
+                filled[index] = value
+            bins = filled
+        return array("I", [min(value, _MAX_HASH) for value in bins])
+
+
+def similarity(left: array, right: array) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(1 for x, y in zip(left, right) if x == y) / len(left)
+
+
+class NearDuplicateFilter:
+    """Bounded LSH index answering "have we seen (almost) this text recently?"."""
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM,
+        bands: int = DEFAULT_BANDS,
+        capacity: int = DEFAULT_CAPACITY,
+        shingle: int = DEFAULT_SHINGLE,
+        seed: int = 1,
+    ) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.capacity = capacity
+        self.hasher = MinHasher(num_perm, seed, shingle)
+        self._signatures: "OrderedDict[str, array]" = OrderedDict()
+        self._buckets: List[Dict[bytes, List[str]]] = [{} for _ in range(bands)]
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._signatures
+
+    def _band_keys(self, signature: array) -> Iterator[Tuple[int, bytes]]:
+        for band in range(self.bands):
+            start = band * self.rows
+            yield band, struct.pack(f"{self.rows}I", *signature[start : start + self.rows])
+
+    def match(self, text: str) -> Tuple[str | None, array]:
+        """Key of a remembered near-duplicate of `text` (or None), plus its signature."""
+        signature = self.hasher.signature(text)
+        seen = set()
+        for band, key in self._band_keys(signature):
+            for candidate in self._buckets[band].get(key, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                if similarity(signature, self._signatures[candidate]) >= self.threshold:
+                    return candidate, signature
+        return None, signature
+
+    def add(self, key: str, signature: array) -> None:
+        if key in self._signatures:
+            return
+        self._signatures[key] = signature
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band].setdefault(band_key, []).append(key)
+        while len(self._signatures) > self.capacity:
+            self._evict()
+
+    def seen(self, key: str, text: str) -> str | None:
+        """Remember `text` under `key` unless it near-duplicates a remembered one (returned)."""
+        duplicate, signature = self.match(text)
+        if duplicate is None:
+            self.add(key, signature)
+        return duplicate
+
+    def filter(self, articles: Iterable[Article]) -> Iterator[Article]:
+        """Yield only articles that are not near-duplicates of earlier ones."""
+        for article in articles:
+            if article.id not in self and self.seen(article.id, article.text) is None:
+                yield article
+
+    def _evict(self) -> None:
+        key, signature = self._signatures.popitem(last=False)
+        for band, band_key in self._band_keys(signature):
+            bucket = self._buckets[band].get(band_key)
+            if bucket is None:
+                continue
+            bucket.remove(key)
+            if not bucket:
+                del self._buckets[band][band_key]
@@ -0,0 +1,169 @@
+"""
+Streaming readers for local feed dumps (RSS 2.0/RDF, Atom, JSONL).
+
+Readers are generators: XML is consumed with `iterparse` and every finished
+item is cleared from the tree, and JSONL is read line by line, so memory stays
+flat however large the dump. Each item is normalized into an `Article`: HTML
+stripped, whitespace collapsed, tracking parameters removed from the link and
+the publication date converted to UTC ISO-8601.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import hashlib
+import html
+import json
+from pathlib import Path
+import re
+from typing import Any, Dict, Iterable, Iterator
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import xml.etree.ElementTree as ET
+
+
+FEED_FORMATS = ("rss", "atom", "jsonl")
+
+_TAGS = re.compile(r"<[^>]+>")
+_SPACE = re.compile(r"\s+")
+_TRACKING_PREFIXES = ("utm_", "fbclid", "gclid", "mc_")
+
+
+@dataclass
+class Article:
+    """One normalized news item."""
+
+    id: str
+    title: str
+    link: str
+    summary: str
+    published: str | None
+    source: str
+
+    @property
+    def text(self) -> str:
+        """Title and summary, the content used for duplicate detection and search."""
+        return f"{self.title}\n{self.summary}" if self.summary else self.title
+
+    def to_dict(self) -> dict:
+        return dict(self.__dict__)
+
+
+def clean_text(value: str | None) -> str:
+    if not value:
+        return ""
+    return _SPACE.sub(" ", html.unescape(_TAGS.sub(" ", value))).strip()
+
+
+def canonical_link(link: str | None) -> str:
+    """Drop fragments and tracking query parameters so reposts share one link."""
+    if not link:
+        return ""
+    parts = urlsplit(link.strip())
+    query = [(key, value) for key, value in parse_qsl(parts.query) if not key.lower().startswith(_TRACKING_PREFIXES)]
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(query), ""))
+
+
+def normalize_date(value: str | None) -> str | None:
+    """RFC 822 (RSS) or ISO-8601 (Atom/JSON) date as UTC ISO-8601; None if unparseable."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat()
+
+
+def make_article(fields: Dict[str, Any], source: str) -> Article | None:
+    """Normalize raw item fields; items without a title or summary are skipped."""
+    title = clean_text(fields.get("title"))
+    summary = clean_text(fields.get("summary") or fields.get("description") or fields.get("content"))
+    if not title and not summary:
+        return None
+    link = canonical_link(fields.get("link") or fields.get("url"))
+    ident = str(fields.get("id") or fields.get("guid") or link or "")
+    if not ident:
+        ident = hashlib.sha1(f"{title}\n{summary}".encode("utf-8")).hexdigest()
+    published = normalize_date(fields.get("published") or fields.get("pubDate") or fields.get("updated") or fields.get("date"))
+    return Article(id=ident, title=title, link=link, summary=summary, published=published, source=source)
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def read_xml_feed(path: str | Path) -> Iterator[Article]:
+    """Yield articles from an RSS/RDF (`<item>`) or Atom (`<entry>`) file."""
+    source = str(path)
+    stack: list = []  # open elements, so a finished item can be detached from its parent
+    item_depth = None
+    fields: Dict[str, Any] = {}
+    for event, element in ET.iterparse(source, events=("start", "end")):
+        tag = _local(element.tag)
+        if event == "start":
+            stack.append(element)
+            if item_depth is None and tag in ("item", "entry"):
+                item_depth, fields = len(stack), {}
+            continue
+        depth = len(stack)
+        stack.pop()
+        if item_depth is not None and depth == item_depth + 1:
+            if tag == "link" and element.get("href"):  # Atom: <link rel="alternate" href=...>
+                if element.get("rel", "alternate") == "alternate":
+                    fields["link"] = element.get("href")
+            elif tag == "encoded":  # content:encoded
+                fields.setdefault("content", element.text)
+            elif element.text and tag not in fields:
+                fields[tag] = element.text
+        if item_depth is not None and depth == item_depth:
+            item_depth = None
+            if stack:
+                stack[-1].remove(element)  # RSS items live under <channel>, Atom entries under the root
+            article = make_article(fields, source)
+            if article is not None:
+                yield article
+
+
+def read_jsonl(path: str | Path) -> Iterator[Article]:
+    """Yield articles from a JSON-lines dump (one item object per line)."""
+    source = str(path)
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                fields = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # a torn line in a dump should not stop the stream
+            if isinstance(fields, dict) and (article := make_article(fields, source)) is not None:
+                yield article
+
+
+def detect_format(path: str | Path) -> str:
+    suffix = Path(path).suffix.lower()
+    if suffix in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if suffix == ".atom":
+        return "atom"
+    return "rss"
+
+
+def read_feed(path: str | Path, fmt: str | None = None) -> Iterator[Article]:
+    """Stream one dump; the format comes from the extension unless `fmt` is given."""
+    fmt = fmt or detect_format(path)
+    if fmt not in FEED_FORMATS:
+        raise ValueError(f"unknown feed format '{fmt}'; expected one of {FEED_FORMATS}")
+    return read_jsonl(path) if fmt == "jsonl" else read_xml_feed(path)
+
+
+def read_feeds(paths: Iterable[str | Path]) -> Iterator[Article]:
+    for path in paths:
+        yield from read_feed(path)
@@ -0,0 +1,78 @@
+"""
+Streaming News Hub ingestion.
+
+`ingest(paths)` chains the feed readers and the near-duplicate filter into one
+lazy pipeline: articles are read, normalized and deduplicated one at a time,
+so agents downstream (summarizers, indexers) only ever see each story once and
+the whole corpus never has to fit in memory. Articles repeating an id or link
+already seen, or whose text near-duplicates a recent article, are dropped and
+counted in `IngestStats` and `algent_news_articles_total`.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, List
+
+from algent_backend.telemetry import REGISTRY
+
+from .dedup import NearDuplicateFilter
+from .feeds import Article, read_feed
+
+_ARTICLES = REGISTRY.counter(
+    "algent_news_articles_total",
+    "News Hub articles read by outcome (accepted, duplicate, near_duplicate).",
+    ("outcome",),
+)
+
+
+@dataclass
+class IngestStats:
+    read: int = 0
+    accepted: int = 0
+    duplicate: int = 0
+    near_duplicate: int = 0
+
+
+@dataclass
+class IngestPipeline:
+    """Reusable pipeline; its duplicate memory persists across `run` calls."""
+
+    dedup: NearDuplicateFilter = field(default_factory=NearDuplicateFilter)
+    stats: IngestStats = field(default_factory=IngestStats)
+    _keys: "OrderedDict[str, None]" = field(default_factory=OrderedDict, init=False, repr=False)
+
+    def run(self, paths: Iterable[str | Path]) -> Iterator[Article]:
+        for path in paths:
+            yield from self.process(read_feed(path))
+
+    def process(self, articles: Iterable[Article]) -> Iterator[Article]:
+        for article in articles:
+            self.stats.read += 1
+            keys = [key for key in (article.id, article.link) if key]
+            if any(key in self._keys for key in keys):
+                self._count("duplicate")
+            elif self.dedup.seen(article.id, article.text) is not None:
+                self._count("near_duplicate")
+            else:
+                self._remember(keys)
+                self._count("accepted")
+                yield article
+
+    def _remember(self, keys: List[str]) -> None:
+        # Same horizon as the near-duplicate filter (two keys per article at most).
+        for key in keys:
+            self._keys[key] = None
+        while len(self._keys) > 2 * self.dedup.capacity:
+            self._keys.popitem(last=False)
+
+    def _count(self, outcome: str) -> None:
+        setattr(self.stats, outcome, getattr(self.stats, outcome) + 1)
+        _ARTICLES.labels(outcome).inc()
+
+
+def ingest(paths: Iterable[str | Path], dedup: NearDuplicateFilter | None = None) -> Iterator[Article]:
+    """Lazily yield the unique articles of the given feed dumps, in file order."""
+    pipeline = IngestPipeline(dedup=dedup or NearDuplicateFilter())
+    return pipeline.run(paths)
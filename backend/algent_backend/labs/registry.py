@@ -0,0 +1,243 @@
+"""
+Lab discovery from metadata manifests.
+
+Every lab ships a `lab.json` next to its `__init__.py` describing it: name,
+description, command names, algorithm kinds and, optionally, the
+`"module:function"` hook that registers its commands (relative to the lab
+package when it starts with a dot). In-tree labs are found by scanning this
+package's directories; installed labs register under the `algent.labs` entry
+point group, each entry naming the lab package (`weather = acme_labs.weather`),
+and their `lab.json` is read from the distribution's files. Neither path
+imports a lab.
+
+The merged manifest is cached in `~/.algent/labs_manifest.json` (or
+`ALGENT_LAB_MANIFEST`), keyed by a fingerprint of the in-tree manifests and of
+the `sys.path` directories, so installing or removing a distribution triggers a
+rescan and other start-ups skip the entry-point scan. `load_lab` imports only
+the requested lab; `register_commands` installs stub handlers that import a lab
+when one of its commands is first dispatched.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+from importlib import import_module
+import json
+import logging
+import os
+from pathlib import Path
+import sys
+import threading
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from algent_backend.commands import Command, CommandDispatcher
+
+ENTRY_POINT_GROUP = "algent.labs"
+MANIFEST_FILE = "lab.json"
+DEFAULT_CACHE_PATH = Path.home() / ".algent" / "labs_manifest.json"
+_CACHE_VERSION = 1
+
+logger = logging.getLogger("algent.labs")
+
+_PACKAGE_DIR = Path(__file__).resolve().parent
+_LOCK = threading.RLock()
+_MANIFESTS: Dict[str, "LabManifest"] | None = None
+_HANDLERS: Dict[str, Dict[str, Tuple[Callable, Dict[str, Any]]]] = {}
+
+
+@dataclass(frozen=True)
+class LabManifest:
+    """What a lab provides, known without importing it."""
+
+    name: str
+    module: str
+    description: str = ""
+    commands: Tuple[str, ...] = ()
+    algorithm_kinds: Tuple[str, ...] = ()
+    register_commands: str | None = None
+    source: str = "builtin"
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], module: str, source: str = "builtin") -> "LabManifest":
+        return cls(
+            name=data["name"],
+            module=data.get("module", module),
+            description=data.get("description", ""),
+            commands=tuple(data.get("commands", ())),
+            algorithm_kinds=tuple(data.get("algorithm_kinds", ())),
+            register_commands=data.get("register_commands"),
+            source=data.get("source", source),
+        )
+
+    def to_dict(self) -> dict:
+        return {**self.__dict__, "commands": list(self.commands), "algorithm_kinds": list(self.algorithm_kinds)}
+
+
+def _builtin_manifest_paths() -> List[Path]:
+    return sorted(_PACKAGE_DIR.glob(f"*/{MANIFEST_FILE}"))
+
+
+def _fingerprint() -> str:
+    """Changes when an in-tree manifest or a `sys.path` directory (installs) changes."""
+    digest = hashlib.sha256()
+    for path in [*_builtin_manifest_paths(), *map(Path, sys.path)]:
+        try:
+            stamp = path.stat().st_mtime_ns
+        except OSError:
+            continue
+        digest.update(f"{path}\0{stamp}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _scan_builtin() -> Dict[str, LabManifest]:
+    manifests = {}
+    for path in _builtin_manifest_paths():
+        module = f"{__package__}.{path.parent.name}"
+        manifest = LabManifest.from_dict(json.loads(path.read_text(encoding="utf-8")), module)
+        manifests[manifest.name] = manifest
+    return manifests
+
+
+def _scan_entry_points() -> Dict[str, LabManifest]:
+    from importlib.metadata import entry_points
+
+    manifests = {}
+    for entry in entry_points(group=ENTRY_POINT_GROUP):
+        data: Dict[str, Any] = {"name": entry.name}
+        source = entry.dist.name if entry.dist is not None else "entry_point"
+        if entry.dist is not None:
+            path = Path(entry.dist.locate_file(f"{entry.module.replace('.', '/')}/{MANIFEST_FILE}"))
+            if path.is_file():
+                data.update(json.loads(path.read_text(encoding="utf-8")))
+        data["name"] = entry.name  # the entry point name is authoritative
+        manifests[entry.name] = LabManifest.from_dict(data, entry.module, source)
+    return manifests
+
+
+def _scan() -> Dict[str, LabManifest]:
+    manifests = _scan_builtin()
+    for name, manifest in _scan_entry_points().items():
+        if name in manifests:
+            logger.warning("lab '%s' from %s shadows an existing lab; ignored", name, manifest.source)
+            continue
+        manifests[name] = manifest
+    return manifests
+
+
+def _cache_path() -> Path:
+    return Path(os.getenv("ALGENT_LAB_MANIFEST") or DEFAULT_CACHE_PATH)
+
+
+def _read_cache(path: Path, fingerprint: str) -> Dict[str, LabManifest] | None:
+    try:
+        document = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if document.get("version") != _CACHE_VERSION or document.get("fingerprint") != fingerprint:
+        return None
+    try:
+        return {item["name"]: LabManifest.from_dict(item, item["module"]) for item in document["labs"]}
+    except (KeyError, TypeError):
+        return None
+
+
+def _write_cache(path: Path, fingerprint: str, manifests: Dict[str, LabManifest]) -> None:
+    document = {
+        "version": _CACHE_VERSION,
+        "fingerprint": fingerprint,
+        "labs": [manifest.to_dict() for manifest in manifests.values()],
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temporary.write_text(json.dumps(document, indent=2), encoding="utf-8")
+        os.replace(temporary, path)
+    except OSError:
+        logger.debug("could not write lab manifest cache %s", path, exc_info=True)
+
+
+def manifests(refresh: bool = False) -> Dict[str, LabManifest]:
+    """Every discoverable lab by name (cached in-process and on disk)."""
+    global _MANIFESTS
+    with _LOCK:
+        if _MANIFESTS is not None and not refresh:
+            return _MANIFESTS
+        path, fingerprint = _cache_path(), _fingerprint()
+        found = None if refresh else _read_cache(path, fingerprint)
+        if found is None:
+            found = _scan()
+            _write_cache(path, fingerprint, found)
+        _MANIFESTS = found
+        return found
+
+
+def list_labs() -> List[LabManifest]:
+    """Lab manifests sorted by name; no lab is imported."""
+    return [manifest for _, manifest in sorted(manifests().items())]
+
+
+def get_manifest(name: str) -> LabManifest:
+    manifest = manifests().get(name)
+    if manifest is None:
+        raise KeyError(f"lab '{name}' not registered")
+    return manifest
+
+
+def load_lab(name: str) -> ModuleType:
+    """Import a lab by name (and only that lab)."""
+    return import_module(get_manifest(name).module)
+
+
+def _resolve(manifest: LabManifest, target: str) -> Callable:
+    module, _, attribute = target.partition(":")
+    return getattr(import_module(module, manifest.module if module.startswith(".") else None), attribute)
+
+
+class _Collector:
+    """Stands in for a dispatcher while a lab's hook registers its handlers."""
+
+    def __init__(self) -> None:
+        self.handlers: Dict[str, Tuple[Callable, Dict[str, Any]]] = {}
+
+    def register(self, name: str, handler: Callable, **options: Any) -> None:
+        self.handlers[name] = (handler, options)
+
+
+def lab_handlers(name: str) -> Dict[str, Tuple[Callable, Dict[str, Any]]]:
+    """Import lab `name` and collect its command handlers with their register options."""
+    with _LOCK:
+        handlers = _HANDLERS.get(name)
+        if handlers is None:
+            manifest = get_manifest(name)
+            collector = _Collector()
+            if manifest.register_commands:
+                _resolve(manifest, manifest.register_commands)(collector)
+            handlers = _HANDLERS[name] = collector.handlers
+        return handlers
+
+
+def register_commands(dispatcher: "CommandDispatcher") -> None:
+    """
+    Register every lab's manifest commands on `dispatcher` without importing
+    any lab. The first dispatch of a lab's command imports it and swaps in its
+    real handlers (with their concurrency and coalescing options).
+    """
+    for manifest in list_labs():
+        if not manifest.register_commands:
+            continue
+        for command_name in manifest.commands:
+            dispatcher.register(command_name, _lazy_handler(dispatcher, manifest.name, command_name))
+
+
+def _lazy_handler(dispatcher: "CommandDispatcher", lab: str, command_name: str) -> Callable[["Command"], dict]:
+    def handler(command: "Command") -> dict:
+        handlers = lab_handlers(lab)
+        for name, (real, options) in handlers.items():
+            dispatcher.register(name, real, **options)
+        if command_name not in handlers:
+            raise LookupError(f"lab '{lab}' lists command '{command_name}' but does not register it")
+        return handlers[command_name][0](command)
+
+    return handler
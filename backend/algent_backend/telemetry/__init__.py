@@ -0,0 +1,24 @@
+"""
+Operational telemetry (metrics and latency tracing).
+
+Kept dependency-free so every layer (HTTP, commands, labs) can instrument
+itself without pulling in a client library.
+"""
+
+from .metrics import (  # noqa: F401
+    PROMETHEUS_CONTENT_TYPE,
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+)
+from .tracing import (  # noqa: F401
+    Span,
+    Tracer,
+    current_span,
+    disable_tracing,
+    enable_tracing,
+    get_tracer,
+    span,
+)
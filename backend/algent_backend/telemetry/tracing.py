@@ -0,0 +1,186 @@
+"""
+In-process latency tracing.
+
+`span(name, **attrs)` times a block. The enclosing span is tracked in a context
+variable, so nesting follows threads started with a copied context, asyncio
+tasks and `asyncio.to_thread`. With tracing disabled (the default) `span`
+returns a shared no-op object, so instrumented hot paths pay one global lookup.
+
+`enable_tracing()` installs a `Tracer` that keeps the most recent `max_spans`
+finished spans; `Tracer.export_chrome(path)` writes them as Chrome trace-event
+JSON, which chrome://tracing or Perfetto render as a per-thread flame chart.
+Setting `ALGENT_TRACE=<path>` enables tracing at import and writes the trace
+to `<path>` at exit (from the main process only; spawned tool workers skip it).
+"""
+from __future__ import annotations
+
+import atexit
+from collections import deque
+from contextvars import ContextVar
+import itertools
+import json
+import multiprocessing
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Deque, Dict, List
+
+DEFAULT_MAX_SPANS = 100_000
+
+
+class Span:
+    """One timed block; attributes end up in the exported event's `args`."""
+
+    __slots__ = ("tracer", "name", "attrs", "span_id", "parent_id", "thread_id", "start_ns", "end_ns", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str, attrs: Dict[str, Any]) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.span_id = next(tracer._ids)
+        parent = _CURRENT.get()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.thread_id = threading.get_ident()
+        self.start_ns = 0
+        self.end_ns = 0
+        self._token = None
+
+    def set(self, **attrs: Any) -> None:
+        self.attrs.update(attrs)
+
+    @property
+    def duration(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def __enter__(self) -> "Span":
+        self._token = _CURRENT.set(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.end_ns = time.perf_counter_ns()
+        _CURRENT.reset(self._token)
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        self.tracer._finish(self)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NOOP = _NoopSpan()
+_CURRENT: ContextVar[Span | None] = ContextVar("algent_trace_span", default=None)
+_TRACER: "Tracer | None" = None
+
+
+class Tracer:
+    """Collects finished spans (bounded) and exports them."""
+
+    def __init__(self, max_spans: int = DEFAULT_MAX_SPANS) -> None:
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._thread_names: Dict[int, str] = {}
+        self._origin_ns = time.perf_counter_ns()
+
+    @property
+    def spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def record(self, name: str, start_ns: int, end_ns: int, thread_id: int | None = None, **attrs: Any) -> Span:
+        """Add a span measured elsewhere (e.g. in a worker process) under the current span."""
+        span = Span(self, name, attrs)
+        span.start_ns, span.end_ns = start_ns, end_ns
+        if thread_id is not None:
+            span.thread_id = thread_id
+        self._finish(span)
+        return span
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+    def export_chrome(self, path: str | Path | None = None) -> Dict[str, Any]:
+        """Chrome trace-event document (complete `X` events plus thread names)."""
+        pid = os.getpid()
+        with self._lock:
+            spans = list(self._spans)
+            thread_names = dict(self._thread_names)
+        events: List[Dict[str, Any]] = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in thread_names.items()
+        ]
+        for span in sorted(spans, key=lambda span: span.start_ns):
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.name.split(".", 1)[0],
+                    "ph": "X",
+                    "ts": (span.start_ns - self._origin_ns) / 1000,
+                    "dur": (span.end_ns - span.start_ns) / 1000,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": {"span_id": span.span_id, "parent_id": span.parent_id, **span.attrs},
+                }
+            )
+        document = {"traceEvents": events, "displayTimeUnit": "ms"}
+        if path is not None:
+            Path(path).write_text(json.dumps(document, default=repr), encoding="utf-8")
+        return document
+
+    def _finish(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+            if span.thread_id not in self._thread_names and span.thread_id == threading.get_ident():
+                self._thread_names[span.thread_id] = threading.current_thread().name
+
+
+def span(name: str, **attrs: Any) -> Span | _NoopSpan:
+    """Time the enclosed block as `name` (a no-op unless tracing is enabled)."""
+    tracer = _TRACER
+    if tracer is None:
+        return _NOOP
+    return Span(tracer, name, attrs)
+
+
+def current_span() -> Span | None:
+    return _CURRENT.get()
+
+
+def get_tracer() -> Tracer | None:
+    return _TRACER
+
+
+def enable_tracing(tracer: Tracer | None = None) -> Tracer:
+    global _TRACER
+    _TRACER = tracer or Tracer()
+    return _TRACER
+
+
+def disable_tracing() -> Tracer | None:
+    """Stop recording; returns the tracer that was active (for a final export)."""
+    global _TRACER
+    tracer, _TRACER = _TRACER, None
+    return tracer
+
+
+def _enable_from_env() -> None:
+    path = os.getenv("ALGENT_TRACE")
+    if path and multiprocessing.parent_process() is None:
+        tracer = enable_tracing()
+        atexit.register(tracer.export_chrome, path)
+
+
+_enable_from_env()
@@ -0,0 +1,11 @@
+"""
+Performance benchmarks for the backend.
+
+Suites (`bench_*.py`) register benchmarks for the Algo Lab kernels (sorting
+at several sizes and dataset shapes, `generate_sequence`, `compute_metrics`),
+command dispatch, and HTTP latency/throughput against a local server. Run
+them with `python -m benchmarks run --save <name>` (results land in
+`benchmarks/baselines/<name>.json`) and check a change with
+`python -m benchmarks compare <baseline> <current>`, which exits non-zero on
+statistically significant regressions.
+"""
@@ -0,0 +1,78 @@
+"""
+Command line entry point (run from `backend/`).
+
+    python -m benchmarks list [-k PATTERN]
+    python -m benchmarks run [-k PATTERN] [--quick] [--repeats N] [--min-time S] [--save NAME | -o PATH]
+    python -m benchmarks compare BASELINE CURRENT [--threshold 0.05] [--alpha 0.01]
+
+BASELINE/CURRENT are result files or names under `benchmarks/baselines/`.
+`compare` exits with status 1 when any benchmark regressed.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import List
+
+from . import harness
+from .compare import DEFAULT_ALPHA, DEFAULT_THRESHOLD, compare_runs, environment_differences, format_report, format_time
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Backend performance benchmarks.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    listing = commands.add_parser("list", help="list registered benchmarks")
+    listing.add_argument("-k", dest="patterns", action="append", default=[], help="substring filter (repeatable)")
+    listing.add_argument("--quick", action="store_true", help="only the quick subset")
+
+    run = commands.add_parser("run", help="measure benchmarks and write a results file")
+    run.add_argument("-k", dest="patterns", action="append", default=[], help="substring filter (repeatable)")
+    run.add_argument("--quick", action="store_true", help="only the quick subset (smallest inputs)")
+    run.add_argument("--repeats", type=int, default=harness.DEFAULT_REPEATS, help="samples per benchmark")
+    run.add_argument("--min-time", type=float, default=harness.DEFAULT_MIN_TIME, help="minimum seconds per sample")
+    target = run.add_mutually_exclusive_group()
+    target.add_argument("--save", metavar="NAME", help="write benchmarks/baselines/NAME.json")
+    target.add_argument("-o", "--output", metavar="PATH", help="write results to PATH")
+
+    compare = commands.add_parser("compare", help="compare two results files")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="minimum relative change")
+    compare.add_argument("--alpha", type=float, default=DEFAULT_ALPHA, help="significance level")
+    return parser
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = _parser().parse_args(argv)
+    if args.command == "list":
+        for bench in harness.select(args.patterns, args.quick):
+            print(bench.name)
+        return 0
+
+    if args.command == "run":
+        selected = harness.select(args.patterns, args.quick)
+        if not selected:
+            print("no benchmarks selected", file=sys.stderr)
+            return 2
+        width = max(len(bench.name) for bench in selected)
+
+        def progress(name: str, result: dict) -> None:
+            spread = result["stdev"] / result["mean"] * 100 if result["mean"] else 0.0
+            print(f"{name.ljust(width)}  {format_time(result['median']):>10}  +-{spread:.1f}%", flush=True)
+
+        document = harness.run(selected, args.repeats, args.min_time, progress)
+        if args.save or args.output:
+            print(f"results written to {harness.save(document, args.save or args.output)}")
+        return 0
+
+    baseline, current = harness.load(args.baseline), harness.load(args.current)
+    for difference in environment_differences(baseline, current):
+        print(f"warning: environment differs ({difference})", file=sys.stderr)
+    comparisons = compare_runs(baseline, current, args.threshold, args.alpha)
+    print(format_report(comparisons))
+    return 1 if any(item.status == "regression" for item in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
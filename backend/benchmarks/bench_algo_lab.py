@@ -0,0 +1,93 @@
+"""Algo Lab kernels: sorting algorithms, dataset generation and metrics."""
+from __future__ import annotations
+
+from typing import Dict
+
+from algent_backend.labs.algo_lab.algorithms.sorting import run_sorting_algorithm
+from algent_backend.labs.algo_lab.datasets import SequenceSpec, generate_sequence
+from algent_backend.labs.algo_lab.metrics import available_metrics, compute_metrics
+
+from .harness import register
+
+SEED = 1234
+
+# Dataset shapes shared by the sorting and generation benchmarks.
+SHAPES: Dict[str, dict] = {
+    "random": {},
+    "nearly_sorted": {"nearly_sorted_ratio": 0.05},
+    "reversed": {"reversed": True},
+    "few_unique": {"max_value": 9},
+}
+
+# Quadratic kernels stop at smaller sizes so a full run stays in minutes.
+SORTING_SIZES = {
+    "bubble_sort": (100, 500),
+    "insertion_sort": (100, 500),
+    "merge_sort": (100, 1_000, 10_000),
+}
+
+
+def _spec(size: int, shape: str, **overrides) -> SequenceSpec:
+    fields = {"max_value": max(999, size * 10), **SHAPES[shape], **overrides}
+    return SequenceSpec(size=size, seed=SEED, **fields)
+
+
+def _sorting(algorithm: str, size: int, shape: str) -> None:
+    register(
+        "algo_lab.sort",
+        lambda values: run_sorting_algorithm(algorithm, values),
+        "sorting",
+        setup=lambda: generate_sequence(_spec(size, shape)).values,
+        quick=size == 100 and shape == "random",
+        algorithm=algorithm,
+        n=size,
+        shape=shape,
+    )
+
+
+for _algorithm, _sizes in SORTING_SIZES.items():
+    for _size in _sizes:
+        for _shape in SHAPES:
+            _sorting(_algorithm, _size, _shape)
+
+
+GENERATION_SHAPES: Dict[str, dict] = {
+    **{shape: {} for shape in ("random", "nearly_sorted", "reversed")},
+    "unique": {"allow_duplicates": False},
+    "digits": {"digit_width": 7},
+}
+
+
+def _generation(size: int, shape: str) -> None:
+    overrides = GENERATION_SHAPES[shape]
+    base = "random" if shape in ("unique", "digits") else shape
+    register(
+        "algo_lab.generate_sequence",
+        generate_sequence,
+        "datasets",
+        setup=lambda: _spec(size, base, **overrides),
+        quick=size == 1_000 and shape == "random",
+        n=size,
+        shape=shape,
+    )
+
+
+for _size in (1_000, 100_000):
+    for _shape in GENERATION_SHAPES:
+        _generation(_size, _shape)
+
+
+def _metrics_input(size: int):
+    batch = generate_sequence(_spec(size, "random", max_value=9_999, digit_width=4))
+    return run_sorting_algorithm("merge_sort", batch.values), batch, available_metrics()
+
+
+for _size in (1_000, 10_000):
+    register(
+        "algo_lab.compute_metrics",
+        lambda state: compute_metrics(*state),
+        "metrics",
+        setup=lambda size=_size: _metrics_input(size),
+        quick=_size == 1_000,
+        n=_size,
+    )
@@ -0,0 +1,59 @@
+"""Command dispatch overhead: the synchronous path, the bus, and a real lab command."""
+from __future__ import annotations
+
+from algent_backend.app import build_dispatcher
+from algent_backend.commands import Command, CommandDispatcher
+
+from .harness import register
+
+BATCH = 64
+
+
+def _echo_dispatcher() -> CommandDispatcher:
+    dispatcher = CommandDispatcher()
+    dispatcher.register("bench.echo", lambda command: {"status": "ok", "payload": command.payload}, coalesce=True)
+    dispatcher.register("bench.echo_uncoalesced", lambda command: {"status": "ok"})
+    return dispatcher
+
+
+def _close(dispatcher: CommandDispatcher) -> None:
+    dispatcher.close()
+
+
+_PAYLOAD = {"algorithm": "merge_sort", "dataset": {"size": 64, "seed": 1}, "metrics": ["latency_ms"]}
+
+register(
+    "commands.dispatch",
+    lambda dispatcher: dispatcher.dispatch(Command("bench.echo", {"n": 1})),
+    "commands",
+    setup=_echo_dispatcher,
+    teardown=_close,
+    quick=True,
+    coalesce=True,
+)
+register(
+    "commands.dispatch",
+    lambda dispatcher: dispatcher.dispatch(Command("bench.echo_uncoalesced", {"n": 1})),
+    "commands",
+    setup=_echo_dispatcher,
+    teardown=_close,
+    coalesce=False,
+)
+register(
+    "commands.dispatch_many",
+    lambda dispatcher: dispatcher.dispatch_many(Command("bench.echo", {"n": index}) for index in range(BATCH)),
+    "commands",
+    setup=_echo_dispatcher,
+    teardown=_close,
+    ops=BATCH,
+    quick=True,
+    batch=BATCH,
+)
+register(
+    "commands.dispatch",
+    lambda dispatcher: dispatcher.dispatch(Command("algo_lab.run_sorting", _PAYLOAD)),
+    "commands",
+    setup=build_dispatcher,
+    teardown=_close,
+    command="algo_lab.run_sorting",
+)
@@ -0,0 +1,101 @@
+"""HTTP request latency and throughput against a local server on an ephemeral port."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import http.client
+import json
+import threading
+from typing import List
+
+from algent_backend.app import PooledHTTPServer, create_server
+from algent_backend.commands import CommandDispatcher
+
+from .harness import register
+
+CLIENTS = 8
+REQUESTS_PER_CLIENT = 25
+
+_COMMAND = json.dumps({"name": "bench.echo", "payload": {"n": 1}})
+_HEADERS = {"Content-Type": "application/json"}
+
+
+@dataclass
+class _Server:
+    server: PooledHTTPServer
+    thread: threading.Thread
+    connection: http.client.HTTPConnection
+
+
+def _start() -> _Server:
+    dispatcher = CommandDispatcher()
+    dispatcher.register("bench.echo", lambda command: {"status": "ok", "payload": command.payload})
+    server = create_server(("127.0.0.1", 0), dispatcher=dispatcher)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return _Server(server, thread, http.client.HTTPConnection(*server.server_address, timeout=10))
+
+
+def _stop(state: _Server) -> None:
+    state.connection.close()
+    state.server.shutdown()
+    state.server.server_close()
+    state.thread.join(5)
+
+
+def _request(connection: http.client.HTTPConnection, method: str, path: str, body: str | None = None) -> bytes:
+    connection.request(method, path, body=body, headers=_HEADERS if body is not None else {})
+    response = connection.getresponse()
+    payload = response.read()
+    if response.status != 200:
+        raise RuntimeError(f"{method} {path} returned {response.status}")
+    return payload
+
+
+def _concurrent(state: _Server) -> None:
+    """CLIENTS connections, each sending REQUESTS_PER_CLIENT keep-alive command requests."""
+    errors: List[BaseException] = []
+
+    def client() -> None:
+        connection = http.client.HTTPConnection(*state.server.server_address, timeout=10)
+        try:
+            for _ in range(REQUESTS_PER_CLIENT):
+                _request(connection, "POST", "/commands", _COMMAND)
+        except BaseException as exc:  # surfaced in the measuring thread
+            errors.append(exc)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=client) for _ in range(CLIENTS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+register(
+    "http.get_health",
+    lambda state: _request(state.connection, "GET", "/health"),
+    "http",
+    setup=_start,
+    teardown=_stop,
+    quick=True,
+)
+register(
+    "http.post_command",
+    lambda state: _request(state.connection, "POST", "/commands", _COMMAND),
+    "http",
+    setup=_start,
+    teardown=_stop,
+    quick=True,
+)
+register(
+    "http.post_command_concurrent",
+    _concurrent,
+    "http",
+    setup=_start,
+    teardown=_stop,
+    ops=CLIENTS * REQUESTS_PER_CLIENT,
+    clients=CLIENTS,
+)
@@ -0,0 +1,135 @@
+"""
+Compare two benchmark runs.
+
+A benchmark counts as a regression (or improvement) only when both hold:
+its median changed by more than `threshold` (relative), and a two-sided
+Mann-Whitney U test on the two sample sets gives p < `alpha`. The rank test
+makes no normality assumption, so a few outlier samples (a GC pause, a noisy
+neighbour) neither hide a real shift nor fake one.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+from statistics import NormalDist
+from typing import List, Sequence
+
+DEFAULT_THRESHOLD = 0.05
+DEFAULT_ALPHA = 0.01
+
+STATUSES = ("regression", "improvement", "unchanged", "added", "removed")
+
+
+def mann_whitney_u(left: Sequence[float], right: Sequence[float]) -> float:
+    """Two-sided p-value (normal approximation, tie-corrected, continuity-corrected)."""
+    n1, n2 = len(left), len(right)
+    if not n1 or not n2:
+        return 1.0
+    pooled = sorted([(value, 0) for value in left] + [(value, 1) for value in right])
+    n = n1 + n2
+    rank_sum = 0.0
+    ties = 0.0
+    index = 0
+    while index < n:
+        end = index
+        while end + 1 < n and pooled[end + 1][0] == pooled[index][0]:
+            end += 1
+        rank = (index + end) / 2 + 1  # average rank of the tied run
+        count = end - index + 1
+        ties += count**3 - count
+        rank_sum += rank * sum(1 for _, side in pooled[index : end + 1] if side == 0)
+        index = end + 1
+    u = rank_sum - n1 * (n1 + 1) / 2
+    mean = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = max(0.0, abs(u - mean) - 0.5) / math.sqrt(variance)
+    return 2 * (1 - NormalDist().cdf(z))
+
+
+@dataclass
+class Comparison:
+    """Outcome for one benchmark (times are medians in seconds)."""
+
+    name: str
+    status: str
+    baseline: float | None = None
+    current: float | None = None
+    p_value: float | None = None
+
+    @property
+    def ratio(self) -> float | None:
+        if self.baseline is None or self.current is None or self.baseline == 0:
+            return None
+        return self.current / self.baseline
+
+
+def compare_runs(
+    baseline: dict,
+    current: dict,
+    threshold: float = DEFAULT_THRESHOLD,
+    alpha: float = DEFAULT_ALPHA,
+) -> List[Comparison]:
+    """Compare two results documents benchmark by benchmark (sorted by name)."""
+    before, after = baseline["benchmarks"], current["benchmarks"]
+    comparisons = []
+    for name in sorted(set(before) | set(after)):
+        if name not in after:
+            comparisons.append(Comparison(name, "removed", baseline=before[name]["median"]))
+            continue
+        if name not in before:
+            comparisons.append(Comparison(name, "added", current=after[name]["median"]))
+            continue
+        old, new = before[name], after[name]
+        p_value = mann_whitney_u(old["samples"], new["samples"])
+        comparison = Comparison(name, "unchanged", old["median"], new["median"], p_value)
+        ratio = comparison.ratio
+        if ratio is not None and p_value < alpha:
+            if ratio > 1 + threshold:
+                comparison.status = "regression"
+            elif ratio < 1 - threshold:
+                comparison.status = "improvement"
+        comparisons.append(comparison)
+    return comparisons
+
+
+def environment_differences(baseline: dict, current: dict) -> List[str]:
+    """Environment fields (other than the commit) that differ between the runs."""
+    before, after = baseline.get("environment", {}), current.get("environment", {})
+    return [
+        f"{key}: {before.get(key)} -> {after.get(key)}"
+        for key in sorted(set(before) | set(after))
+        if key != "commit" and before.get(key) != after.get(key)
+    ]
+
+
+def format_time(seconds: float | None) -> str:
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def format_report(comparisons: Sequence[Comparison]) -> str:
+    rows = [("benchmark", "baseline", "current", "change", "p", "status")]
+    for item in comparisons:
+        ratio = item.ratio
+        rows.append(
+            (
+                item.name,
+                format_time(item.baseline),
+                format_time(item.current),
+                "-" if ratio is None else f"{(ratio - 1) * 100:+.1f}%",
+                "-" if item.p_value is None else f"{item.p_value:.3g}",
+                item.status.upper() if item.status == "regression" else item.status,
+            )
+        )
+    widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+    lines = ["  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in rows]
+    counts = {status: sum(1 for item in comparisons if item.status == status) for status in STATUSES}
+    lines.append("")
+    lines.append(", ".join(f"{count} {status}" for status, count in counts.items() if count))
+    return "\n".join(lines)
@@ -0,0 +1,195 @@
+"""
+Benchmark registry and timing loop.
+
+A `Benchmark` pairs a timed function with optional `setup`/`teardown`; the
+timed function receives whatever `setup` returned, so inputs are built (and
+servers started) outside the measurement. `measure` calibrates how many calls
+make one sample last at least `min_time` (the calibration doubles as warm-up),
+then takes `repeats` samples with the garbage collector paused, as `timeit`
+does. Samples are seconds per operation: a call that performs `ops` operations
+(e.g. a batch of HTTP requests) is divided accordingly.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import gc
+from importlib import import_module
+import json
+import math
+import os
+from pathlib import Path
+import platform
+import statistics
+import subprocess
+import time
+from typing import Any, Callable, Dict, Iterable, List, Sequence
+
+RESULTS_VERSION = 1
+DEFAULT_REPEATS = 15
+DEFAULT_MIN_TIME = 0.05
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+SUITES = ("benchmarks.bench_algo_lab", "benchmarks.bench_commands", "benchmarks.bench_http")
+
+_MAX_NUMBER = 1 << 20
+
+
+@dataclass
+class Benchmark:
+    """One measured operation."""
+
+    name: str
+    func: Callable[[Any], Any]
+    group: str
+    setup: Callable[[], Any] | None = None
+    teardown: Callable[[Any], None] | None = None
+    params: Dict[str, Any] = field(default_factory=dict)
+    ops: int = 1
+    quick: bool = False  # part of the `--quick` subset
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def register(
+    name: str,
+    func: Callable[[Any], Any],
+    group: str,
+    *,
+    setup: Callable[[], Any] | None = None,
+    teardown: Callable[[Any], None] | None = None,
+    ops: int = 1,
+    quick: bool = False,
+    **params: Any,
+) -> Benchmark:
+    """Add a benchmark; `params` are recorded with its results (and shown in its name)."""
+    if params:
+        name = f"{name}[{','.join(f'{key}={value}' for key, value in params.items())}]"
+    if name in BENCHMARKS:
+        raise ValueError(f"benchmark '{name}' already registered")
+    bench = BENCHMARKS[name] = Benchmark(name, func, group, setup, teardown, params, ops, quick)
+    return bench
+
+
+def discover() -> Dict[str, Benchmark]:
+    for suite in SUITES:
+        import_module(suite)
+    return BENCHMARKS
+
+
+def select(patterns: Sequence[str] = (), quick: bool = False) -> List[Benchmark]:
+    """Benchmarks whose name contains any of `patterns` (all when empty)."""
+    return [
+        bench
+        for name, bench in discover().items()
+        if (not patterns or any(pattern in name for pattern in patterns)) and (bench.quick or not quick)
+    ]
+
+
+def _time(func: Callable[[Any], Any], state: Any, number: int) -> float:
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(number):
+            func(state)
+        return time.perf_counter() - start
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def measure(bench: Benchmark, repeats: int = DEFAULT_REPEATS, min_time: float = DEFAULT_MIN_TIME) -> dict:
+    """Run `bench` and summarize its per-operation samples (seconds)."""
+    state = bench.setup() if bench.setup is not None else None
+    try:
+        number = 1
+        while True:
+            elapsed = _time(bench.func, state, number)
+            if elapsed >= min_time or number >= _MAX_NUMBER:
+                break
+            number = min(_MAX_NUMBER, number * max(2, min(10, math.ceil(min_time / elapsed)) if elapsed > 0 else 10))
+        samples = [_time(bench.func, state, number) / (number * bench.ops) for _ in range(repeats)]
+    finally:
+        if bench.teardown is not None:
+            bench.teardown(state)
+    return {
+        "group": bench.group,
+        "params": bench.params,
+        "unit": "s",
+        "number": number,
+        "ops": bench.ops,
+        "samples": samples,
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "min": min(samples),
+    }
+
+
+def _commit() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "commit": _commit(),
+    }
+
+
+def run(
+    benchmarks: Iterable[Benchmark],
+    repeats: int = DEFAULT_REPEATS,
+    min_time: float = DEFAULT_MIN_TIME,
+    progress: Callable[[str, dict], None] | None = None,
+) -> dict:
+    """Measure `benchmarks` in order and return a results document."""
+    results = {}
+    for bench in benchmarks:
+        results[bench.name] = measure(bench, repeats, min_time)
+        if progress is not None:
+            progress(bench.name, results[bench.name])
+    return {
+        "version": RESULTS_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "environment": environment(),
+        "settings": {"repeats": repeats, "min_time": min_time},
+        "benchmarks": results,
+    }
+
+
+def resolve_path(name_or_path: str | Path) -> Path:
+    """A file path as given, or the name of a baseline in `benchmarks/baselines/`."""
+    path = Path(name_or_path)
+    if path.suffix == ".json" or path.parent != Path("."):
+        return path
+    return BASELINE_DIR / f"{path}.json"
+
+
+def save(document: dict, name_or_path: str | Path) -> Path:
+    path = resolve_path(name_or_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=1), encoding="utf-8")
+    return path
+
+
+def load(name_or_path: str | Path) -> dict:
+    document = json.loads(resolve_path(name_or_path).read_text(encoding="utf-8"))
+    if document.get("version") != RESULTS_VERSION:
+        raise ValueError(f"unsupported results version {document.get('version')!r}")
+    return document
@@ -0,0 +1,16 @@
+"""Shared fixtures: keep every `~/.algent` default inside pytest's temporary directory."""
+import pytest
+
+
+@pytest.fixture(scope="session")
+def algent_home(tmp_path_factory):
+    return tmp_path_factory.mktemp("algent_home")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_algent_home(algent_home, monkeypatch):
+    # Process-wide caches (response cache, lab manifest) may outlive a single
+    # test, so they share one session directory rather than a per-test one.
+    monkeypatch.setenv("ALGENT_LAB_MANIFEST", str(algent_home / "labs_manifest.json"))
+    monkeypatch.setenv("ALGENT_NEWS_INDEX", str(algent_home / "news_index"))
+    monkeypatch.setenv("ALGENT_RESPONSE_CACHE_PATH", str(algent_home / "response_cache.sqlite3"))
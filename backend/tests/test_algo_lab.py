@@ -1,8 +1,12 @@
+import time
+
 from algent_backend.labs.algo_lab.datasets import SequenceSpec, generate_sequence
 from algent_backend.labs.algo_lab.experiments import (
     SortingExperimentConfig,
     run_experiment,
 )
+from algent_backend.labs.algo_lab.jobs import ExperimentJobQueue, summarize_jobs
+from algent_backend.labs.algo_lab.streaming import ExperimentStream
 
 
 def test_sequence_generation_with_digits():
@@ -25,3 +29,74 @@ def test_sorting_experiment_executes_and_reports_metrics():
     metric_names = {metric.name for metric in result.metrics}
     assert "latency_ms" in metric_names
     assert "is_sorted" in metric_names
+
+
+def test_summary_retention_drops_payload_and_recomputes_on_access():
+    cfg = SortingExperimentConfig(
+        name="unit-retention",
+        algorithm="merge_sort",
+        dataset=SequenceSpec(size=32, seed=3),
+        retention="summary",
+    )
+    result = run_experiment(cfg)
+    assert not result.payload.resident
+    assert result.summary()["dataset"]["size"] == 32
+    assert result.outcome.sorted_values == sorted(result.dataset.values)
+
+
+def test_spill_to_disk_retention_reloads_payload(tmp_path):
+    cfg = SortingExperimentConfig(
+        name="unit-spill",
+        algorithm="insertion_sort",
+        dataset=SequenceSpec(size=16),
+        retention="spill_to_disk",
+        spill_dir=str(tmp_path),
+    )
+    result = run_experiment(cfg)
+    assert len(list(tmp_path.iterdir())) == 1
+    assert result.outcome.sorted_values == sorted(result.dataset.values)
+
+
+def test_stream_emits_progress_then_result_and_throttles_when_full():
+    cfg = SortingExperimentConfig(
+        name="unit-stream",
+        algorithm="bubble_sort",
+        dataset=SequenceSpec(size=200, seed=5),
+    )
+    stream = ExperimentStream(cfg, max_pending=2, sample_every=1)
+    events = []
+    for event in stream:
+        events.append(event)
+        time.sleep(0.001)  # slow consumer
+    assert events[-1]["event"] == "result"
+    assert events[-1]["result"]["algorithm"] == "bubble_sort"
+    progress = [event for event in events if event["event"] == "progress"]
+    assert progress and 0.0 <= progress[0]["sortedness"] <= 1.0
+    assert stream.dropped > 0
+    assert len(progress) + stream.dropped <= events[-1]["steps"]
+
+
+def test_stream_stops_producer_when_consumer_breaks_early():
+    cfg = SortingExperimentConfig(
+        name="unit-stream-break",
+        algorithm="bubble_sort",
+        dataset=SequenceSpec(size=2000, seed=5),
+    )
+    stream = ExperimentStream(cfg, max_pending=2, sample_every=1)
+    for _ in stream:
+        break
+    stream._thread.join(2)
+    assert not stream._thread.is_alive()
+
+
+def test_job_queue_shutdown_cancels_jobs_still_waiting_for_a_worker():
+    queue = ExperimentJobQueue(workers=1)
+    running = queue.submit(SortingExperimentConfig(name="slow", algorithm="bubble_sort", dataset=SequenceSpec(size=5000, seed=1)))
+    waiting = [
+        queue.submit(SortingExperimentConfig(name=f"queued-{i}", algorithm="merge_sort", dataset=SequenceSpec(size=16, seed=i)))
+        for i in range(3)
+    ]
+    queue.shutdown(wait=True)
+    assert running.status == "cancelled"
+    assert all(job.status == "cancelled" and job.finished_at is not None for job in waiting)
+    assert summarize_jobs(queue.list_jobs())["queued"] == 0
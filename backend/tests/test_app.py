@@ -0,0 +1,248 @@
+"""Exercise the stdlib HTTP server end to end on an ephemeral port."""
+import gzip
+import http.client
+import json
+import threading
+import time
+
+import pytest
+
+from algent_backend.api import encoding
+from algent_backend.app import PooledHTTPServer, build_dispatcher, create_server
+from algent_backend.config import Settings
+
+
+@pytest.fixture
+def server():
+    dispatcher = build_dispatcher()
+    release = threading.Event()
+    dispatcher.register("test.block", lambda cmd: {"released": release.wait(5)})
+    srv = create_server(("127.0.0.1", 0), dispatcher=dispatcher)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv, release
+    release.set()
+    srv.shutdown()
+    srv.server_close()
+
+
+def _post(conn, path, body):
+    conn.request("POST", path, body=json.dumps(body), headers={"Content-Type": "application/json"})
+    response = conn.getresponse()
+    return response.status, json.loads(response.read())
+
+
+def test_keep_alive_serves_health_and_commands_on_one_connection(server):
+    srv, _ = server
+    conn = http.client.HTTPConnection(*srv.server_address, timeout=5)
+    conn.request("GET", "/health")
+    response = conn.getresponse()
+    assert response.version == 11
+    assert json.loads(response.read())["status"] == "ok"
+    status, payload = _post(
+        conn,
+        "/commands",
+        {"name": "algo_lab.run_sorting", "payload": {"algorithm": "merge_sort", "dataset": {"size": 16, "seed": 1}}},
+    )
+    assert status == 200
+    assert payload["result"]["algorithm"] == "merge_sort"
+    status, payload = _post(conn, "/commands", {"name": "missing"})
+    assert status == 404
+    conn.close()
+
+
+def test_health_is_served_while_a_command_blocks(server):
+    srv, release = server
+    blocked = http.client.HTTPConnection(*srv.server_address, timeout=5)
+    worker = threading.Thread(target=_post, args=(blocked, "/commands", {"name": "test.block"}))
+    worker.start()
+    time.sleep(0.05)
+    probe = http.client.HTTPConnection(*srv.server_address, timeout=5)
+    started = time.perf_counter()
+    probe.request("GET", "/health")
+    assert probe.getresponse().status == 200
+    assert time.perf_counter() - started < 1.0
+    release.set()
+    worker.join(5)
+    probe.close()
+    blocked.close()
+
+
+def test_idle_keep_alive_connections_do_not_hold_workers():
+    settings = Settings(http_workers=1, http_backlog=1, keepalive_timeout=1.0)
+    srv = PooledHTTPServer(("127.0.0.1", 0), dispatcher=build_dispatcher(settings), settings=settings)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    try:
+        # One worker: if idle connections held it, each request below would
+        # wait out the previous connection's keep-alive timeout.
+        conns = [http.client.HTTPConnection(*srv.server_address, timeout=5) for _ in range(4)]
+        for conn in conns + conns[:1]:
+            started = time.perf_counter()
+            conn.request("GET", "/health")
+            response = conn.getresponse()
+            assert response.status == 200 and response.read()
+            assert time.perf_counter() - started < 0.5
+        # Parked connections are still closed once the keep-alive timeout passes.
+        time.sleep(1.5)
+        assert conns[1].sock.recv(1) == b""
+    finally:
+        srv.shutdown()
+        srv.server_close()
+
+
+def test_experiment_stream_is_chunked_ndjson(server):
+    srv, _ = server
+    conn = http.client.HTTPConnection(*srv.server_address, timeout=5)
+    body = {"algorithm": "insertion_sort", "dataset": {"size": 64, "seed": 2}, "stream": {"sample_every": 4}}
+    conn.request("POST", "/experiments/stream", body=json.dumps(body))
+    response = conn.getresponse()
+    assert response.getheader("Transfer-Encoding") == "chunked"
+    events = [json.loads(line) for line in response.read().splitlines()]
+    assert events[0]["event"] == "progress"
+    assert events[-1]["event"] == "result"
+    conn.request("GET", "/health")
+    assert conn.getresponse().status == 200
+    conn.close()
+
+
+def test_experiment_job_lifecycle(server):
+    srv, _ = server
+    conn = http.client.HTTPConnection(*srv.server_address, timeout=5)
+    status, payload = _post(conn, "/experiments", {"algorithm": "merge_sort", "dataset": {"size": 32, "seed": 4}})
+    assert status == 202
+    job_id = payload["job"]["id"]
+    deadline = time.time() + 5
+    while time.time() < deadline:
+        conn.request("GET", f"/experiments/jobs/{job_id}")
+        job = json.loads(conn.getresponse().read())["job"]
+        if job["status"] == "succeeded":
+            break
+        time.sleep(0.01)
+    conn.request("GET", f"/experiments/jobs/{job_id}/result")
+    response = conn.getresponse()
+    assert response.status == 200
+    assert json.loads(response.read())["result"]["algorithm"] == "merge_sort"
+    conn.close()
+
+
+def test_running_job_can_be_cancelled(server):
+    srv, _ = server
+    conn = http.client.HTTPConnection(*srv.server_address, timeout=5)
+    status, payload = _post(conn, "/experiments", {"algorithm": "bubble_sort", "dataset": {"size": 5000, "seed": 4}})
+    job_id = payload["job"]["id"]
+    status, payload = _post(conn, f"/experiments/jobs/{job_id}/cancel", {})
+    assert status == 202
+    deadline = time.time() + 5
+    while not srv.jobs.get(job_id).finished and time.time() < deadline:
+        time.sleep(0.01)
+    assert srv.jobs.get(job_id).status == "cancelled"
+    conn.close()
+
+
+def test_job_result_reports_discarded_payload(server):
+    srv, _ = server
+    conn = http.client.HTTPConnection(*srv.server_address, timeout=5)
+    body = {"algorithm": "merge_sort", "dataset": {"size": 32}, "retention": "metrics_only"}
+    _, payload = _post(conn, "/experiments", body)
+    job = srv.jobs.get(payload["job"]["id"])
+    job.future.result(timeout=5)
+    conn.request("GET", f"/experiments/jobs/{job.id}/result")
+    response = conn.getresponse()
+    assert response.status == 200 and "values" not in json.loads(response.read())["result"]
+    conn.request("GET", f"/experiments/jobs/{job.id}/result?include=values")
+    response = conn.getresponse()
+    assert response.status == 409
+    assert "discarded" in json.loads(response.read())["message"]
+    conn.close()
+
+
+def test_job_result_negotiates_binary_frame(server):
+    srv, _ = server
+    conn = http.client.HTTPConnection(*srv.server_address, timeout=5)
+    _, payload = _post(conn, "/experiments", {"algorithm": "merge_sort", "dataset": {"size": 512, "seed": 9}})
+    job = srv.jobs.get(payload["job"]["id"])
+    job.future.result(timeout=5)
+    conn.request(
+        "GET",
+        f"/experiments/jobs/{job.id}/result?include=values,sorted_values",
+        headers={"Accept": encoding.FRAME_CONTENT_TYPE, "Accept-Encoding": "gzip"},
+    )
+    response = conn.getresponse()
+    assert response.getheader("Content-Encoding") == "gzip"
+    result = encoding.decode_frame(gzip.decompress(response.read()))["result"]
+    assert result["sorted_values"] == sorted(result["values"])
+    conn.close()
+
+
+def test_seeded_results_support_conditional_get(server):
+    srv, _ = server
+    conn = http.client.HTTPConnection(*srv.server_address, timeout=5)
+    status, payload = _post(conn, "/experiments/results", {"algorithm": "bubble_sort", "dataset": {"size": 64, "seed": 3}})
+    assert status == 200
+    conn.request("GET", payload["location"] + "?include=sorted_values")
+    first = conn.getresponse()
+    etag, body = first.getheader("ETag"), first.read()
+    conn.request("GET", payload["location"] + "?include=sorted_values")
+    second = conn.getresponse()
+    assert second.read() == body  # served from cache, not recomputed
+    conn.request("GET", payload["location"] + "?include=sorted_values", headers={"If-None-Match": etag})
+    revalidated = conn.getresponse()
+    assert revalidated.status == 304
+    assert revalidated.read() == b""
+    status, _ = _post(conn, "/experiments/results", {"algorithm": "bubble_sort", "dataset": {"size": 8}})
+    assert status == 400
+    conn.close()
+
+
+def test_revalidation_after_eviction_does_not_recompute(server, monkeypatch):
+    srv, _ = server
+    srv.results.max_entries = 1
+    conn = http.client.HTTPConnection(*srv.server_address, timeout=5)
+    _, first = _post(conn, "/experiments/results", {"algorithm": "merge_sort", "dataset": {"size": 64, "seed": 5}})
+    conn.request("GET", first["location"], headers={"Accept-Encoding": "gzip"})
+    response = conn.getresponse()
+    etag = response.getheader("ETag")
+    response.read()
+    _, second = _post(conn, "/experiments/results", {"algorithm": "merge_sort", "dataset": {"size": 64, "seed": 6}})
+    conn.request("GET", second["location"])
+    conn.getresponse().read()  # evicts the first entry
+
+    def fail(cfg):
+        raise AssertionError("recomputed for a 304")
+
+    monkeypatch.setattr("algent_backend.labs.algo_lab.experiments.run_experiment", fail)
+    conn.request("GET", first["location"], headers={"If-None-Match": etag, "Accept-Encoding": "gzip"})
+    revalidated = conn.getresponse()
+    assert revalidated.status == 304 and revalidated.getheader("ETag") == etag
+    revalidated.read()
+    conn.close()
+
+
+def test_metrics_endpoint_reports_routes_and_commands(server):
+    srv, _ = server
+    conn = http.client.HTTPConnection(*srv.server_address, timeout=5)
+    _post(conn, "/commands", {"name": "algo_lab.list_metrics"})
+    conn.request("GET", "/experiments/jobs/unknown-id")
+    conn.getresponse().read()
+    conn.request("GET", "/metrics")
+    response = conn.getresponse()
+    text = response.read().decode("utf-8")
+    assert response.getheader("Content-Type").startswith("text/plain")
+    assert 'algent_command_duration_seconds_count{command="algo_lab.list_metrics",outcome="ok"}' in text
+    assert 'route="/experiments/jobs/{id}",status="404"' in text
+    conn.close()
+
+
+def test_keep_alive_requests_are_not_held_back_by_nagle(server):
+    # Headers and body go out in separate writes; with Nagle on, every
+    # keep-alive response waits ~40 ms for the client's delayed ACK.
+    srv, _ = server
+    conn = http.client.HTTPConnection(*srv.server_address, timeout=5)
+    conn.request("GET", "/health")
+    conn.getresponse().read()
+    started = time.perf_counter()
+    for _ in range(20):
+        conn.request("GET", "/health")
+        conn.getresponse().read()
+    assert time.perf_counter() - started < 0.4
+    conn.close()
@@ -0,0 +1,68 @@
+"""Benchmark harness and run comparison (statistics, report, CLI exit status)."""
+import copy
+import random
+
+from benchmarks import harness
+from benchmarks.__main__ import main
+from benchmarks.compare import compare_runs, format_report, mann_whitney_u
+
+
+def _document(samples_by_name):
+    return {
+        "version": harness.RESULTS_VERSION,
+        "environment": {"python": "3.11"},
+        "benchmarks": {
+            name: {"samples": samples, "median": sorted(samples)[len(samples) // 2]}
+            for name, samples in samples_by_name.items()
+        },
+    }
+
+
+def _noisy(center, count=15, seed=0):
+    rng = random.Random(seed)
+    return [center * rng.uniform(0.97, 1.03) for _ in range(count)]
+
+
+def test_mann_whitney_separates_shifted_samples_from_noise():
+    assert mann_whitney_u(_noisy(1.0, seed=1), _noisy(1.0, seed=2)) > 0.05
+    assert mann_whitney_u(_noisy(1.0, seed=1), _noisy(1.2, seed=2)) < 0.001
+    assert mann_whitney_u([1.0] * 5, [1.0] * 5) == 1.0
+
+
+def test_compare_flags_only_significant_changes():
+    baseline = _document({"slow": _noisy(1.0), "fast": _noisy(1.0), "same": _noisy(1.0), "gone": _noisy(1.0)})
+    current = _document(
+        {"slow": _noisy(1.3, seed=3), "fast": _noisy(0.6, seed=4), "same": _noisy(1.0, seed=5), "new": _noisy(1.0)}
+    )
+    statuses = {item.name: item.status for item in compare_runs(baseline, current)}
+    assert statuses == {"slow": "regression", "fast": "improvement", "same": "unchanged", "gone": "removed", "new": "added"}
+    # A significant but tiny shift stays below the relative threshold.
+    nudged = _document({"same": [value * 1.02 for value in baseline["benchmarks"]["same"]["samples"]]})
+    assert compare_runs(_document({"same": baseline["benchmarks"]["same"]["samples"]}), nudged)[0].status == "unchanged"
+    assert "REGRESSION" in format_report(compare_runs(baseline, current))
+
+
+def test_run_save_and_compare_cli(tmp_path, capsys):
+    selected = harness.select(["commands.dispatch[coalesce=True]"])
+    assert [bench.name for bench in selected] == ["commands.dispatch[coalesce=True]"]
+    document = harness.run(selected, repeats=3, min_time=0.001)
+    result = document["benchmarks"]["commands.dispatch[coalesce=True]"]
+    assert len(result["samples"]) == 3 and result["median"] > 0
+    assert document["settings"] == {"repeats": 3, "min_time": 0.001}
+
+    # Fifteen samples per side, the slower run three times the baseline.
+    name = "commands.dispatch[coalesce=True]"
+    before, after = copy.deepcopy(document), copy.deepcopy(document)
+    before["benchmarks"][name]["samples"] = result["samples"] * 5
+    after["benchmarks"][name].update(samples=[value * 3 for value in result["samples"] * 5], median=result["median"] * 3)
+    baseline = harness.save(before, tmp_path / "baseline.json")
+    current = harness.save(after, tmp_path / "current.json")
+
+    assert main(["compare", str(baseline), str(baseline)]) == 0
+    assert main(["compare", str(baseline), str(current)]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+
+
+def test_quick_subset_covers_every_group():
+    groups = {bench.group for bench in harness.select(quick=True)}
+    assert groups == {"sorting", "datasets", "metrics", "commands", "http"}
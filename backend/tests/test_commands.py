@@ -1,4 +1,8 @@
 """Light sanity checks for the command model."""
+import asyncio
+import threading
+import time
+
 from algent_backend.commands import CommandDispatcher
 from algent_backend.commands.models import Command
 
@@ -14,3 +18,114 @@ def test_dispatcher_handles_unknown_command():
     dispatcher = CommandDispatcher()
     result = dispatcher.dispatch(Command(name="missing"))
     assert result["status"] == "unhandled"
+
+
+def test_bus_runs_ui_commands_before_queued_agent_commands():
+    dispatcher = CommandDispatcher(workers=1)
+    gate = threading.Event()
+    order = []
+    dispatcher.register("block", lambda cmd: {"ok": gate.wait(5)})
+    dispatcher.register("record", lambda cmd: order.append(cmd.payload["id"]) or {})
+    blocker = dispatcher.submit(Command(name="block"))
+    agent = [dispatcher.submit(Command(name="record", payload={"id": f"agent-{i}"}, source="agent")) for i in range(3)]
+    ui = dispatcher.submit(Command(name="record", payload={"id": "ui"}, source="ui"))
+    gate.set()
+    for future in [blocker, ui, *agent]:
+        future.result(timeout=5)
+    assert order[0] == "ui"
+    dispatcher.close()
+
+
+def test_dispatch_many_respects_per_command_concurrency_cap():
+    dispatcher = CommandDispatcher(workers=4)
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def handler(cmd):
+        with lock:
+            active.append(cmd)
+            peak.append(len(active))
+        time.sleep(0.01)
+        with lock:
+            active.remove(cmd)
+        return {"id": cmd.payload["id"]}
+
+    dispatcher.register("capped", handler, max_concurrency=2)
+    dispatcher.register("boom", lambda cmd: 1 / 0)
+    commands = [Command(name="capped", payload={"id": i}) for i in range(6)] + [Command(name="boom")]
+    results = dispatcher.dispatch_many(commands, timeout=5)
+    assert [result.get("id") for result in results[:6]] == list(range(6))
+    assert results[-1]["status"] == "error"
+    assert max(peak) <= 2
+    dispatcher.close()
+
+
+def test_middleware_wraps_handlers_outermost_first():
+    calls = []
+
+    def tag(label):
+        def middleware(command, call_next):
+            calls.append(label)
+            return call_next(command)
+
+        return middleware
+
+    dispatcher = CommandDispatcher(middleware=[tag("outer"), tag("inner")])
+    dispatcher.register("ping", lambda cmd: {"ok": True})
+    assert asyncio.run(dispatcher.adispatch(Command(name="ping"))) == {"ok": True}
+    assert calls == ["outer", "inner"]
+    dispatcher.close()
+
+
+def test_identical_in_flight_commands_are_coalesced_only_when_opted_in():
+    dispatcher = CommandDispatcher(workers=4)
+    gate = threading.Event()
+    calls = {"refresh": 0, "append": 0}
+
+    def handler(name):
+        def run(cmd):
+            calls[name] += 1
+            gate.wait(5)
+            return {"experiment": cmd.payload["experiment"]}
+
+        return run
+
+    dispatcher.register("refresh", handler("refresh"), coalesce=True)
+    dispatcher.register("append", handler("append"))
+    refresh = [dispatcher.submit(Command(name="refresh", payload={"experiment": "e1"})) for _ in range(3)]
+    append = [dispatcher.submit(Command(name="append", payload={"experiment": "e1"})) for _ in range(3)]
+    time.sleep(0.05)
+    gate.set()
+    assert [future.result(timeout=5) for future in refresh] == [{"experiment": "e1"}] * 3
+    [future.result(timeout=5) for future in append]
+    assert calls == {"refresh": 1, "append": 3}
+    dispatcher.close()
+
+
+def test_coalescing_respects_priority_and_predicates():
+    dispatcher = CommandDispatcher(workers=4)
+    gate = threading.Event()
+    calls = []
+
+    def run(cmd):
+        calls.append((cmd.source, cmd.payload.get("seed")))
+        gate.wait(5)
+        return {"ok": True}
+
+    dispatcher.register("trial", run, coalesce=lambda cmd: cmd.payload.get("seed") is not None)
+    futures = [
+        dispatcher.submit(Command(name="trial", payload={"seed": 1}, source="agent")),
+        dispatcher.submit(Command(name="trial", payload={"seed": 1}, source="agent")),
+        dispatcher.submit(Command(name="trial", payload={"seed": 1}, source="ui")),
+        dispatcher.submit(Command(name="trial", payload={}, source="agent")),
+        dispatcher.submit(Command(name="trial", payload={}, source="agent")),
+    ]
+    time.sleep(0.05)
+    gate.set()
+    [future.result(timeout=5) for future in futures]
+    # One seeded run per priority; every unseeded trial runs on its own.
+    assert sorted(calls, key=repr) == sorted(
+        [("agent", 1), ("ui", 1), ("agent", None), ("agent", None)], key=repr
+    )
+    dispatcher.close()
@@ -0,0 +1,66 @@
+"""Credential resolution and settings."""
+import threading
+
+from algent_backend.config import credentials
+
+
+def test_credential_resolver_caches_keyring_lookups(monkeypatch):
+    lookups = []
+
+    class FakeKeyring:
+        @staticmethod
+        def get_password(service, key_name):
+            lookups.append(key_name)
+            return "from-keyring"
+
+        @staticmethod
+        def set_password(service, key_name, value):
+            pass
+
+    monkeypatch.setattr(credentials, "keyring", FakeKeyring)
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    resolver = credentials.CredentialResolver(ttl=60)
+    resolver.prefetch(background=False)
+    for _ in range(100):
+        assert resolver.get("openai") == "from-keyring"
+    assert lookups.count("openai_api_key") == 1
+    monkeypatch.setenv("OPENAI_API_KEY", "from-env")
+    assert resolver.get("openai") == "from-env"
+
+
+def test_set_provider_api_key_replaces_a_cached_key(monkeypatch):
+    stored = {"openai_api_key": "old"}
+    reading = threading.Event()
+    release = threading.Event()
+
+    class FakeKeyring:
+        @staticmethod
+        def get_password(service, key_name):
+            value = stored.get(key_name)
+            reading.set()
+            release.wait(5)
+            return value
+
+        @staticmethod
+        def set_password(service, key_name, value):
+            stored[key_name] = value
+
+    monkeypatch.setattr(credentials, "keyring", FakeKeyring)
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setattr(credentials, "_RESOLVER", credentials.CredentialResolver(ttl=60))
+
+    # A cache miss reads the old key from the keyring while the new one is set.
+    lookup = threading.Thread(target=credentials.get_provider_api_key, args=("openai",))
+    lookup.start()
+    assert reading.wait(5)
+    writer = threading.Thread(target=credentials.set_provider_api_key, args=("openai", "new"))
+    writer.start()
+    writer.join(0.05)
+    assert writer.is_alive()  # waits for the lookup instead of racing it
+    release.set()
+    lookup.join(5)
+    writer.join(5)
+
+    assert credentials.get_provider_api_key("openai") == "new"
+    credentials.set_provider_api_key("openai", "newer")
+    assert credentials.get_provider_api_key("openai") == "newer"
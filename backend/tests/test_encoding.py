@@ -0,0 +1,27 @@
+"""Response encoding round-trips and negotiation."""
+import gzip
+import json
+import random
+
+from algent_backend.api import encoding
+
+
+def test_frame_round_trips_and_shrinks_numeric_arrays():
+    rng = random.Random(0)
+    values = [rng.randint(0, 999) for _ in range(5000)]
+    payload = {"name": "demo", "values": values, "sorted_values": sorted(values), "short": [1, 2]}
+    frame = encoding.encode_frame(payload)
+    assert encoding.decode_frame(frame) == payload
+    assert len(frame) < len(json.dumps(payload)) / 2
+
+
+def test_negotiation_and_compression():
+    content_type, content_encoding = encoding.negotiate(
+        "application/x-algent-frame, application/json;q=0.5", "br;q=1, gzip"
+    )
+    assert content_type == encoding.FRAME_CONTENT_TYPE
+    assert content_encoding == "gzip"
+    assert encoding.negotiate(None, "gzip;q=0") == (encoding.JSON_CONTENT_TYPE, None)
+    body, applied = encoding.encode_body({"values": list(range(2000))}, encoding.JSON_CONTENT_TYPE, "gzip")
+    assert applied == "gzip"
+    assert json.loads(gzip.decompress(body))["values"][-1] == 1999
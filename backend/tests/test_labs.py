@@ -0,0 +1,118 @@
+"""Lab discovery: manifests are listed without importing labs, which load on first use."""
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+from algent_backend.commands import Command, CommandDispatcher
+from algent_backend.labs import registry
+
+_LIST_PROBE = """
+import json, sys
+from algent_backend.labs import list_labs
+labs = [manifest.to_dict() for manifest in list_labs()]
+print(json.dumps({"labs": labs, "modules": sorted(sys.modules)}))
+"""
+
+
+@pytest.fixture
+def fresh_registry(tmp_path, monkeypatch):
+    monkeypatch.setenv("ALGENT_LAB_MANIFEST", str(tmp_path / "labs_manifest.json"))
+    monkeypatch.setattr(registry, "_MANIFESTS", None)
+    monkeypatch.setattr(registry, "_HANDLERS", {})
+    return tmp_path / "labs_manifest.json"
+
+
+@pytest.fixture
+def installed_lab(tmp_path, monkeypatch):
+    """A distribution on sys.path that registers `acme_lab` through the entry point group."""
+    site = tmp_path / "site"
+    package = site / "acme_lab"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "commands.py").write_text(
+        "def register_commands(dispatcher):\n"
+        "    dispatcher.register('acme.ping', lambda command: {'status': 'ok', 'pong': command.payload})\n"
+    )
+    (package / "lab.json").write_text(
+        json.dumps(
+            {
+                "name": "acme",
+                "description": "Acme lab",
+                "register_commands": ".commands:register_commands",
+                "commands": ["acme.ping"],
+                "algorithm_kinds": ["graph"],
+            }
+        )
+    )
+    info = site / "acme_lab-1.0.dist-info"
+    info.mkdir()
+    (info / "METADATA").write_text("Metadata-Version: 2.1\nName: acme-lab\nVersion: 1.0\n")
+    (info / "entry_points.txt").write_text(f"[{registry.ENTRY_POINT_GROUP}]\nacme = acme_lab\n")
+    monkeypatch.syspath_prepend(str(site))
+    yield "acme"
+    for name in [name for name in sys.modules if name.startswith("acme_lab")]:
+        del sys.modules[name]
+
+
+def test_listing_labs_imports_no_lab(tmp_path):
+    completed = subprocess.run(
+        [sys.executable, "-c", _LIST_PROBE],
+        cwd=Path(__file__).resolve().parents[1],
+        env={**os.environ, "ALGENT_LAB_MANIFEST": str(tmp_path / "labs_manifest.json")},
+        capture_output=True,
+        text=True,
+        timeout=30,
+        check=True,
+    )
+    report = json.loads(completed.stdout.strip().splitlines()[-1])
+    labs = {lab["name"]: lab for lab in report["labs"]}
+    assert {"algo_lab", "news_hub"} <= set(labs)
+    assert labs["algo_lab"]["algorithm_kinds"] == ["sorting"]
+    assert not [name for name in report["modules"] if name.startswith(("algent_backend.labs.algo_lab", "algent_backend.labs.news_hub"))]
+
+
+def test_builtin_manifests_match_the_labs(fresh_registry):
+    from algent_backend.labs.algo_lab import algorithms
+
+    manifest = registry.get_manifest("algo_lab")
+    assert sorted(registry.lab_handlers("algo_lab")) == sorted(manifest.commands)
+    assert list(manifest.algorithm_kinds) == algorithms.list_kinds()
+    assert registry.load_lab("news_hub").LAB_NAME == "news_hub"
+    with pytest.raises(KeyError):
+        registry.load_lab("missing")
+
+
+def test_entry_point_lab_loads_on_first_command(fresh_registry, installed_lab):
+    manifest = registry.get_manifest(installed_lab)
+    assert manifest.source == "acme-lab"
+    assert manifest.module == "acme_lab"
+    assert manifest.algorithm_kinds == ("graph",)
+    assert "acme_lab" not in sys.modules
+
+    dispatcher = CommandDispatcher()
+    registry.register_commands(dispatcher)
+    assert "acme_lab" not in sys.modules
+    assert dispatcher.dispatch(Command("acme.ping", {"n": 1})) == {"status": "ok", "pong": {"n": 1}}
+    assert "acme_lab.commands" in sys.modules
+    assert dispatcher.dispatch(Command("acme.ping", {"n": 2}))["pong"] == {"n": 2}
+
+
+def test_manifest_cache_is_reused_until_the_fingerprint_changes(fresh_registry, installed_lab, monkeypatch):
+    assert installed_lab in registry.manifests()
+    assert fresh_registry.exists()
+
+    def fail():
+        raise AssertionError("rescanned despite a valid cache")
+
+    monkeypatch.setattr(registry, "_MANIFESTS", None)
+    monkeypatch.setattr(registry, "_scan", fail)
+    assert installed_lab in registry.manifests()
+
+    monkeypatch.setattr(registry, "_fingerprint", lambda: "changed")
+    monkeypatch.setattr(registry, "_MANIFESTS", None)
+    with pytest.raises(AssertionError):
+        registry.manifests()
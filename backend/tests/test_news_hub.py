@@ -0,0 +1,85 @@
+"""News Hub streaming ingestion and near-duplicate filtering."""
+import json
+
+from algent_backend.labs.news_hub import feeds
+from algent_backend.labs.news_hub.dedup import NearDuplicateFilter
+from algent_backend.labs.news_hub.feeds import read_feed
+from algent_backend.labs.news_hub.ingest import IngestPipeline
+
+STORY = (
+    "The central bank raised interest rates by a quarter point on Tuesday, citing persistent inflation "
+    "in services and a tight labour market, and signalled that further increases remain possible this year."
+)
+
+RSS = f"""<?xml version="1.0"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/"><channel>
+<title>Wire</title>
+<item><title>Rates rise</title><link>https://news.example/rates?utm_source=x#top</link>
+<description>&lt;p&gt;{STORY}&lt;/p&gt;</description><pubDate>Tue, 02 Jan 2024 10:00:00 +0100</pubDate></item>
+<item><title>Local team wins</title><link>https://news.example/sport</link>
+<description>The local team won the cup final after extra time in front of a record crowd.</description></item>
+</channel></rss>"""
+
+ATOM = f"""<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>Mirror</title>
+<entry><id>urn:mirror:1</id><title>Rates rise</title><link rel="alternate" href="https://mirror.example/a1"/>
+<summary>{STORY.replace("Tuesday", "Tuesday morning")}</summary><updated>2024-01-02T09:30:00Z</updated></entry>
+</feed>"""
+
+
+def _write(tmp_path):
+    (tmp_path / "wire.xml").write_text(RSS)
+    (tmp_path / "mirror.atom").write_text(ATOM)
+    lines = [
+        {"id": "j1", "title": "Rates rise", "url": "https://news.example/rates", "summary": "repost"},
+        {"id": "j2", "title": "Storm warning", "summary": "Heavy snow is expected across the north tonight."},
+    ]
+    (tmp_path / "dump.jsonl").write_text("\n".join(json.dumps(line) for line in lines) + "\n{torn")
+    return [tmp_path / "wire.xml", tmp_path / "mirror.atom", tmp_path / "dump.jsonl"]
+
+
+def test_readers_normalize_items(tmp_path):
+    wire, mirror, dump = _write(tmp_path)
+    first = next(read_feed(wire))
+    assert first.link == "https://news.example/rates"
+    assert first.summary.startswith("The central bank") and "<p>" not in first.summary
+    assert first.published == "2024-01-02T09:00:00+00:00"
+    atom = next(read_feed(mirror))
+    assert (atom.id, atom.link, atom.published) == ("urn:mirror:1", "https://mirror.example/a1", "2024-01-02T09:30:00+00:00")
+    assert [article.id for article in read_feed(dump)] == ["j1", "j2"]
+
+
+def test_rss_reader_detaches_finished_items(tmp_path, monkeypatch):
+    items = "".join(f"<item><title>Story {i}</title><description>Body {i}</description></item>" for i in range(5000))
+    path = tmp_path / "big.xml"
+    path.write_text(f"<rss><channel><title>Wire</title>{items}</channel></rss>")
+    channels = []
+    iterparse = feeds.ET.iterparse
+
+    def spy(source, events):
+        for event, element in iterparse(source, events=events):
+            if event == "start" and element.tag == "channel":
+                channels.append(element)
+            yield event, element
+
+    monkeypatch.setattr(feeds.ET, "iterparse", spy)
+    sizes = [len(channels[0]) for _ in read_feed(path)]
+    assert len(sizes) == 5000
+    # Only items already parsed from the current read-ahead chunk are pending.
+    assert max(sizes) < 500
+    assert len(channels[0]) == 1
+
+
+def test_pipeline_drops_exact_and_near_duplicates(tmp_path):
+    pipeline = IngestPipeline()
+    titles = [article.title for article in pipeline.run(_write(tmp_path))]
+    assert titles == ["Rates rise", "Local team wins", "Storm warning"]
+    assert (pipeline.stats.read, pipeline.stats.duplicate, pipeline.stats.near_duplicate) == (5, 1, 1)
+
+
+def test_filter_memory_is_bounded():
+    dedup = NearDuplicateFilter(capacity=50)
+    for i in range(500):
+        dedup.seen(f"a{i}", f"unique story number {i} about topic {i * 7} in region {i % 13}")
+    assert len(dedup) == 50
+    assert sum(len(bucket) for band in dedup._buckets for bucket in band.values()) == 50 * dedup.bands
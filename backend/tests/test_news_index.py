@@ -0,0 +1,131 @@
+"""Segmented, memory-mapped BM25 index for News Hub."""
+import math
+import random
+
+from algent_backend.agent_system.integration import ToolCall, ToolRegistry
+from algent_backend.labs.news_hub import index as news_index
+from algent_backend.labs.news_hub.feeds import Article
+from algent_backend.labs.news_hub.index import NewsIndex, tokenize
+
+CORPUS = [
+    ("Central bank raises interest rates", "Rates rise a quarter point as inflation persists."),
+    ("Cup final goes to extra time", "The local team won the cup final in extra time."),
+    ("Snow storm warning", "Heavy snow and a storm are expected across the north."),
+    ("Inflation cools slightly", "Consumer prices rose less than expected; rates may hold."),
+    ("Team signs new striker", "The club signed a striker before the cup tie."),
+    ("Storm damage closes roads", "Roads closed after the storm brought down trees."),
+]
+
+
+def _articles(start=0):
+    for i, (title, summary) in enumerate(CORPUS):
+        yield Article(id=f"a{start + i}", title=title, link=f"https://news.example/{start + i}", summary=summary, published=None, source="t")
+
+
+def test_bm25_ranks_relevant_articles(tmp_path):
+    index = NewsIndex(tmp_path, buffer_size=4)
+    index.add_many(_articles())
+    index.close()
+    hits = index.search("storm snow")
+    assert [hit.id for hit in hits][:2] == ["a2", "a5"]
+    assert hits[0].score > hits[1].score > 0
+    assert index.search("rates inflation")[0].id in {"a0", "a3"}
+    assert index.search("nonexistentterm") == [] and index.search("the of") == []
+
+
+def test_segments_merge_in_background_and_reopen(tmp_path):
+    index = NewsIndex(tmp_path, buffer_size=2, merge_factor=3)
+    index.add_many(_articles())
+    index.add_many(_articles(start=6))
+    index.close()
+    expected = [(hit.id, hit.score) for hit in index.search("cup striker", k=20)]
+    assert index.doc_count == 12 and index.segment_count < 6
+
+    index.merge()
+    assert index.segment_count == 1
+    assert sorted(expected) == sorted((hit.id, hit.score) for hit in index.search("cup striker", k=20))
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["manifest.json", index._segments[0].path.name]
+
+    reopened = NewsIndex(tmp_path)
+    assert reopened.doc_count == 12
+    assert reopened.search("cup striker", k=1)[0].title == "Team signs new striker"
+
+
+def _brute_force(texts, query, k):
+    docs = [tokenize(text) for text in texts]
+    avgdl = sum(map(len, docs)) / len(docs)
+    scores = [0.0] * len(docs)
+    for term in dict.fromkeys(tokenize(query)):
+        df = sum(term in doc for doc in docs)
+        idf = math.log(1 + (len(docs) - df + 0.5) / (df + 0.5))
+        for position, doc in enumerate(docs):
+            tf = doc.count(term)
+            if tf:
+                norm = 1.2 * (1 - 0.75 + 0.75 * len(doc) / avgdl)
+                scores[position] += idf * tf * 2.2 / (tf + norm)
+    return sorted((round(score, 6) for score in scores if score), reverse=True)[:k]
+
+
+def test_pruned_search_matches_exhaustive_bm25(tmp_path):
+    rng = random.Random(4)
+    vocabulary = [f"w{i}" for i in range(60)]
+    weights = [1 / (i + 1) for i in range(60)]
+    texts = [" ".join(rng.choices(vocabulary, weights, k=rng.randint(3, 30))) for _ in range(600)]
+    index = NewsIndex(tmp_path, buffer_size=150, merge_factor=100)
+    index.add_many(
+        Article(id=str(i), title="", link="", summary=text, published=None, source="t") for i, text in enumerate(texts)
+    )
+    index.close()
+    assert index.segment_count == 4
+    for query in ["w0 w1", "w1 w57", "w3 w4 w5 w6", "w59", "w0 w2 w40 w58"]:
+        for k in (1, 5, 20):
+            assert [hit.score for hit in index.search(query, k=k)] == _brute_force(texts, query, k), (query, k)
+
+
+def test_segments_that_cannot_reach_the_top_k_are_skipped(tmp_path, monkeypatch):
+    texts = ["zebra zebra", "apple", "apple pie", *(f"apple and a long story number {i} about fruit" for i in range(6))]
+    index = NewsIndex(tmp_path, buffer_size=3, merge_factor=100)
+    index.add_many(Article(id=str(i), title="", link="", summary=text, published=None, source="t") for i, text in enumerate(texts))
+    index.close()
+    decoded = []
+    decode = news_index.Segment.decode
+    monkeypatch.setattr(news_index.Segment, "decode", lambda self, *entry: decoded.append(self) or decode(self, *entry))
+    [hit] = index.search("zebra apple", k=1)
+    assert hit.id == "0" and hit.score == _brute_force(texts, "zebra apple", 1)[0]
+    # The first segment's best score exceeds any "apple" score in the others.
+    assert set(decoded) == {index._segments[0]}
+
+
+def test_forced_merge_and_background_merge_never_share_segments(tmp_path):
+    articles = list(_articles())
+    index = NewsIndex(tmp_path, buffer_size=2, merge_factor=3)
+    index.add_many(articles[:4])  # two segments, below the merge factor
+    merge, calls = index._merge, []
+
+    def merge_during_flush(segments):
+        # A third segment flushed while the forced merge runs reaches the merge
+        # factor, but the two claimed segments must not be merged again.
+        calls.append(segments)
+        if len(calls) == 1:
+            index.add_many(articles[4:])
+            index.wait_for_merges()
+        merge(segments)
+
+    index._merge = merge_during_flush
+    index.merge()
+    index._merge = merge
+    index.close()
+    assert len(calls) == 1
+    ids = [segment.doc(doc)["id"] for segment in index._segments for doc in range(segment.doc_count)]
+    assert sorted(ids) == [f"a{i}" for i in range(6)]
+
+
+def test_search_is_a_registered_agent_tool(tmp_path):
+    index = NewsIndex(tmp_path, buffer_size=100)
+    index.add_many(_articles())
+    index.commit()
+    registry = ToolRegistry()
+    [result] = registry.execute([ToolCall("news_hub.search", {"query": "storm", "k": 1, "index_path": str(tmp_path)})])
+    registry.close()
+    assert result.ok, result.error
+    assert result.value["hits"][0]["id"] in {"a2", "a5"}
@@ -0,0 +1,97 @@
+"""Concurrent orchestration with deadlines and cancellation."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from algent_backend.agent_system.foundation.agents import AgentLoop
+from algent_backend.agent_system.foundation.agents.loops.react_loop import REACT_STEPS, ReactLoop
+from algent_backend.agent_system.foundation.models import AsyncTransport
+from algent_backend.agent_system.orchestration.orchestrator import Orchestrator
+
+
+def _sleepy_hook(seconds):
+    def hook(state):
+        time.sleep(seconds)
+        state.log("worked")
+
+    return hook
+
+
+def test_run_all_fans_out_and_returns_states_in_order():
+    loops = [AgentLoop(name=f"l{i}", hooks=[_sleepy_hook(0.2)]) for i in range(10)]
+    start = time.perf_counter()
+    states = Orchestrator(loops=loops, max_concurrency=10).run_all()
+    assert time.perf_counter() - start < 1.0  # ~one loop's duration, not ten
+    assert [state.messages for state in states] == [
+        (f"Loop l{i} start", "worked", f"Loop l{i} end") for i in range(10)
+    ]
+
+
+def test_loop_timeout_aborts_an_in_flight_provider_call():
+    transport = AsyncTransport()
+    slow = AgentLoop(name="slow", hooks=[lambda state: transport.run_sync(asyncio.sleep(5))])
+    fast = AgentLoop(name="fast")
+    start = time.perf_counter()
+    slow_state, fast_state = Orchestrator(loops=[slow, fast], loop_timeout=0.2).run_all()
+    assert time.perf_counter() - start < 2.0
+    assert slow_state.messages[-1] == "Loop slow timed out after 0.2s"
+    assert fast_state.messages[-1] == "Loop fast end"
+    transport.close()
+
+
+def test_async_mode_timeout_and_cross_thread_cancel():
+    async def forever(state):
+        await asyncio.sleep(5)
+
+    states = Orchestrator(loops=[AgentLoop(name="a", hooks=[forever])], mode="async", loop_timeout=0.1).run_all()
+    assert states[0].messages[-1] == "Loop a timed out after 0.1s"
+
+    orchestrator = Orchestrator(
+        loops=[AgentLoop(name=f"c{i}", hooks=[forever]) for i in range(3)],
+        mode="async",
+        max_concurrency=2,
+    )
+    threading.Timer(0.2, orchestrator.cancel).start()
+    start = time.perf_counter()
+    states = orchestrator.run_all()
+    assert time.perf_counter() - start < 2.0
+    assert all(state.messages[-1] == f"Loop c{i} cancelled" for i, state in enumerate(states))
+
+
+def test_thread_mode_cross_thread_cancel_aborts_provider_calls():
+    transport = AsyncTransport()
+    orchestrator = Orchestrator(
+        loops=[AgentLoop(name=f"c{i}", hooks=[lambda state: transport.run_sync(asyncio.sleep(5))]) for i in range(3)],
+        max_concurrency=2,
+    )
+    threading.Timer(0.2, orchestrator.cancel).start()
+    start = time.perf_counter()
+    states = orchestrator.run_all()
+    assert time.perf_counter() - start < 2.0
+    assert all(state.messages[-1] == f"Loop c{i} cancelled" for i, state in enumerate(states))
+    transport.close()
+
+
+def test_react_steps_run_in_async_mode():
+    threaded, = Orchestrator(loops=[ReactLoop(name="r")]).run_all()
+    awaited, = Orchestrator(loops=[ReactLoop(name="r")], mode="async").run_all()
+    assert awaited.messages == threaded.messages
+    assert [message for message in awaited.messages if message.startswith("ReAct")] == [
+        f"ReAct loop step: {step}" for step in REACT_STEPS
+    ]
+
+
+def test_run_with_async_hooks_fails_clearly_inside_an_event_loop():
+    async def hook(state):
+        state.log("hooked")
+
+    loop = AgentLoop(name="nested", hooks=[hook])
+    assert loop.run().messages[1] == "hooked"
+
+    async def main():
+        loop.run()
+
+    with pytest.raises(RuntimeError, match="arun"):
+        asyncio.run(main())
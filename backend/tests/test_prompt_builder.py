@@ -0,0 +1,36 @@
+"""Compiled prompt templates."""
+import pytest
+
+from algent_backend.agent_system.foundation.prompting import PromptBuilder
+
+
+def _builder():
+    builder = PromptBuilder()
+    builder.add("system", "You are a planner. Reply in {{json}}.")
+    builder.add("tools", "Tools: search, sort")
+    builder.add("task", "Task: {task!r} (step {step:>3})")
+    return builder
+
+
+def test_render_matches_str_format():
+    builder = _builder()
+    context = {"task": "sort", "step": 2}
+    expected = "\n".join(component.text.format(**context) for component in builder.components)
+    assert builder.render(context) == expected
+
+
+def test_static_prefix_boundary():
+    builder = _builder()
+    parts = builder.render_parts({"task": "a", "step": 1})
+    assert parts.prefix == builder.static_prefix == "You are a planner. Reply in {json}.\nTools: search, sort\nTask: "
+    assert parts.text[: parts.prefix_length] == parts.prefix
+    assert builder.render_parts({"task": "b", "step": 9}).prefix is parts.prefix  # compiled once
+
+
+def test_recompiles_when_components_change_and_reports_missing_fields():
+    builder = _builder()
+    builder.render({"task": "a", "step": 1})
+    builder.components.insert(0, builder.components.pop())
+    assert builder.static_prefix == "Task: "
+    with pytest.raises(KeyError):
+        builder.render({"task": "a"})
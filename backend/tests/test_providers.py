@@ -0,0 +1,356 @@
+"""Provider transport against a local stub HTTP server."""
+import asyncio
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import socket
+import threading
+import time
+
+import pytest
+
+from algent_backend.agent_system.foundation.models import (
+    AsyncTransport,
+    MicroBatcher,
+    ModelRegistry,
+    ResponseCache,
+    RetryPolicy,
+    TransportError,
+)
+from algent_backend.agent_system.foundation.models.providers import BaseModelProvider, ModelResponse
+from algent_backend.agent_system.foundation.models.providers.anthropic_provider import AnthropicConfig, AnthropicProvider
+from algent_backend.agent_system.foundation.models.providers.openai_provider import OpenAIConfig, OpenAIProvider
+
+
+class _StubState:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.fail_first = 0
+        self.delay = 0.0
+        self.requests = []
+        self.connections = set()
+        self.active = 0
+        self.peak = 0
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):  # noqa: N802
+        state = self.server.state
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with state.lock:
+            state.requests.append((self.path, dict(self.headers), body))
+            state.connections.add(self.client_address)
+            state.active += 1
+            state.peak = max(state.peak, state.active)
+            failing = state.fail_first > 0
+            state.fail_first -= 1
+        time.sleep(state.delay)
+        with state.lock:
+            state.active -= 1
+        if failing:
+            self._reply(429, {"error": "rate limited"}, {"Retry-After": "0"})
+        elif body.get("stream"):
+            self._stream_sse(body["messages"][0]["content"].split())
+        elif self.path.endswith("/messages"):
+            self._reply(200, {"content": [{"type": "text", "text": f"echo:{body['messages'][0]['content']}"}]})
+        else:
+            self._reply(200, {"choices": [{"message": {"content": f"echo:{body['messages'][0]['content']}"}}]})
+
+    def _reply(self, status, payload, headers=None):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _stream_sse(self, words):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        events = [{"choices": [{"delta": {"content": word + " "}}]} for word in words]
+        for data in [json.dumps(event) for event in events] + ["[DONE]"]:
+            frame = f"data: {data}\n\n".encode("utf-8")
+            self.wfile.write(f"{len(frame):x}\r\n".encode() + frame + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, *_):
+        pass
+
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    server.state = _StubState()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _openai(stub, transport, max_concurrency=16, cache=None):
+    host, port = stub.server_address
+    config = OpenAIConfig(api_key="test-key", base_url=f"http://{host}:{port}/v1", model="m", max_concurrency=max_concurrency)
+    return OpenAIProvider(config=config, transport=transport, cache=cache)
+
+
+def test_fan_out_reuses_pooled_connections_and_respects_provider_limit(stub):
+    stub.state.delay = 0.01
+    transport = AsyncTransport(pool_size=8)
+    provider = _openai(stub, transport, max_concurrency=4)
+
+    async def fan_out():
+        results = await asyncio.gather(*(provider.agenerate(f"p{i}", temperature=0) for i in range(40)))
+        await transport.aclose()
+        return results
+
+    results = asyncio.run(fan_out())
+    assert [response.text for response in results] == [f"echo:p{i}" for i in range(40)]
+    assert stub.state.peak <= 4
+    assert len(stub.state.connections) <= 4
+    path, headers, body = stub.state.requests[0]
+    assert path == "/v1/chat/completions"
+    assert headers["Authorization"] == "Bearer test-key"
+    assert body["temperature"] == 0 and body["model"] == "m"
+
+
+def test_retries_rate_limits_with_backoff_then_succeeds(stub):
+    stub.state.fail_first = 2
+    transport = AsyncTransport(retry=RetryPolicy(max_attempts=3, base_delay=0.001))
+    provider = _openai(stub, transport)
+
+    # Sync path runs on the transport's background loop.
+    assert provider.generate("hello").text == "echo:hello"
+    assert len(stub.state.requests) == 3
+    transport.close()
+
+
+def test_exhausted_retries_surface_the_error_status(stub):
+    stub.state.fail_first = 5
+    transport = AsyncTransport(retry=RetryPolicy(max_attempts=2, base_delay=0.001))
+    provider = _openai(stub, transport)
+    with pytest.raises(TransportError) as excinfo:
+        provider.generate("hello")
+    assert excinfo.value.status == 429
+    transport.close()
+
+
+@pytest.fixture
+def silent_server():
+    """Reads each request, then never answers; counts requests received."""
+    listener = socket.create_server(("127.0.0.1", 0))
+    received = []
+
+    def serve():
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            received.append(conn.recv(65536))
+
+    threading.Thread(target=serve, daemon=True).start()
+    yield f"http://127.0.0.1:{listener.getsockname()[1]}", received
+    listener.close()
+
+
+def test_sent_posts_are_not_replayed_after_a_timeout(silent_server):
+    url, received = silent_server
+    transport = AsyncTransport(timeout=0.2, retry=RetryPolicy(max_attempts=3, base_delay=0.001))
+    with pytest.raises(TransportError, match="not retried"):
+        transport.run_sync(transport.request("POST", url + "/v1/chat", json_body={"q": 1}))
+    assert len(received) == 1
+    with pytest.raises(TransportError, match="3 attempts"):
+        transport.run_sync(transport.request("GET", url + "/v1/models"))
+    with pytest.raises(TransportError, match="3 attempts"):
+        transport.run_sync(
+            transport.request("POST", url + "/v1/chat", json_body={"q": 2}, headers={"Idempotency-Key": "k1"})
+        )
+    time.sleep(0.05)
+    assert len(received) == 7
+    transport.close()
+
+
+def test_posts_are_retried_when_the_connection_is_refused():
+    with socket.create_server(("127.0.0.1", 0)) as probe:
+        port = probe.getsockname()[1]  # closed again: connecting is refused
+    transport = AsyncTransport(retry=RetryPolicy(max_attempts=2, base_delay=0.001))
+    with pytest.raises(TransportError, match="2 attempts"):
+        transport.run_sync(transport.request("POST", f"http://127.0.0.1:{port}/v1/chat", json_body={}))
+    transport.close()
+
+
+def test_anthropic_request_shape_and_offline_mock(stub):
+    host, port = stub.server_address
+    transport = AsyncTransport()
+    provider = AnthropicProvider(
+        config=AnthropicConfig(api_key="k", base_url=f"http://{host}:{port}", model="c"),
+        transport=transport,
+    )
+    assert provider.generate("hi", stop="END").text == "echo:hi"
+    path, headers, body = stub.state.requests[0]
+    assert path == "/v1/messages" and headers["x-api-key"] == "k"
+    assert body["stop_sequences"] == ["END"] and body["max_tokens"] > 0
+    transport.close()
+
+    offline = AnthropicProvider(config=AnthropicConfig(api_key=None, model="c"), transport=transport)
+    assert offline.generate("hi").text == "[anthropic mock::c] hi"
+
+
+def test_anthropic_marks_cache_prefix():
+    provider = AnthropicProvider(config=AnthropicConfig(api_key="k", model="c"), transport=AsyncTransport())
+    content = provider.build_request("static|dynamic", cache_prefix=7).payload["messages"][0]["content"]
+    assert content == [
+        {"type": "text", "text": "static|", "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": "dynamic"},
+    ]
+    assert provider.build_request("plain").payload["messages"][0]["content"] == "plain"
+
+
+def test_stream_yields_chunks_and_reuses_the_connection(stub):
+    transport = AsyncTransport()
+    provider = _openai(stub, transport)
+    assert list(provider.stream("a b c")) == ["a ", "b ", "c "]
+    assert provider.generate("after").text == "echo:after"
+    assert len(stub.state.connections) == 1
+    assert stub.state.requests[0][2]["stream"] is True
+
+    async def early_exit():
+        async for chunk in provider.astream("x y z"):
+            return chunk
+
+    assert asyncio.run(early_exit()) == "x "
+    transport.close()
+
+    offline = OpenAIProvider(config=OpenAIConfig(api_key=None, model="m"), transport=transport)
+    assert "".join(offline.stream("hi there")) == "[openai mock::m] hi there"
+
+
+def test_response_cache_serves_deterministic_repeats_from_memory_and_disk(stub, tmp_path):
+    transport = AsyncTransport()
+    path = tmp_path / "responses.sqlite3"
+    provider = _openai(stub, transport, cache=ResponseCache(path=path))
+
+    assert provider.generate("same", temperature=0).text == "echo:same"
+    assert asyncio.run(provider.agenerate("same", temperature=0)).text == "echo:same"
+    assert len(stub.state.requests) == 1
+
+    # A fresh process (new cache object) still hits the on-disk store.
+    reloaded = _openai(stub, transport, cache=ResponseCache(path=path))
+    assert reloaded.generate("same", temperature=0).raw["choices"][0]["message"]["content"] == "echo:same"
+    assert len(stub.state.requests) == 1
+
+    provider.generate("same", temperature=0.7)  # non-deterministic: bypassed
+    provider.generate("same", temperature=0, use_cache=False)
+    provider.generate("same", temperature=0, max_tokens=5)  # different params, different key
+    assert len(stub.state.requests) == 4
+
+    # The async path reads disk on a worker thread, never on the event loop.
+    cold = ResponseCache(path=path)
+    reads = []
+    disk_get = cold.get
+    cold.get = lambda key: reads.append(threading.get_ident()) or disk_get(key)
+
+    async def cold_hit():
+        response = await _openai(stub, transport, cache=cold).agenerate("same", temperature=0)
+        return response, threading.get_ident()
+
+    response, loop_thread = asyncio.run(cold_hit())
+    assert response.text == "echo:same" and reads and loop_thread not in reads
+    assert len(stub.state.requests) == 4
+
+    expired = _openai(stub, transport, cache=ResponseCache(path=tmp_path / "ttl.sqlite3", ttl=0))
+    expired.generate("ttl", temperature=0)
+    expired.generate("ttl", temperature=0)
+    assert len(stub.state.requests) == 6
+    transport.close()
+
+
+class _EchoProvider(BaseModelProvider):
+    name = "echo"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.active = 0
+        self.peak = 0
+        self.batches = []
+
+    @property
+    def offline(self):
+        return False
+
+    async def agenerate(self, prompt, **kwargs):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if prompt == "boom":
+            raise ValueError(prompt)
+        return ModelResponse(text=prompt.upper())
+
+
+class _BatchEchoProvider(_EchoProvider):
+    async def agenerate_batch(self, items):
+        self.batches.append(len(items))
+        await asyncio.sleep(0.01)
+        return [ModelResponse(text=prompt.upper()) for prompt, _ in items]
+
+
+def test_micro_batcher_fans_out_with_a_cap_and_routes_results_and_errors():
+    batcher = MicroBatcher(_EchoProvider(), window=0.001, max_batch=8, max_concurrency=3)
+
+    async def burst():
+        prompts = [f"p{i}" for i in range(20)] + ["boom"]
+        return await asyncio.gather(*(batcher.agenerate(p) for p in prompts), return_exceptions=True)
+
+    results = asyncio.run(burst())
+    assert [r.text for r in results[:20]] == [f"P{i}" for i in range(20)]
+    assert isinstance(results[20], ValueError)
+    assert batcher.provider.peak <= 3
+
+
+def test_micro_batcher_uses_batch_interface_without_delaying_lone_requests():
+    batcher = MicroBatcher(_BatchEchoProvider(), window=0.5, max_batch=8)
+
+    async def lone():
+        start = time.perf_counter()
+        response = await batcher.agenerate("solo")
+        return response, time.perf_counter() - start
+
+    response, elapsed = asyncio.run(lone())
+    assert response.text == "SOLO" and elapsed < 0.25  # no window wait when idle
+
+    async def burst():
+        return await asyncio.gather(*(batcher.agenerate(f"q{i}") for i in range(17)))
+
+    assert [r.text for r in asyncio.run(burst())] == [f"Q{i}" for i in range(17)]
+    # The first request dispatches alone; the rest queue behind it in full batches.
+    assert batcher.provider.batches == [8, 8]
+
+
+def test_micro_batcher_fails_every_caller_when_a_batch_comes_back_short():
+    class _ShortBatchProvider(_BatchEchoProvider):
+        async def agenerate_batch(self, items):
+            return (await super().agenerate_batch(items))[:-1]
+
+    batcher = MicroBatcher(_ShortBatchProvider(), window=0.05, max_batch=8)
+
+    async def burst():
+        calls = [batcher.agenerate(f"q{i}") for i in range(5)]
+        return await asyncio.wait_for(asyncio.gather(*calls, return_exceptions=True), 2)
+
+    first, *batched = asyncio.run(burst())
+    assert first.text == "Q0"  # dispatched alone, not through agenerate_batch
+    assert len(batched) == 4
+    assert all(isinstance(r, RuntimeError) and "3 results for 4" in str(r) for r in batched)
+
+
+def test_registry_shares_one_batcher_per_provider():
+    registry = ModelRegistry(response_cache=ResponseCache())
+    assert registry.batcher("openai") is registry.batcher("openai")
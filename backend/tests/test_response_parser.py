@@ -0,0 +1,44 @@
+"""Incremental parsing of streamed model output."""
+from algent_backend.agent_system.integration import ResponseParser
+from algent_backend.agent_system.integration.response_parser import IncrementalParser
+
+
+def test_incremental_parser_emits_fields_and_tool_calls_as_they_complete():
+    parser = ResponseParser().incremental(keep_content=True)
+    assert parser.feed("Thought: need the ") == []
+    assert [(e.kind, e.name, e.value) for e in parser.feed("docs\nAct")] == [("field", "Thought", "need the docs")]
+    events = parser.feed('ion Input: {"q": "x"}\n{"tool": "sea')
+    assert [(e.name, e.value) for e in events] == [("Action Input", {"q": "x"})]
+    events = parser.feed('rch", "arguments": {"q": "a}b"}}\ntrailing')
+    assert [(e.kind, e.value) for e in events] == [("tool_call", {"tool": "search", "arguments": {"q": "a}b"}})]
+    final_events, parsed = parser.close()
+    assert final_events == []
+    assert parsed.metadata["fields"] == {"Thought": "need the docs", "Action Input": {"q": "x"}}
+    assert parsed.metadata["tool_calls"] == [{"tool": "search", "arguments": {"q": "a}b"}}]
+    assert parsed.content.endswith("trailing")
+
+
+def test_parse_stream_flushes_the_last_line():
+    events = list(ResponseParser().parse_stream(["Final ", "Answer: 42"]))
+    assert [(e.kind, e.name, e.value) for e in events] == [("field", "Final Answer", "42")]
+
+
+def test_unbalanced_brace_falls_back_to_text():
+    parser = ResponseParser().incremental()
+    events = parser.feed("{ not json, just musing\nFinal Answer: 42\n")
+    assert [(e.kind, e.name, e.value) for e in events] == [("field", "Final Answer", "42")]
+    # A raw newline inside a "string" cannot be JSON either.
+    events = parser.feed('{"tool": "search\nThought: retry\n{"tool": "search"}\n')
+    assert [(e.kind, e.name) for e in events] == [("field", "Thought"), ("tool_call", "search")]
+
+
+def test_object_buffer_is_bounded_and_flushed_on_close():
+    parser = IncrementalParser(max_object_chars=64)
+    events = parser.feed('{"tool": ' + "[" * 100 + "] Action: x")
+    assert events == [] and not parser._object and not parser._depth
+    parser = ResponseParser().incremental()
+    assert parser.feed('{"tool": "a", "arguments": {') == []
+    parser.feed(' oops\nFinal Answer: ')
+    events, parsed = parser.close()
+    assert [(e.name, e.value) for e in events] == [("Final Answer", "")]
+    assert parsed.metadata["tool_calls"] == []
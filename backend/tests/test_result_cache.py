@@ -0,0 +1,39 @@
+"""Bounded result cache behaviour."""
+from algent_backend.api import encoding
+from algent_backend.api.result_cache import ResultCache, etag_matches
+
+
+JSON = (encoding.JSON_CONTENT_TYPE, None)
+
+
+def test_cache_computes_once_and_evicts_least_recently_used():
+    cache = ResultCache(max_entries=2)
+    calls = []
+
+    def compute(key):
+        return lambda: calls.append(key) or {"key": key}
+
+    first = cache.get("a", (), JSON, compute("a"))
+    assert cache.get("a", (), JSON, compute("a")) is first
+    cache.get("b", (), JSON, compute("b"))
+    cache.get("c", (), JSON, compute("c"))
+    cache.get("a", (), JSON, compute("a"))
+    assert calls == ["a", "b", "c", "a"]
+    assert etag_matches(f'"other", {first.etag}', first.etag)
+    assert not etag_matches(None, first.etag)
+
+
+def test_etag_survives_eviction_and_recomputation():
+    cache = ResultCache(max_entries=1)
+    runs = iter(range(100))
+
+    def compute():
+        return {"result": [1, 2, 3], "latency_ms": next(runs)}  # timing differs per run
+
+    first = cache.get("k", ("sorted_values",), JSON, compute)
+    cache.get("other", (), JSON, compute)  # evicts "k"
+    again = cache.get("k", ("sorted_values",), JSON, compute)
+    assert again is not first and again.body != first.body
+    assert again.etag == first.etag and first.etag.startswith('W/"')
+    assert etag_matches(first.etag, again.etag) and etag_matches(first.etag[2:], again.etag)
+    assert cache.get("k", (), JSON, compute).etag != first.etag
@@ -0,0 +1,135 @@
+"""Provider instance pooling and latency-aware routing."""
+import asyncio
+from collections import defaultdict, deque
+from types import SimpleNamespace
+import time
+
+import pytest
+
+from algent_backend.agent_system.foundation.cancellation import CancelScope, DeadlineExceeded
+from algent_backend.agent_system.foundation.models import ModelRegistry, ResponseCache
+from algent_backend.agent_system.foundation.models.providers import BaseModelProvider, ModelResponse
+from algent_backend.agent_system.foundation.models.routing import _HEDGES
+from algent_backend.config import credentials
+
+DELAYS = defaultdict(deque)  # model -> queued per-call delays (default 0.01s)
+BROKEN = set()
+
+
+class _Timed(BaseModelProvider):
+    name = "timed"
+
+    def __init__(self, **kwargs):
+        self.config = SimpleNamespace(api_key="k", model="default", max_concurrency=None)
+        super().__init__(**kwargs)
+
+    async def agenerate(self, prompt, **kwargs):
+        model = kwargs["model"]
+        await asyncio.sleep(DELAYS[model].popleft() if DELAYS[model] else 0.01)
+        if model in BROKEN:
+            raise RuntimeError(f"{model} down")
+        return ModelResponse(text=model)
+
+    def generate(self, prompt, **kwargs):
+        return self.transport.run_sync(self.agenerate(prompt, **kwargs))
+
+
+def _registry():
+    registry = ModelRegistry(response_cache=ResponseCache())
+    registry.register("timed", _Timed)
+    return registry
+
+
+def test_create_reuses_provider_instances():
+    registry = _registry()
+    assert registry.create("openai") is registry.create("openai")
+    assert registry.create("openai", transport=None) is not registry.create("openai")
+
+
+def test_pooled_providers_pick_up_a_key_set_after_first_use(monkeypatch):
+    stored = {}
+    fake_keyring = SimpleNamespace(
+        get_password=lambda service, key_name: stored.get(key_name),
+        set_password=lambda service, key_name, value: stored.__setitem__(key_name, value),
+    )
+    monkeypatch.setattr(credentials, "keyring", fake_keyring)
+    monkeypatch.setattr(credentials, "_RESOLVER", credentials.CredentialResolver(ttl=60))
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    registry = _registry()
+    keyless = registry.create("openai")
+    batcher = registry.batcher("openai", max_batch=4)
+    assert keyless.config.api_key is None and batcher.provider is keyless
+
+    credentials.set_provider_api_key("openai", "sk-new")
+    keyed = registry.create("openai")
+    assert keyed is not keyless and keyed.config.api_key == "sk-new"
+    assert registry.create("openai") is keyed
+    assert registry.batcher("openai").provider is keyed
+    assert registry.batcher("openai").max_batch == 4
+
+
+def test_routes_to_fastest_healthy_backend_and_fails_over():
+    registry = _registry()
+    DELAYS["slow"].extend([0.05] * 20)
+    BROKEN.add("broken")
+    registry.add_route("planner", ["timed:slow", "timed:broken", ("timed", "fast")])
+    texts = [registry.generate("planner", "hi").text for _ in range(8)]
+    BROKEN.discard("broken")
+    DELAYS["slow"].clear()
+    # Every backend is tried once while unmeasured; the broken one fails over.
+    assert texts[:2] == ["slow", "fast"] and set(texts[2:]) == {"fast"}
+    assert registry.router.candidates("planner")[0] == ("timed", "fast")
+    assert registry.router.stats("timed:broken").error_rate == 1.0
+
+
+def test_hedges_a_request_that_passes_p95():
+    registry = _registry()
+    registry.add_route("solo", ["timed:solo"], hedge=True)
+    for _ in range(5):
+        registry.generate("solo", "warm")
+    hedged = _HEDGES.labels("solo", "hedge").value
+    DELAYS["solo"].append(1.0)  # the next primary attempt stalls; the hedge gets the default delay
+    started = time.monotonic()
+    assert registry.generate("solo", "hi").text == "solo"
+    assert time.monotonic() - started < 0.5
+    assert _HEDGES.labels("solo", "hedge").value == hedged + 1
+
+
+def test_demoted_backend_is_probed_after_cool_down_and_recovers():
+    registry = _registry()
+    router = registry.router
+    router.probe_after = 0.05
+    BROKEN.add("flaky")
+    registry.add_route("writer", ["timed:flaky", "timed:steady"])
+    for _ in range(8):
+        assert registry.generate("writer", "hi").text == "steady"
+    assert not router.healthy(("timed", "flaky"))
+    assert router.candidates("writer")[-1] == ("timed", "flaky")
+
+    BROKEN.discard("flaky")
+    time.sleep(0.06)
+    # One probe per cool-down: the demoted backend is tried first once.
+    assert router.candidates("writer")[0] == ("timed", "flaky")
+    assert router.candidates("writer")[-1] == ("timed", "flaky")
+    time.sleep(0.06)
+    assert registry.generate("writer", "hi").text == "flaky"
+    assert router.healthy(("timed", "flaky"))
+    assert router.stats("timed:flaky").error_rate == 0.0
+
+
+def test_caller_deadline_is_not_a_backend_error():
+    registry = _registry()
+    router = registry.router
+    registry.add_route("bounded", ["timed:stuck", "timed:spare"])
+    for _ in range(6):
+        DELAYS["stuck"].append(1.0)
+        with CancelScope(timeout=0.02).activate(), pytest.raises(DeadlineExceeded):
+            registry.generate("bounded", "hi")
+        DELAYS["stuck"].append(1.0)
+        with pytest.raises(asyncio.TimeoutError):  # how async-mode loops time out
+            asyncio.run(asyncio.wait_for(registry.agenerate("bounded", "hi"), 0.02))
+    DELAYS["stuck"].clear()
+    # Neither a recorded error for the stuck backend nor a fail-over to the spare.
+    assert router.stats("timed:stuck").samples == 0
+    assert router.stats("timed:spare").samples == 0
+    assert router.healthy(("timed", "stuck"))
@@ -0,0 +1,51 @@
+"""Start-up benchmark: a fresh interpreter must serve /health within budget."""
+import json
+from pathlib import Path
+import subprocess
+import sys
+
+# Import + server construction + first /health round trip, excluding interpreter
+# start-up. Generous for CI; a regression that imports the agent stack or a lab
+# eagerly shows up in the module assertions below first.
+STARTUP_BUDGET_SECONDS = 1.5
+
+_PROBE = """
+import json, sys, threading, time
+start = time.perf_counter()
+import http.client
+from algent_backend.app import create_server
+server = create_server(("127.0.0.1", 0))
+threading.Thread(target=server.serve_forever, daemon=True).start()
+conn = http.client.HTTPConnection(*server.server_address, timeout=5)
+conn.request("GET", "/health")
+status = json.loads(conn.getresponse().read())["status"]
+elapsed = time.perf_counter() - start
+conn.close()
+print(json.dumps({"status": status, "elapsed": elapsed, "modules": sorted(sys.modules)}))
+server.shutdown()
+server.server_close()
+"""
+
+_LAZY_MODULES = (
+    "algent_backend.agent_system.foundation.models.providers.openai_provider",
+    "algent_backend.agent_system.foundation.agents.agent_loop",
+    "algent_backend.labs.algo_lab.experiments",
+    "algent_backend.labs.algo_lab.algorithms.sorting",
+    "algent_backend.labs.algo_lab.jobs",
+    "algent_backend.labs.algo_lab",
+)
+
+
+def test_health_served_within_startup_budget():
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        timeout=30,
+        check=True,
+    )
+    report = json.loads(completed.stdout.strip().splitlines()[-1])
+    assert report["status"] == "ok"
+    assert report["elapsed"] < STARTUP_BUDGET_SECONDS, f"/health took {report['elapsed']:.3f}s"
+    assert not set(_LAZY_MODULES) & set(report["modules"])
@@ -0,0 +1,57 @@
+"""Token-budgeted conversation state."""
+from algent_backend.agent_system.foundation.agents.state_manager import ConversationState, estimate_tokens
+
+
+def test_small_conversations_keep_every_message():
+    state = ConversationState(["a", "b"])
+    state.log("c")
+    assert state.messages == ("a", "b", "c")
+    assert state.summary is None
+    assert state.render() == "a\nb\nc"
+
+
+def test_window_stays_within_budget_and_folds_into_summary():
+    calls = []
+
+    def summarizer(turns, previous):
+        calls.append(list(turns))
+        folded = int(previous.split()[0]) if previous else 0
+        return f"{folded + len(turns)} turns folded"
+
+    state = ConversationState(token_budget=100, summarizer=summarizer)
+    turns = [f"turn {i} " + "x" * 40 for i in range(500)]
+    for turn in turns:
+        state.log(turn)
+        assert state.token_count <= 100
+
+    assert state.total_turns == 500
+    assert state.messages[-1] == turns[-1]
+    assert state.window_tokens == sum(estimate_tokens(m) for m in state.messages)
+    # Folding happens in batches, not once per logged turn.
+    assert len(calls) < 250
+    assert sum(len(batch) for batch in calls) + len(state.messages) == 500
+    assert state.render().startswith("Summary of earlier turns:\n")
+    assert list(state.history()) == turns
+
+
+def test_default_summarizer_is_bounded_and_archive_is_compact():
+    state = ConversationState(token_budget=200)
+    turns = [f"step {i}: " + "observation " * 20 for i in range(2000)]
+    for turn in turns:
+        state.log(turn)
+        assert state.token_count <= 200
+
+    assert len(state.messages) > 1
+    assert sum(len(block) for block in state._archive) < sum(len(t) for t in turns) // 10
+    assert list(state.history()) == turns
+
+
+def test_small_budget_still_folds_in_batches():
+    folds = []
+    state = ConversationState(token_budget=300)
+    summarize = state.summarizer
+    state.summarizer = lambda turns, previous: folds.append(len(turns)) or summarize(turns, previous)
+    for i in range(1000):
+        state.log(f"log line {i} " + "detail " * 10)
+        assert state.token_count <= 300
+    assert len(folds) < 250
@@ -0,0 +1,18 @@
+"""Metrics registry behaviour and exposition format."""
+from algent_backend.telemetry import MetricsRegistry
+
+
+def test_registry_renders_prometheus_text():
+    registry = MetricsRegistry()
+    requests = registry.counter("demo_requests_total", "Requests.", ("route",))
+    requests.labels("/health").inc()
+    requests.labels(route="/health").inc()
+    latency = registry.histogram("demo_seconds", "Latency.", buckets=(0.1, 1.0))
+    latency.observe(0.05)
+    latency.observe(0.5)
+    assert registry.counter("demo_requests_total", "Requests.", ("route",)) is requests
+    text = registry.render()
+    assert 'demo_requests_total{route="/health"} 2' in text
+    assert 'demo_seconds_bucket{le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{le="+Inf"} 2' in text
+    assert "demo_seconds_count 2" in text
@@ -0,0 +1,57 @@
+"""Concurrent tool execution, timeouts and memoization."""
+import threading
+import time
+
+import pytest
+
+from algent_backend.agent_system.integration import ToolCall, ToolRegistry
+
+
+def test_calls_run_concurrently_and_keep_order():
+    registry = ToolRegistry(register_defaults=False)
+    registry.register("nap", lambda seconds, tag: (time.sleep(seconds), {"tag": tag})[1])
+    started = time.monotonic()
+    results = registry.execute([{"tool": "nap", "arguments": {"seconds": 0.2, "tag": i}} for i in range(5)])
+    assert time.monotonic() - started < 0.6
+    assert [result.value["tag"] for result in results] == list(range(5))
+    registry.close()
+
+
+def test_timeouts_and_errors_are_reported_per_call():
+    registry = ToolRegistry(register_defaults=False)
+    release = threading.Event()
+    registry.register("hang", lambda: release.wait(5), timeout=0.1)
+    registry.register("ok", lambda: {"ok": True})
+    slow, fast, missing = registry.execute([ToolCall("hang"), ToolCall("ok"), ToolCall("nope")])
+    assert isinstance(slow.error, TimeoutError)
+    assert fast.ok and fast.value == {"ok": True}
+    assert isinstance(missing.error, KeyError)
+    with pytest.raises(TimeoutError):
+        registry.call("hang")
+    release.set()
+    registry.close()
+
+
+def test_pure_tools_are_memoized_and_deduplicated():
+    registry = ToolRegistry(register_defaults=False)
+    calls = []
+    registry.register("square", lambda x: calls.append(x) or {"y": x * x}, pure=True)
+    first = registry.execute([ToolCall("square", {"x": 3}), ToolCall("square", {"x": 3}), ToolCall("square", {"x": 4})])
+    again = registry.execute([ToolCall("square", {"x": 3})])
+    assert [result.value["y"] for result in first] == [9, 9, 16]
+    assert again[0].cached and again[0].value == {"y": 9}
+    assert sorted(calls) == [3, 4]
+    registry.close()
+
+
+def test_run_sorting_is_preregistered_on_the_process_pool():
+    registry = ToolRegistry(max_processes=2)
+    assert registry.spec("algo_lab.run_sorting").executor == "process"
+    payloads = [
+        {"algorithm": algorithm, "dataset": {"size": 64, "seed": 1}}
+        for algorithm in ("bubble_sort", "insertion_sort", "merge_sort")
+    ]
+    results = registry.execute([ToolCall("algo_lab.run_sorting", payload) for payload in payloads])
+    registry.close()
+    assert all(result.ok for result in results), [result.error for result in results]
+    assert [result.value["algorithm"] for result in results] == ["bubble_sort", "insertion_sort", "merge_sort"]
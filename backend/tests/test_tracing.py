@@ -0,0 +1,57 @@
+"""Latency tracing spans and Chrome trace export."""
+import json
+
+import pytest
+
+from algent_backend.agent_system.foundation.agents.loops.react_loop import ReactLoop
+from algent_backend.agent_system.foundation.models.providers.openai_provider import OpenAIConfig, OpenAIProvider
+from algent_backend.agent_system.integration import ToolCall, ToolRegistry
+from algent_backend.labs.algo_lab.experiments import SortingExperimentConfig, run_experiment
+from algent_backend.telemetry import disable_tracing, enable_tracing, span
+from algent_backend.telemetry.tracing import _NOOP
+
+
+@pytest.fixture
+def tracer():
+    tracer = enable_tracing()
+    yield tracer
+    disable_tracing()
+
+
+def test_disabled_tracing_is_a_shared_noop():
+    disable_tracing()
+    assert span("anything", x=1) is _NOOP
+
+
+def test_agent_step_spans_nest_across_layers(tracer, tmp_path):
+    provider = OpenAIProvider(config=OpenAIConfig(api_key=None, model="m"))
+    tools = ToolRegistry(register_defaults=False)
+    tools.register("sort", lambda algorithm: run_experiment(SortingExperimentConfig(name="t", algorithm=algorithm)).summary())
+
+    def step(state):
+        state.log(provider.generate("plan").text)
+        tools.execute([ToolCall("sort", {"algorithm": "merge_sort"})])
+
+    ReactLoop(name="r", hooks=[step]).run()
+    tools.close()
+
+    spans = {span.name: span for span in tracer.spans}
+    by_id = {span.span_id: span for span in tracer.spans}
+
+    def ancestors(span):
+        names = []
+        while span.parent_id is not None:
+            span = by_id[span.parent_id]
+            names.append(span.name)
+        return names
+
+    assert ancestors(spans["provider.generate"]) == ["agent_loop.hook", "agent_loop.run", "react_loop.run"]
+    assert spans["provider.generate"].attrs["source"] == "mock"
+    assert ancestors(spans["experiment.sort"])[:3] == ["experiment.run", "tool.call", "tool.execute"]
+    assert len([span for span in tracer.spans if span.name == "react_loop.step"]) == 3
+
+    document = tracer.export_chrome(tmp_path / "trace.json")
+    assert json.loads((tmp_path / "trace.json").read_text()) == document
+    events = [event for event in document["traceEvents"] if event["ph"] == "X"]
+    assert {event["name"] for event in events} >= {"agent_loop.run", "tool.call", "experiment.metrics"}
+    assert all(event["dur"] >= 0 for event in events)
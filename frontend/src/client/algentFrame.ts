@@ -0,0 +1,78 @@
+/**
+ * Decoder for the backend's `application/x-algent-frame` responses.
+ *
+ * Numeric arrays arrive as aligned little-endian typed arrays, so they are
+ * exposed as zero-copy views instead of being parsed from JSON text. See
+ * `backend/algent_backend/api/encoding.py` for the layout.
+ */
+export const FRAME_CONTENT_TYPE = "application/x-algent-frame";
+
+const PREFIX_BYTES = 12;
+const MAGIC = "ALGF";
+
+type ArrayDescriptor = {
+  dtype: "i1" | "i2" | "i4" | "i8" | "f8";
+  length: number;
+  offset: number;
+};
+
+export type FrameArray =
+  | Int8Array
+  | Int16Array
+  | Int32Array
+  | BigInt64Array
+  | Float64Array;
+
+function view(
+  buffer: ArrayBuffer,
+  start: number,
+  descriptor: ArrayDescriptor,
+): FrameArray {
+  const offset = start + descriptor.offset;
+  switch (descriptor.dtype) {
+    case "i1":
+      return new Int8Array(buffer, offset, descriptor.length);
+    case "i2":
+      return new Int16Array(buffer, offset, descriptor.length);
+    case "i4":
+      return new Int32Array(buffer, offset, descriptor.length);
+    case "i8":
+      return new BigInt64Array(buffer, offset, descriptor.length);
+    case "f8":
+      return new Float64Array(buffer, offset, descriptor.length);
+  }
+}
+
+function inject(value: unknown, arrays: FrameArray[]): unknown {
+  if (Array.isArray(value)) {
+    return value.map((item) => inject(item, arrays));
+  }
+  if (value && typeof value === "object") {
+    const record = value as Record<string, unknown>;
+    const keys = Object.keys(record);
+    if (keys.length === 1 && keys[0] === "$array") {
+      return arrays[record.$array as number];
+    }
+    return Object.fromEntries(
+      keys.map((key) => [key, inject(record[key], arrays)]),
+    );
+  }
+  return value;
+}
+
+export function decodeFrame<T = unknown>(buffer: ArrayBuffer): T {
+  const header = new DataView(buffer, 0, PREFIX_BYTES);
+  const magic = new TextDecoder().decode(new Uint8Array(buffer, 0, 4));
+  if (magic !== MAGIC || header.getUint8(4) !== 1) {
+    throw new Error("not an algent frame");
+  }
+  const headerLength = header.getUint32(8, true);
+  const dataStart = PREFIX_BYTES + headerLength;
+  const meta = JSON.parse(
+    new TextDecoder().decode(new Uint8Array(buffer, PREFIX_BYTES, headerLength)),
+  ) as { payload: unknown; arrays: ArrayDescriptor[] };
+  const arrays = meta.arrays.map((descriptor) =>
+    view(buffer, dataStart, descriptor),
+  );
+  return inject(meta.payload, arrays) as T;
+}
@@ -10,6 +10,7 @@ export type CommandRequest = {
   name: string;
   payload?: Record<string, unknown>;
   source?: string;
+  priority?: number;
 };
 
 export type CommandResponse = Record<string, unknown>;
@@ -25,7 +26,8 @@ export async function sendCommand(
     headers: {
       "Content-Type": "application/json",
     },
-    body: JSON.stringify(command),
+    // Tag as UI so the backend's command bus runs it ahead of agent batches.
+    body: JSON.stringify({ source: "ui", ...command }),
   });
 
   if (!res.ok) {